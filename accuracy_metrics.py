@@ -151,8 +151,8 @@ def calculate_accuracy_metrics(
     if len(forecasts) != len(actuals):
         raise ValueError(f"Forecasts ({len(forecasts)}) and actuals ({len(actuals)}) must have same length")
 
-    forecasts = np.array(forecasts, dtype=float)
-    actuals = np.array(actuals, dtype=float)
+    forecasts = np.asarray(forecasts, dtype=float)
+    actuals = np.asarray(actuals, dtype=float)
 
     # Check for zero or negative actuals (problematic for percentage metrics)
     if np.any(actuals <= 0):
@@ -160,45 +160,42 @@ def calculate_accuracy_metrics(
 
     n = len(forecasts)
 
-    # Calculate errors
-    errors = forecasts - actuals
+    # Calculate the error arrays once; every metric below is derived from them
+    errors = np.subtract(forecasts, actuals)
     abs_errors = np.abs(errors)
-    pct_errors = (errors / actuals) * 100
-    abs_pct_errors = np.abs(pct_errors)
+    sq_errors = errors * errors
+    pct_errors = errors / actuals * 100
+    abs_pct_errors = abs_errors / actuals * 100  # actuals are strictly positive
 
     # Basic metrics
-    mae = float(np.mean(abs_errors))
-    rmse = float(np.sqrt(np.mean(errors ** 2)))
-    mape = float(np.mean(abs_pct_errors))
-    mpe = float(np.mean(pct_errors))
+    ss_res = float(sq_errors.sum())
+    mae = float(abs_errors.mean())
+    rmse = float(np.sqrt(ss_res / n))
+    mape = float(abs_pct_errors.mean())
+    mpe = float(pct_errors.mean())
 
     # Additional metrics
     median_ape = float(np.median(abs_pct_errors))
 
     # R-squared (coefficient of determination)
-    ss_res = np.sum((actuals - forecasts) ** 2)
-    ss_tot = np.sum((actuals - np.mean(actuals)) ** 2)
+    centered_actuals = actuals - actuals.mean()
+    ss_tot = float(np.dot(centered_actuals, centered_actuals))
     r_squared = float(1 - (ss_res / ss_tot)) if ss_tot != 0 else 0.0
 
     # Accuracy rate (percentage within acceptable error)
-    within_range = np.sum(abs_pct_errors <= acceptable_error_pct)
+    within_range = np.count_nonzero(abs_pct_errors <= acceptable_error_pct)
     accuracy_rate = float((within_range / n) * 100)
 
     # Error statistics
-    min_error = float(np.min(errors))
-    max_error = float(np.max(errors))
-    std_error = float(np.std(errors))
+    min_error = float(errors.min())
+    max_error = float(errors.max())
+    std_error = float(errors.std())
 
     # Bias analysis
-    overforecast_count = int(np.sum(errors > 0))
-    underforecast_count = int(np.sum(errors < 0))
+    overforecast_count = int(np.count_nonzero(errors > 0))
+    underforecast_count = int(np.count_nonzero(errors < 0))
 
-    if overforecast_count > underforecast_count * 1.5:
-        bias_direction = 'overforecasting'
-    elif underforecast_count > overforecast_count * 1.5:
-        bias_direction = 'underforecasting'
-    else:
-        bias_direction = 'balanced'
+    bias_direction = classify_bias(overforecast_count, underforecast_count)
 
     return AccuracyMetrics(
         mae=mae,
@@ -218,6 +215,80 @@ def calculate_accuracy_metrics(
     )
 
 
+def classify_bias(overforecast_count: int, underforecast_count: int) -> str:
+    """Classify forecast bias from over/under-forecast counts."""
+    if overforecast_count > underforecast_count * 1.5:
+        return 'overforecasting'
+    if underforecast_count > overforecast_count * 1.5:
+        return 'underforecasting'
+    return 'balanced'
+
+
+def calculate_grouped_accuracy_metrics(
+    forecasts: List[float],
+    actuals: List[float],
+    group_idx: List[int],
+    n_groups: int,
+    acceptable_error_pct: float = 20.0,
+    min_samples: int = 2
+) -> List[Optional[Dict]]:
+    """
+    Calculate per-group accuracy metrics for many groups in a single vectorized pass.
+
+    Records from all groups are stacked into flat arrays and reduced with
+    ``np.bincount`` instead of calling ``calculate_accuracy_metrics`` per group.
+
+    Args:
+        forecasts: Flat list of forecasted values
+        actuals: Flat list of actual values
+        group_idx: Group index (0..n_groups-1) of each record
+        n_groups: Number of groups
+        acceptable_error_pct: Percentage error considered acceptable (default 20%)
+        min_samples: Minimum records for a group to be scored (default 2)
+
+    Returns:
+        List indexed by group with dicts holding mape, rmse, accuracy_rate, count,
+        overforecast_count, underforecast_count and bias_direction, or None for
+        groups with too few records or non-positive actuals.
+    """
+    forecasts = np.asarray(forecasts, dtype=float)
+    actuals = np.asarray(actuals, dtype=float)
+    group_idx = np.asarray(group_idx, dtype=np.intp)
+
+    counts = np.bincount(group_idx, minlength=n_groups)
+    invalid = np.bincount(group_idx, weights=actuals <= 0, minlength=n_groups) > 0
+
+    # Guard the division; groups with non-positive actuals are discarded below
+    safe_actuals = np.where(actuals > 0, actuals, 1.0)
+    errors = forecasts - actuals
+    abs_pct_errors = np.abs(errors) / safe_actuals * 100
+
+    with np.errstate(divide='ignore', invalid='ignore'):
+        mape = np.bincount(group_idx, weights=abs_pct_errors, minlength=n_groups) / counts
+        rmse = np.sqrt(np.bincount(group_idx, weights=errors * errors, minlength=n_groups) / counts)
+        accuracy_rate = np.bincount(
+            group_idx, weights=abs_pct_errors <= acceptable_error_pct, minlength=n_groups
+        ) / counts * 100
+    over = np.bincount(group_idx, weights=errors > 0, minlength=n_groups).astype(int)
+    under = np.bincount(group_idx, weights=errors < 0, minlength=n_groups).astype(int)
+
+    results: List[Optional[Dict]] = []
+    for group in range(n_groups):
+        if counts[group] < min_samples or invalid[group]:
+            results.append(None)
+            continue
+        results.append({
+            'mape': float(mape[group]),
+            'rmse': float(rmse[group]),
+            'accuracy_rate': float(accuracy_rate[group]),
+            'count': int(counts[group]),
+            'overforecast_count': int(over[group]),
+            'underforecast_count': int(under[group]),
+            'bias_direction': classify_bias(int(over[group]), int(under[group])),
+        })
+    return results
+
+
 def calculate_time_series_metrics(
     forecasts: List[float],
     actuals: List[float],
@@ -6,18 +6,21 @@ Monte Carlo simulation for project forecasting
 import os
 import json
 import base64
+import hashlib
+from itertools import islice
 import numpy as np
 import re
-import pickle
+import traceback
 import pandas as pd
 import smtplib
 import ssl
 from email.message import EmailMessage
 from email.utils import formataddr
 from pathlib import Path
-from datetime import datetime, timedelta
-from typing import Optional, Set
-from flask import Flask, render_template, request, jsonify, redirect, url_for, flash, send_file
+from types import MappingProxyType
+from datetime import datetime, timedelta, timezone
+from typing import Any, Dict, List, NamedTuple, Optional, Set
+from flask import Flask, g, render_template, request, jsonify, redirect, url_for, flash, send_file, send_from_directory, stream_with_context
 from flask_login import (
     LoginManager,
     login_user,
@@ -26,8 +29,10 @@ from flask_login import (
     current_user
 )
 from flask_compress import Compress
-from sqlalchemy import or_
+from flask.json.provider import DefaultJSONProvider
+from sqlalchemy import exists, insert, or_, func, select
 from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import load_only, selectinload
 from urllib.parse import urlparse, urljoin
 from monte_carlo_unified import (
     run_monte_carlo_simulation,
@@ -35,13 +40,20 @@ from monte_carlo_unified import (
     analyze_deadline,
     forecast_how_many,
     forecast_when,
-    percentile as mc_percentile,
     calculate_risk_summary,
 )
-from ml_forecaster import MLForecaster
-from ml_deadline_forecaster import ml_analyze_deadline, ml_forecast_how_many, ml_forecast_when
-from cod_forecaster import CoDForecaster, generate_sample_cod_data
-from visualization import ForecastVisualizer
+from ml_deadline_forecaster import (
+    deadline_simulation_count, ml_analyze_deadline, ml_forecast_how_many, ml_forecast_when
+)
+from cod_forecaster import CoDForecaster
+from cod_training import (
+    load_default_cod_forecaster,
+    load_cod_forecaster,
+    load_cod_dataframe,
+    store_cod_dataset_frame,
+    train_user_cod_model,
+)
+from visualization import FORECAST_VISUALIZER, render_charts
 from demand_forecasting import DemandForecastService
 from cost_pert_beta import (
     simulate_pert_beta_cost,
@@ -64,6 +76,7 @@ from portfolio_markowitz import PortfolioMarkowitzAnalyzer, RISK_LEVEL_SIGMA
 from portfolio_export import export_portfolio_excel, export_portfolio_pdf
 from accuracy_metrics import (
     calculate_accuracy_metrics,
+    calculate_grouped_accuracy_metrics,
     calculate_time_series_metrics,
     detect_data_quality_issues,
     generate_recommendations
@@ -83,23 +96,120 @@ from portfolio_analyzer import (
 from trend_analysis import comprehensive_trend_analysis
 from logger import get_logger
 from error_handlers import register_error_handlers
+from cache_utils import TTLCache
+from simulation_pool import submit_simulation, collect_simulation
+from serialization import convert_to_native_types
+from ml_forecast_job import MIN_ML_SAMPLES, insufficient_samples_error, run_ml_forecast, trained_forecaster
+from config import CacheSettings, Config, PaginationDefaults, SimulationDefaults
+
+try:
+    from celery.result import AsyncResult
+    from celery_app import celery_app
+    from tasks.cod_tasks import train_cod_model_async
+    COD_TASKS_AVAILABLE = True
+except ImportError:
+    COD_TASKS_AVAILABLE = False
+
+try:
+    from tasks.ml_tasks import run_ml_forecast_async
+    ML_TASKS_AVAILABLE = True
+except ImportError:
+    ML_TASKS_AVAILABLE = False
+
+try:
+    from dependency_analyzer import Dependency, DependencyAnalyzer, create_dependencies_from_dict
+    DEPENDENCY_ANALYZER_AVAILABLE = True
+except ImportError:
+    DEPENDENCY_ANALYZER_AVAILABLE = False
+
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+    ORJSON_OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+except ImportError:
+    orjson = None
+    ORJSON_AVAILABLE = False
+    ORJSON_OPTIONS = 0
+
+
+class OrjsonJSONProvider(DefaultJSONProvider):
+    """
+    Flask JSON provider backed by orjson, so ``jsonify`` and ``request.json``
+    encode/decode in C.
+
+    Mirrors DefaultJSONProvider output where it matters: keys stay sorted and
+    dates still go through ``default`` (HTTP date strings). Calls with stdlib
+    keyword arguments, values orjson rejects (e.g. ints over 64 bits) and
+    non-strict input (``NaN`` literals) fall back to the stdlib provider.
+    """
+
+    @staticmethod
+    def default(o):
+        # Arrays orjson cannot write natively (non-contiguous, object dtype)
+        if isinstance(o, (np.ndarray, np.generic)):
+            return convert_to_native_types(o)
+        return DefaultJSONProvider.default(o)
+
+    def _orjson_option(self) -> int:
+        option = ORJSON_OPTIONS | orjson.OPT_PASSTHROUGH_DATETIME
+        if self.sort_keys:
+            option |= orjson.OPT_SORT_KEYS
+        return option
+
+    def dumps(self, obj, **kwargs) -> str:
+        if kwargs:
+            return super().dumps(obj, **kwargs)
+        try:
+            return orjson.dumps(obj, default=self.default, option=self._orjson_option()).decode('utf-8')
+        except TypeError:
+            return super().dumps(obj)
+
+    def loads(self, s, **kwargs):
+        if kwargs:
+            return super().loads(s, **kwargs)
+        try:
+            return orjson.loads(s)
+        except orjson.JSONDecodeError:
+            return super().loads(s)
+
+    def response(self, *args, **kwargs):
+        if (self.compact is None and self._app.debug) or self.compact is False:
+            return super().response(*args, **kwargs)
+        obj = self._prepare_response_obj(args, kwargs)
+        try:
+            body = orjson.dumps(
+                obj,
+                default=self.default,
+                option=self._orjson_option() | orjson.OPT_APPEND_NEWLINE
+            )
+        except TypeError:
+            return super().response(*args, **kwargs)
+        return self._app.response_class(body, mimetype=self.mimetype)
 
 # Initialize logger
 logger = get_logger('app')
 
 app = Flask(__name__)
+if ORJSON_AVAILABLE:
+    app.json = OrjsonJSONProvider(app)
 app.config['SECRET_KEY'] = os.environ.get('FLOW_FORECASTER_SECRET_KEY') or os.environ.get('SECRET_KEY') or 'change-me-in-production'
 
 BASE_DIR = Path(__file__).resolve().parent
 COD_SAMPLE_PATH = BASE_DIR / 'data' / 'cod_training_sample.csv'
+COD_DEFAULT_MODEL_PATH = Config.COD_DEFAULT_MODEL_PATH or str(BASE_DIR / 'cod_default.joblib')
 
-# Enable GZIP compression for better performance over slow networks
+# Enable response compression for better performance over slow networks
 app.config['COMPRESS_MIMETYPES'] = [
     'text/html', 'text/css', 'text/xml', 'application/json',
     'application/javascript', 'text/javascript'
 ]
 app.config['COMPRESS_LEVEL'] = 6  # Balance between speed and compression (1-9)
 app.config['COMPRESS_MIN_SIZE'] = 500  # Only compress responses > 500 bytes
+# Prefer Brotli; at flask-compress's default quality 4 it is larger than gzip-6
+# on simulate payloads, while quality 5 in text mode is ~6% smaller
+app.config['COMPRESS_ALGORITHM'] = ['br', 'gzip']
+app.config['COMPRESS_BR_LEVEL'] = 5
+app.config['COMPRESS_BR_MODE'] = 1  # brotli.MODE_TEXT (UTF-8 JSON/HTML)
 Compress(app)
 
 login_manager = LoginManager(app)
@@ -113,6 +223,14 @@ init_db()
 register_error_handlers(app)
 
 
+# Detached users shared across requests, so authenticated requests skip the
+# primary-key SELECT; entries are dropped whenever this worker changes the row
+_users_by_id = TTLCache(  # user_id -> User
+    maxsize=CacheSettings.USER_LOADER_MAXSIZE,
+    ttl=CacheSettings.USER_LOADER_TTL
+)
+
+
 @login_manager.user_loader
 def load_user(user_id):
     """Load user for Flask-Login session management."""
@@ -124,19 +242,25 @@ def load_user(user_id):
     except (TypeError, ValueError):
         return None
 
-    session = get_session()
-    try:
+    user = _users_by_id.get(user_id)
+    if user is None:
+        session = get_session()
         user = session.get(User, user_id)
-        if user:
-            session.expunge(user)
-        return user
-    finally:
-        session.close()
+        if user is None:
+            return None
+        session.expunge(user)
+        _users_by_id.set(user_id, user)
+    return user
 
 
 @app.teardown_appcontext
 def remove_session(exception=None):
-    """Ensure scoped sessions are properly removed at request end."""
+    """
+    Ensure scoped sessions are properly removed at request end.
+
+    Removing the session rolls back any transaction a failed handler left
+    open and returns its connection to the pool, once per request.
+    """
     close_session()
 
 
@@ -155,10 +279,7 @@ def add_security_headers(response):
 @app.context_processor
 def inject_auth_context():
     """Expose auth helpers to Jinja templates."""
-    return {
-        'is_admin_user': current_user_is_admin(),
-        'ADMIN_ROLES': ADMIN_ROLES
-    }
+    return _ADMIN_AUTH_CONTEXT if current_user_is_admin() else _USER_AUTH_CONTEXT
 
 # Application initialization logging
 import sys
@@ -225,43 +346,105 @@ Equipe Flow Forecaster
         logger.exception(f"Erro ao enviar e-mail de redefinição para {user.email}: {exc}")
         logger.info(f"Password reset link: {reset_link}")
         return False
-ADMIN_ROLES = {'admin', 'instructor'}
+ADMIN_ROLES = frozenset({'admin', 'instructor'})
 
-COD_REQUIRED_COLUMNS = {
-    'budget_millions',
-    'duration_weeks',
-    'team_size',
-    'num_stakeholders',
-    'business_value',
-    'complexity',
-    'cod_weekly',
-}
-COD_OPTIONAL_COLUMNS = {'project_type', 'risk_level'}
-
-
-def convert_to_native_types(obj):
-    """Convert numpy types to native Python types for JSON serialization."""
-    if isinstance(obj, np.ndarray):
-        return [convert_to_native_types(item) for item in obj.tolist()]
-    elif isinstance(obj, np.integer):
-        return int(obj)
-    elif isinstance(obj, np.floating):
-        value = float(obj)
-        if math.isnan(value) or math.isinf(value):
-            return None
-        return value
-    elif isinstance(obj, np.bool_):
-        return bool(obj)
-    elif isinstance(obj, float):
-        if math.isnan(obj) or math.isinf(obj):
-            return None
-        return obj
-    elif isinstance(obj, dict):
-        return {key: convert_to_native_types(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_to_native_types(item) for item in obj]
-    else:
-        return obj
+# Read-only template contexts, built once instead of on every render
+_ADMIN_AUTH_CONTEXT = MappingProxyType({'is_admin_user': True, 'ADMIN_ROLES': ADMIN_ROLES})
+_USER_AUTH_CONTEXT = MappingProxyType({'is_admin_user': False, 'ADMIN_ROLES': ADMIN_ROLES})
+
+
+# Probability levels (in %) reported by the 30-day "how many items" table
+PROBABILITY_TABLE_LEVELS = np.array(list(range(100, 0, -5)) + [1])
+
+
+def build_probability_table(distribution):
+    """
+    Build the probability table rows for a simulated items distribution.
+
+    A probability of X% maps to percentile (100 - X): 100% is the minimum
+    value reached in every run, 1% the value only 1% of runs exceed. All
+    levels are read with a single ``np.quantile`` call (linear interpolation,
+    same as ``monte_carlo_unified.percentile``).
+    """
+    if not distribution:
+        return []
+    values = np.quantile(
+        np.asarray(distribution, dtype=np.float64),
+        (100 - PROBABILITY_TABLE_LEVELS) / 100
+    )
+    return [
+        {'probability': prob, 'items': int(round(value))}
+        for prob, value in zip(PROBABILITY_TABLE_LEVELS.tolist(), values.tolist())
+    ]
+
+
+def utc_now() -> datetime:
+    """Naive UTC timestamp, matching the model column defaults (replaces datetime.utcnow)."""
+    return datetime.now(timezone.utc).replace(tzinfo=None)
+
+
+def internal_error_response(exc: Exception, status_code: int = 500):
+    """
+    Log an unexpected endpoint failure and build its JSON error response.
+
+    The traceback goes to the log; it is only echoed to the client in debug mode.
+    """
+    logger.exception(f"Error in {request.endpoint}: {exc}")
+    payload = {'error': str(exc)}
+    if app.debug:
+        payload['trace'] = traceback.format_exc()
+    return jsonify(payload), status_code
+
+
+def fast_json_loads(raw):
+    """Decode a JSON document using orjson when available, falling back to the stdlib."""
+    if ORJSON_AVAILABLE:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
+def fast_json_dumps(obj) -> bytes:
+    """Encode ``obj`` as JSON bytes, using orjson (with NumPy support) when available."""
+    if ORJSON_AVAILABLE:
+        return orjson.dumps(obj, default=app.json.default, option=ORJSON_OPTIONS)
+    return json.dumps(obj, default=app.json.default).encode('utf-8')
+
+
+def encoded_json_response(payload, status: int = 200):
+    """
+    Build a JSON response from ``payload`` with a single encoder pass.
+
+    With orjson the encoded bytes go straight into the response, skipping the
+    str round trip of ``jsonify``; otherwise the payload is converted to
+    native types first so NaN/Inf still become ``null``.
+    """
+    if not ORJSON_AVAILABLE:
+        payload = convert_to_native_types(payload)
+    return app.response_class(fast_json_dumps(payload), status=status, mimetype='application/json')
+
+
+def stream_json_response(payload: dict, stream_key: str, rows, status: int = 200, chunk_size: int = 1):
+    """
+    Stream a JSON object whose ``stream_key`` array is encoded ``chunk_size`` rows at a time.
+
+    ``payload`` holds the remaining (small) members of the object; ``rows`` may be
+    any iterable, so large lists never have to be encoded as a single string.
+    """
+    def generate():
+        head = fast_json_dumps(payload)[:-1]
+        yield head + (b',' if payload else b'') + fast_json_dumps(stream_key) + b':['
+        batches = iter(rows)
+        separator = b''
+        while True:
+            batch = list(islice(batches, chunk_size))
+            if not batch:
+                break
+            # Encode the batch as one array and drop its brackets
+            yield separator + fast_json_dumps(batch)[1:-1]
+            separator = b','
+        yield b']}'
+
+    return app.response_class(stream_with_context(generate()), status=status, mimetype='application/json')
 
 
 def is_safe_redirect_url(target: Optional[str]) -> bool:
@@ -277,30 +460,65 @@ def is_safe_redirect_url(target: Optional[str]) -> bool:
     )
 
 
+class Principal(NamedTuple):
+    """Identity and privileges of the logged-in user for the current request."""
+    id: Optional[int]
+    email: Optional[str]
+    is_admin: bool
+
+
+ANONYMOUS_PRINCIPAL = Principal(id=None, email=None, is_admin=False)
+
+
+def current_principal() -> Principal:
+    """
+    Resolve ``current_user`` into a plain :class:`Principal`.
+
+    Scoping helpers read several user attributes per query, and each read
+    through the ``current_user`` proxy resolves the user again. The principal
+    is memoized on ``g`` for the current request, keyed on the resolved user
+    object so a login/logout mid-request is still picked up.
+    """
+    user = current_user._get_current_object()
+    cached = g.get('_principal')
+    if cached is not None and cached[0] is user:
+        return cached[1]
+
+    if getattr(user, 'is_authenticated', False):
+        role = getattr(user, 'role', None)
+        principal = Principal(
+            id=getattr(user, 'id', None),
+            email=getattr(user, 'email', None),
+            is_admin=isinstance(role, str) and role.lower() in ADMIN_ROLES,
+        )
+    else:
+        principal = ANONYMOUS_PRINCIPAL
+    g._principal = (user, principal)
+    return principal
+
+
 def current_user_is_admin() -> bool:
     """Determine if the logged-in user has elevated privileges."""
-    if not getattr(current_user, 'is_authenticated', False):
-        return False
-
-    role = getattr(current_user, 'role', None)
-    return isinstance(role, str) and role.lower() in ADMIN_ROLES
+    return current_principal().is_admin
 
 
 def scoped_project_query(session):
     """Return a Project query scoped to the current user when needed."""
     query = session.query(Project)
-    if current_user_is_admin():
+    principal = current_principal()
+    if principal.is_admin:
         return query
-    return query.filter(Project.user_id == current_user.id)
+    return query.filter(Project.user_id == principal.id)
 
 
 def scoped_forecast_query(session):
     """Return a Forecast query scoped to the current user when needed."""
     query = session.query(Forecast).outerjoin(Project, Forecast.project_id == Project.id)
-    if current_user_is_admin():
+    principal = current_principal()
+    if principal.is_admin:
         return query
-    user_id = getattr(current_user, 'id', None)
-    user_email = getattr(current_user, 'email', None)
+    user_id = principal.id
+    user_email = principal.email
 
     filters = []
     if user_id is not None:
@@ -320,18 +538,20 @@ def scoped_forecast_query(session):
 def scoped_actual_query(session):
     """Return an Actual query scoped to the current user."""
     query = session.query(Actual)
-    if current_user_is_admin():
+    principal = current_principal()
+    if principal.is_admin:
         return query
-    return query.join(Forecast).filter(Forecast.user_id == current_user.id)
+    return query.join(Forecast).filter(Forecast.user_id == principal.id)
 
 
 def scoped_portfolio_query(session):
     """Return a Portfolio query scoped to the current user."""
     query = session.query(Portfolio)
-    if current_user_is_admin():
+    principal = current_principal()
+    if principal.is_admin:
         return query
 
-    user_id = getattr(current_user, 'id', None)
+    user_id = principal.id
     if user_id is None:
         # no authenticated context, return empty result
         return query.filter(Portfolio.id == -1)
@@ -347,13 +567,17 @@ def coerce_to_float(*values, default=0.0) -> float:
     for value in values:
         if value is None:
             continue
+        if type(value) is float:
+            # Most ORM columns already hand back floats: skip float() and try
+            if math.isfinite(value):
+                return value
+            continue
         try:
             number = float(value)
-            if math.isnan(number) or math.isinf(number):
-                continue
-            return number
         except (TypeError, ValueError):
             continue
+        if math.isfinite(number):
+            return number
     return float(default)
 
 
@@ -362,6 +586,13 @@ def parse_project_ids(raw_ids: Optional[str]) -> Set[int]:
     if not raw_ids:
         return set()
 
+    # Fast path: well-formed lists convert in one C-level map (int() already
+    # tolerates surrounding whitespace)
+    try:
+        return set(map(int, raw_ids.split(',')))
+    except ValueError:
+        pass
+
     project_ids: Set[int] = set()
     for chunk in raw_ids.split(','):
         chunk = chunk.strip()
@@ -378,24 +609,86 @@ def has_record_access(record, attr='user_id') -> bool:
     """Check whether the logged-in user can access the given record."""
     if record is None:
         return False
-    if current_user_is_admin():
+    principal = current_principal()
+    if principal.is_admin:
         return True
-    return getattr(record, attr, None) == current_user.id
+    return getattr(record, attr, None) == principal.id
+
+
+def parse_iso_dates(date_strings):
+    """Parse a list of YYYY-MM-DD strings into datetimes in one vectorized call."""
+    if not date_strings:
+        return []
+    return pd.to_datetime(date_strings, format='%Y-%m-%d').to_pydatetime().tolist()
+
+
+# Fields every /api/dependency-analysis entry must carry, in reporting order
+_DEPENDENCY_REQUIRED_FIELDS = ('id', 'name', 'source_project', 'target_project')
+_DEPENDENCY_REQUIRED_SET = frozenset(_DEPENDENCY_REQUIRED_FIELDS)
+
+# Separators accepted between pasted samples (newlines are covered by \s)
+_SAMPLE_SPLIT_RE = re.compile(r'[\s,;]+')
+
+
+def parse_number_list(text: str) -> Optional[List[float]]:
+    """
+    Parse comma-separated numbers in one NumPy conversion.
+
+    Returns ``None`` when any field is not a number (blank fields, other
+    separators, words), so callers can fall back to their token-by-token
+    parsing and error messages.
+    """
+    try:
+        return np.array(text.split(','), dtype=np.float64).tolist()
+    except ValueError:
+        return None
+
+
+# Day-first (D/M/Y, D-M-Y, D.M.Y) or year-first (Y-M-D, Y/M/D) with one
+# consistent separator; the backreference rejects mixed separators
+_FLEXIBLE_DATE_RE = re.compile(r'^(\d{1,4})([-/.])(\d{1,2})\2(\d{1,4})$')
+_FLEXIBLE_DATE_FORMATS = ['%d/%m/%y', '%d/%m/%Y', '%Y-%m-%d', '%d-%m-%y', '%d-%m-%Y', '%Y/%m/%d', '%d.%m.%Y']
+_FLEXIBLE_DATE_HELP = "Date must be provided in DD/MM/YY, DD/MM/YYYY, YYYY-MM-DD, or similar day-month-year format"
 
 
 def parse_flexible_date(date_str: str) -> datetime:
     """
     Parse a date string in common day-month-year formats.
 
+    Supported layouts are matched with one precompiled regex; two-digit years
+    follow strptime's ``%y`` pivot (69-99 -> 19xx, 00-68 -> 20xx). Anything the
+    regex does not recognise still gets the original strptime formats.
+
     Raises:
         ValueError: If the string doesn't match supported formats.
     """
     if not date_str or not isinstance(date_str, str):
-        raise ValueError("Date must be provided in DD/MM/YY, DD/MM/YYYY, YYYY-MM-DD, or similar day-month-year format")
+        raise ValueError(_FLEXIBLE_DATE_HELP)
     value = date_str.strip()
     if not value:
-        raise ValueError("Date must be provided in DD/MM/YY, DD/MM/YYYY, YYYY-MM-DD, or similar day-month-year format")
-    for fmt in ['%d/%m/%y', '%d/%m/%Y', '%Y-%m-%d', '%d-%m-%y', '%d-%m-%Y', '%Y/%m/%d', '%d.%m.%Y']:
+        raise ValueError(_FLEXIBLE_DATE_HELP)
+
+    match = _FLEXIBLE_DATE_RE.match(value)
+    if match:
+        first, separator, month, last = match.groups()
+        year = day = None
+        if len(first) == 4:
+            if separator != '.' and len(last) <= 2:
+                year, day = int(first), int(last)
+        elif len(first) <= 2:
+            if len(last) == 4:
+                year, day = int(last), int(first)
+            elif len(last) == 2 and separator != '.':
+                short_year = int(last)
+                year = short_year + (1900 if short_year >= 69 else 2000)
+                day = int(first)
+        if year is not None:
+            try:
+                return datetime(year, int(month), day)
+            except ValueError:
+                raise ValueError(f"Date {date_str} doesn't match expected day-month-year formats") from None
+
+    for fmt in _FLEXIBLE_DATE_FORMATS:
         try:
             return datetime.strptime(value, fmt)
         except ValueError:
@@ -453,23 +746,34 @@ def register():
         if not errors:
             session = get_session()
             try:
-                is_first_user = session.query(User.id).first() is None
+                is_first_user = not session.scalar(select(exists().where(User.id.is_not(None))))
                 role = 'admin' if is_first_user else 'student'
 
-                registration_date = datetime.utcnow()
+                registration_date = utc_now()
                 new_user = User(
                     email=email,
                     name=name,
                     role=role,
+                    is_active=True,
                     registration_date=registration_date,
                     access_expires_at=registration_date + timedelta(days=365),
                 )
                 new_user.set_password(password)
 
-                session.add(new_user)
+                # Write-only path: a Core INSERT skips the unit of work and the
+                # refresh SELECT; the unattached User is enough for login_user
+                new_user.id = session.execute(
+                    insert(User).values(
+                        email=new_user.email,
+                        name=new_user.name,
+                        role=new_user.role,
+                        is_active=new_user.is_active,
+                        password_hash=new_user.password_hash,
+                        registration_date=new_user.registration_date,
+                        access_expires_at=new_user.access_expires_at,
+                    )
+                ).inserted_primary_key[0]
                 session.commit()
-                session.refresh(new_user)
-                session.expunge(new_user)
 
                 login_user(new_user)
                 flash('Conta criada com sucesso! Bem-vindo ao Flow Forecaster.', 'success')
@@ -478,9 +782,6 @@ def register():
                 if session:
                     session.rollback()
                 errors.append('Este e-mail já está cadastrado. Faça login ou escolha outro e-mail.')
-            finally:
-                if session:
-                    session.close()
 
     return render_template('auth/register.html', errors=errors, form_data=form_data)
 
@@ -507,28 +808,26 @@ def login():
         form_data['email'] = email_raw
 
         session = get_session()
-        try:
-            user = session.query(User).filter(User.email == email).first()
-            if not user or not user.check_password(password):
-                errors.append('E-mail ou senha inválidos. Verifique e tente novamente.')
-            elif not user.is_active:
-                errors.append('Sua conta está desativada. Entre em contato com o instrutor.')
-            elif user.access_expires_at and datetime.utcnow() > user.access_expires_at:
-                errors.append('Seu acesso expirou. Entre em contato com o instrutor para renovação.')
-            else:
-                user.last_login = datetime.utcnow()
-                session.commit()
-                session.refresh(user)
-                session.expunge(user)
+        user = session.query(User).filter(User.email == email).first()
+        if not user or not user.check_password(password):
+            errors.append('E-mail ou senha inválidos. Verifique e tente novamente.')
+        elif not user.is_active:
+            errors.append('Sua conta está desativada. Entre em contato com o instrutor.')
+        elif user.access_expires_at and utc_now() > user.access_expires_at:
+            errors.append('Seu acesso expirou. Entre em contato com o instrutor para renovação.')
+        else:
+            user.last_login = utc_now()
+            session.commit()
+            session.refresh(user)
+            session.expunge(user)
+            _users_by_id.set(user.id, user)
 
-                login_user(user, remember=remember)
-                flash(f'Bem-vindo de volta, {user.name}!', 'success')
+            login_user(user, remember=remember)
+            flash(f'Bem-vindo de volta, {user.name}!', 'success')
 
-                if next_url and is_safe_redirect_url(next_url):
-                    return redirect(next_url)
-                return redirect(url_for('index'))
-        finally:
-            session.close()
+            if next_url and is_safe_redirect_url(next_url):
+                return redirect(next_url)
+            return redirect(url_for('index'))
 
     return render_template('auth/login.html', errors=errors, form_data=form_data, next=next_url)
 
@@ -563,9 +862,6 @@ def forgot_password():
                     logger.debug(f"Password reset solicitado para e-mail desconhecido: {email}")
             except Exception as exc:
                 logger.exception(f"Erro ao processar pedido de redefinição para {email}: {exc}")
-            finally:
-                if session:
-                    session.close()
             if not errors:
                 flash('Se o e-mail estiver cadastrado, enviamos instruções para redefinir a senha.', 'info')
                 return redirect(url_for('login'))
@@ -585,46 +881,45 @@ def reset_password(token):
         return redirect(url_for('index'))
 
     session = get_session()
-    try:
-        user = session.query(User).filter(User.password_reset_token == token).first()
-        if not user or not user.password_reset_token_expires_at or user.password_reset_token_expires_at < datetime.utcnow():
-            flash('O link de redefinição é inválido ou expirou.', 'danger')
-            return redirect(url_for('forgot_password'))
+    user = session.query(User).filter(User.password_reset_token == token).first()
+    if not user or not user.password_reset_token_expires_at or user.password_reset_token_expires_at < utc_now():
+        flash('O link de redefinição é inválido ou expirou.', 'danger')
+        return redirect(url_for('forgot_password'))
 
-        errors = []
-        form_data = {'email': user.email}
+    errors = []
+    form_data = {'email': user.email}
 
-        if request.method == 'POST':
-            password = request.form.get('password') or ''
-            confirm_password = request.form.get('confirm_password') or ''
+    if request.method == 'POST':
+        password = request.form.get('password') or ''
+        confirm_password = request.form.get('confirm_password') or ''
 
-            if len(password) < 8:
-                errors.append('A senha deve ter pelo menos 8 caracteres.')
-            if password != confirm_password:
-                errors.append('As senhas informadas não coincidem.')
+        if len(password) < 8:
+            errors.append('A senha deve ter pelo menos 8 caracteres.')
+        if password != confirm_password:
+            errors.append('As senhas informadas não coincidem.')
 
-            if not errors:
-                user.set_password(password)
-                user.clear_password_reset_token()
-                session.commit()
-                flash('Senha atualizada com sucesso. Faça login com a nova senha.', 'success')
-                return redirect(url_for('login'))
+        if not errors:
+            user.set_password(password)
+            user.clear_password_reset_token()
+            session.commit()
+            _users_by_id.pop(user.id)
+            flash('Senha atualizada com sucesso. Faça login com a nova senha.', 'success')
+            return redirect(url_for('login'))
 
-        return render_template(
-            'auth/reset_password.html',
-            errors=errors,
-            form_data=form_data,
-            token=token,
-            expiration_minutes=PASSWORD_RESET_EXPIRATION_MINUTES
-        )
-    finally:
-        session.close()
+    return render_template(
+        'auth/reset_password.html',
+        errors=errors,
+        form_data=form_data,
+        token=token,
+        expiration_minutes=PASSWORD_RESET_EXPIRATION_MINUTES
+    )
 
 
 @app.route('/logout')
 @login_required
 def logout():
     """Terminate the current user session."""
+    _users_by_id.pop(current_user.id)
     logout_user()
     flash('Você saiu da aplicação com segurança.', 'info')
     return redirect(url_for('login'))
@@ -733,14 +1028,16 @@ def simulate():
     try:
         simulation_data = request.json
 
-        # Validation
-        if not simulation_data.get('tpSamples') or not any(n >= 1 for n in simulation_data['tpSamples']):
+        # Validation (vectorized: the sample lists can be long)
+        tp_array = np.asarray(simulation_data.get('tpSamples') or [], dtype=np.float64)
+        if not (tp_array >= 1).any():
             return jsonify({
                 'error': 'Must have at least one weekly throughput sample greater than zero'
             }), 400
 
         split_rate_samples = simulation_data.get('splitRateSamples', [])
-        if split_rate_samples and any(n > 10 or n < 0.2 for n in split_rate_samples):
+        split_rate_array = np.asarray(split_rate_samples or [], dtype=np.float64)
+        if ((split_rate_array > 10) | (split_rate_array < 0.2)).any():
             return jsonify({
                 'error': 'Your split rates don\'t seem correct. For a 10% split rate, you should put \'1.1\'.'
             }), 400
@@ -754,12 +1051,7 @@ def simulate():
         simulation_data['splitRateSamples'] = split_rate_samples
         simulation_data['risks'] = simulation_data.get('risks', [])
         simulation_data['dependencies'] = simulation_data.get('dependencies', [])
-        team_focus_raw = simulation_data.get('teamFocus')
-        try:
-            team_focus_value = float(team_focus_raw) if team_focus_raw is not None else 1.0
-        except (TypeError, ValueError):
-            team_focus_value = 1.0
-        team_focus_value = max(0.0, min(1.0, team_focus_value))
+        team_focus_value = parse_team_focus(simulation_data.get('teamFocus'))
         simulation_data['teamFocus'] = team_focus_value
         if 'teamFocusPercent' not in simulation_data:
             simulation_data['teamFocusPercent'] = round(team_focus_value * 100, 2)
@@ -769,6 +1061,27 @@ def simulate():
         if simulation_data['dependencies']:
             logger.debug(f"First dependency: {simulation_data['dependencies'][0]}")
 
+        # Start the 30-day probability table (independent of the main run) in
+        # the simulation pool so both Monte Carlo passes overlap
+        forecast_30_kwargs = None
+        forecast_30_future = None
+        try:
+            if tp_array.size:
+                start_date_raw = simulation_data.get('startDate') or datetime.now().strftime('%d/%m/%Y')
+                start_dt = parse_flexible_date(start_date_raw)
+                horizon_dt = start_dt + timedelta(days=30)
+                horizon_str = horizon_dt.strftime('%d/%m/%Y')
+                forecast_30_kwargs = {
+                    'tp_samples': tp_array,
+                    'start_date': start_date_raw,
+                    'end_date': horizon_str,
+                    'n_simulations': simulation_data.get('numberOfSimulations', 10000),
+                    'focus_factor': simulation_data['teamFocus'],
+                }
+                forecast_30_future = submit_simulation(forecast_how_many, **forecast_30_kwargs)
+        except Exception:
+            forecast_30_kwargs = None
+
         # Run the simulation
         result = run_monte_carlo_simulation(simulation_data)
 
@@ -781,40 +1094,10 @@ def simulate():
         # Compute 30-day probability table for quick planning
         items_forecast_30_days = None
         try:
-            tp_samples = simulation_data.get('tpSamples', [])
-            if tp_samples:
-                start_date_raw = simulation_data.get('startDate') or datetime.now().strftime('%d/%m/%Y')
-                start_dt = parse_flexible_date(start_date_raw)
-                horizon_dt = start_dt + timedelta(days=30)
-                horizon_str = horizon_dt.strftime('%d/%m/%Y')
-                focus_factor = simulation_data['teamFocus']
-                forecast_30_days = forecast_how_many(
-                    tp_samples=tp_samples,
-                    start_date=start_date_raw,
-                    end_date=horizon_str,
-                    n_simulations=simulation_data.get('numberOfSimulations', 10000),
-                    focus_factor=focus_factor
-                )
+            if forecast_30_kwargs:
+                forecast_30_days = collect_simulation(forecast_30_future, forecast_how_many, **forecast_30_kwargs)
                 distribution_30 = forecast_30_days.get('distribution') or []
-                probability_rows_30 = []
-                if distribution_30:
-                    seen_probs = set()
-                    for prob in range(100, 0, -5):
-                        # FIX: Probability interpretation
-                        # 100% probability = percentile 0 (minimum value that occurs in 100% of cases)
-                        # 1% probability = percentile 99 (value that only 1% of cases exceed)
-                        percentile_value = mc_percentile(distribution_30, (100 - prob) / 100)
-                        probability_rows_30.append({
-                            'probability': prob,
-                            'items': int(round(percentile_value))
-                        })
-                        seen_probs.add(prob)
-                    if 1 not in seen_probs:
-                        percentile_value = mc_percentile(distribution_30, 0.99)
-                        probability_rows_30.append({
-                            'probability': 1,
-                            'items': int(round(percentile_value))
-                        })
+                probability_rows_30 = build_probability_table(distribution_30)
 
                 items_forecast_30_days = {
                     'start_date': forecast_30_days.get('start_date', start_dt.strftime('%d/%m/%Y')),
@@ -829,7 +1112,12 @@ def simulate():
 
         result['items_forecast_30_days'] = items_forecast_30_days
 
-        return jsonify(result)
+        # One row per simulation run: stream them in batches instead of
+        # encoding the whole (multi-MB for large runs) body up front
+        simulations = result.pop('simulations')
+        return stream_json_response(
+            result, 'simulations', simulations, chunk_size=SimulationDefaults.STREAM_CHUNK_ROWS
+        )
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -845,10 +1133,8 @@ def encode_data():
         JSON with encoded string
     """
     try:
-        data = request.json
-        json_str = json.dumps(data)
-        encoded = base64.b64encode(json_str.encode('utf-8')).decode('utf-8')
-        return jsonify({'encoded': encoded})
+        encoded = base64.b64encode(fast_json_dumps(request.json))
+        return jsonify({'encoded': encoded.decode('ascii')})
     except Exception as e:
         return jsonify({'error': str(e)}), 500
 
@@ -864,8 +1150,7 @@ def decode_data():
     """
     try:
         encoded = request.json.get('encoded', '')
-        decoded_bytes = base64.b64decode(encoded.encode('utf-8'))
-        data = json.loads(decoded_bytes.decode('utf-8'))
+        data = fast_json_loads(base64.b64decode(encoded))
         return jsonify(data)
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -884,77 +1169,94 @@ def ml_forecast():
         "model": str (default: "ensemble")
     }
 
+    With background forecasting enabled the job goes to the Celery queue and
+    the client gets a 202 with a status URL to poll; otherwise it runs inline.
+
     Returns:
         JSON with ML forecast results and visualizations
     """
     try:
         data = request.json
         tp_samples = data.get('tpSamples', [])
-        forecast_steps = data.get('forecastSteps', 4)
-        model_name = data.get('model', 'ensemble')
-        start_date = data.get('startDate')
 
         # Validate minimum samples for reliable ML
-        if not tp_samples or len(tp_samples) < 15:
-            return jsonify({
-                'error': 'insufficient_data',
-                'message': f'Machine Learning requires at least 15 samples for reliable results. You provided {len(tp_samples)} samples.',
-                'recommendation': 'Use Monte Carlo simulation instead, which works well with 5+ samples.',
-                'min_required': 15,
-                'provided': len(tp_samples),
-                'use_monte_carlo': True
-            }), 400
+        if not tp_samples or len(tp_samples) < MIN_ML_SAMPLES:
+            return jsonify(insufficient_samples_error(len(tp_samples))), 400
 
-        # Convert to numpy array
-        tp_data = np.array(tp_samples, dtype=float)
+        if Config.ASYNC_ML_FORECAST and ML_TASKS_AVAILABLE:
+            try:
+                task = run_ml_forecast_async.apply_async(
+                    args=(data, current_user.id), retry=False
+                )
+            except Exception as exc:
+                logger.warning(f"Could not queue ML forecast, running inline: {exc}")
+            else:
+                return jsonify({
+                    'task_id': task.id,
+                    'status': 'PENDING',
+                    'poll_url': url_for('ml_forecast_status', task_id=task.id)
+                }), 202
+
+        response_data = run_ml_forecast(
+            tp_samples,
+            forecast_steps=data.get('forecastSteps', 4),
+            model_name=data.get('model', 'ensemble'),
+            start_date=data.get('startDate')
+        )
+        # orjson writes the forecast arrays directly (NaN/Inf as null); the
+        # stdlib encoder needs them converted to lists first
+        if not ORJSON_AVAILABLE:
+            response_data = convert_to_native_types(response_data)
+        return jsonify(response_data)
 
-        # Initialize ML forecaster with K-Fold CV protocol
-        forecaster = MLForecaster(max_lag=4, n_splits=5, validation_size=0.2)
+    except Exception as e:
+        return internal_error_response(e)
 
-        # Train models using K-Fold CV with Grid Search
-        forecaster.train_models(tp_data, use_kfold_cv=True)
 
-        # Generate forecasts
-        forecasts = forecaster.forecast(tp_data, steps=forecast_steps, model_name=model_name)
+# Task states that carry no task-specific data to protect
+_UNATTRIBUTED_TASK_STATES = frozenset({'PENDING', 'STARTED'})
 
-        # Get ensemble statistics
-        ensemble_stats = forecaster.get_ensemble_forecast(forecasts)
 
-        # Get model results summary
-        model_results = forecaster.get_results_summary()
-        walk_forward_results = forecaster.walk_forward_validation(tp_data, forecast_steps=forecast_steps)
+def owned_task_info(result) -> Optional[Dict[str, Any]]:
+    """
+    Return a background task's meta or outcome when it belongs to the current user.
 
-        # Get risk assessment
-        risk_assessment = forecaster.assess_forecast_risk(tp_data)
+    The ML and CoD tasks tag both their PROGRESS meta and their return value
+    with ``user_id``. Anything else, including a FAILURE raised by the worker
+    itself (e.g. a time limit), cannot be attributed and yields ``None``.
+    """
+    info = result.info
+    if isinstance(info, dict) and info.get('user_id') == current_user.id:
+        return info
+    return None
 
-        # Generate visualization
-        visualizer = ForecastVisualizer()
-        chart_ml = visualizer.plot_ml_forecasts(tp_data, forecasts, ensemble_stats, start_date)
-        walk_forward_charts = visualizer.plot_walk_forward_forecasts(
-            tp_data,
-            walk_forward_results,
-            start_date
-        )
-        chart_history = visualizer.plot_historical_analysis(tp_data, start_date)
 
-        response_data = {
-            'forecasts': {k: v.tolist() for k, v in forecasts.items()},
-            'ensemble_stats': {k: v.tolist() if isinstance(v, np.ndarray) else v
-                             for k, v in ensemble_stats.items()},
-            'model_results': model_results,
-            'risk_assessment': convert_to_native_types(risk_assessment),
-            'walk_forward': convert_to_native_types(walk_forward_results),
-            'charts': {
-                'ml_forecast': chart_ml,
-                'historical_analysis': chart_history,
-                'walk_forward': walk_forward_charts
-            }
-        }
-        return jsonify(response_data)
+@app.route('/api/ml-forecast/<task_id>', methods=['GET'])
+@login_required
+def ml_forecast_status(task_id):
+    """Report the state of a queued ML forecast, with the result once done."""
+    if not ML_TASKS_AVAILABLE:
+        return jsonify({'error': 'Previsão em segundo plano indisponível.'}), 404
+
+    result = AsyncResult(task_id, app=celery_app)
+    state = result.state
+    payload = {'task_id': task_id, 'state': state}
+    if state in _UNATTRIBUTED_TASK_STATES:
+        return jsonify(payload)
+
+    outcome = owned_task_info(result)
+    if outcome is None:
+        return jsonify({'error': 'Tarefa não encontrada.'}), 404
+
+    if state == 'SUCCESS':
+        if outcome.get('error'):
+            payload['error'] = outcome['error']
+        else:
+            payload['result'] = outcome.get('result')
+    elif state == 'PROGRESS':
+        payload['status'] = outcome.get('status')
 
-    except Exception as e:
-        import traceback
-        return jsonify({'error': str(e), 'trace': traceback.format_exc()}), 500
+    return jsonify(payload)
 
 
 @app.route('/api/demand/forecast', methods=['POST'])
@@ -991,15 +1293,12 @@ def demand_forecast():
             weekly_horizon=max(1, forecast_weeks),
         )
 
-        visualizer = ForecastVisualizer()
+        visualizer = FORECAST_VISUALIZER
         charts = {}
 
         if 'daily_forecast' in results:
             daily = results['daily_forecast']
-            daily_dates = [
-                datetime.strptime(date_str, '%Y-%m-%d')
-                for date_str in daily.get('dates', [])
-            ]
+            daily_dates = parse_iso_dates(daily.get('dates'))
             charts['daily'] = visualizer.plot_demand_forecast(
                 service.daily_series,
                 daily_dates,
@@ -1010,10 +1309,7 @@ def demand_forecast():
 
         if 'weekly_forecast' in results:
             weekly = results['weekly_forecast']
-            weekly_dates = [
-                datetime.strptime(date_str, '%Y-%m-%d')
-                for date_str in weekly.get('dates', [])
-            ]
+            weekly_dates = parse_iso_dates(weekly.get('dates'))
             charts['weekly'] = visualizer.plot_demand_forecast(
                 service.weekly_series,
                 weekly_dates,
@@ -1028,12 +1324,14 @@ def demand_forecast():
     except ValueError as exc:
         return jsonify({'error': str(exc)}), 400
     except Exception as exc:
-        import traceback
-        return jsonify({
+        logger.exception(f"Error in {request.endpoint}: {exc}")
+        payload = {
             'error': 'Erro ao gerar a previsão de demanda',
-            'details': str(exc),
-            'trace': traceback.format_exc()
-        }), 500
+            'details': str(exc)
+        }
+        if app.debug:
+            payload['trace'] = traceback.format_exc()
+        return jsonify(payload), 500
 
 
 @app.route('/api/mc-throughput', methods=['POST'])
@@ -1069,27 +1367,29 @@ def mc_throughput():
         mc_results = simulate_throughput_forecast(tp_samples, backlog, n_simulations)
 
         # Generate visualization
-        visualizer = ForecastVisualizer()
+        visualizer = FORECAST_VISUALIZER
         chart_mc = visualizer.plot_monte_carlo_results(
-            np.array(tp_samples),
+            np.fromiter(tp_samples, dtype=np.float64, count=len(tp_samples)),
             mc_results,
             start_date
         )
 
         response_data = {
-            'percentile_stats': convert_to_native_types(mc_results['percentile_stats']),
-            'mean': convert_to_native_types(mc_results['mean']),
-            'std': convert_to_native_types(mc_results['std']),
-            'input_stats': convert_to_native_types(mc_results.get('input_stats')),
+            'percentile_stats': mc_results['percentile_stats'],
+            'mean': mc_results['mean'],
+            'std': mc_results['std'],
+            'input_stats': mc_results.get('input_stats'),
             'charts': {
                 'monte_carlo': chart_mc
             }
         }
+        # orjson writes NumPy values directly (NaN/Inf as null)
+        if not ORJSON_AVAILABLE:
+            response_data = convert_to_native_types(response_data)
         return jsonify(response_data)
 
     except Exception as e:
-        import traceback
-        return jsonify({'error': str(e), 'trace': traceback.format_exc()}), 500
+        return internal_error_response(e)
 
 
 @app.route('/api/combined-forecast', methods=['POST'])
@@ -1128,63 +1428,62 @@ def combined_forecast():
                 'use_monte_carlo': True
             }), 400
 
-        tp_data = np.array(tp_samples, dtype=float)
+        tp_data = np.fromiter(tp_samples, dtype=np.float64, count=len(tp_samples))
+
+        # Monte Carlo Forecast: independent of the ML branch, so start it in
+        # the simulation pool and let it run while the models train
+        mc_kwargs = {'tp_samples': tp_samples, 'backlog': backlog, 'n_simulations': n_simulations}
+        mc_future = submit_simulation(simulate_throughput_forecast, **mc_kwargs)
 
         # ML Forecast with K-Fold CV protocol
-        forecaster = MLForecaster(max_lag=4, n_splits=5, validation_size=0.2)
-        forecaster.train_models(tp_data, use_kfold_cv=True)
+        forecaster = trained_forecaster(tp_data)
         forecasts = forecaster.forecast(tp_data, steps=forecast_steps, model_name='ensemble')
         ensemble_stats = forecaster.get_ensemble_forecast(forecasts)
         risk_assessment = forecaster.assess_forecast_risk(tp_data)
         model_results = forecaster.get_results_summary()
         walk_forward_results = forecaster.walk_forward_validation(tp_data, forecast_steps=forecast_steps)
 
-        # Monte Carlo Forecast
-        mc_results = simulate_throughput_forecast(tp_samples, backlog, n_simulations)
+        mc_results = collect_simulation(mc_future, simulate_throughput_forecast, **mc_kwargs)
 
         # Generate visualizations
-        visualizer = ForecastVisualizer()
-        chart_ml = visualizer.plot_ml_forecasts(tp_data, forecasts, ensemble_stats, start_date)
-        chart_mc = visualizer.plot_monte_carlo_results(tp_data, mc_results, start_date)
-        chart_comparison = visualizer.plot_comparison_chart(
-            tp_data,
-            ensemble_stats['mean'],
-            mc_results['percentile_stats'],
-            start_date
-        )
-        walk_forward_charts = visualizer.plot_walk_forward_forecasts(
-            tp_data,
-            walk_forward_results,
-            start_date
+        visualizer = FORECAST_VISUALIZER
+        charts = render_charts(
+            ml_forecast=(visualizer.plot_ml_forecasts, tp_data, forecasts, ensemble_stats, start_date),
+            monte_carlo=(visualizer.plot_monte_carlo_results, tp_data, mc_results, start_date),
+            comparison=(
+                visualizer.plot_comparison_chart,
+                tp_data,
+                ensemble_stats['mean'],
+                mc_results['percentile_stats'],
+                start_date
+            ),
+            walk_forward=(visualizer.plot_walk_forward_forecasts, tp_data, walk_forward_results, start_date)
         )
 
         response_data = {
             'ml': {
-                'forecasts': {k: v.tolist() for k, v in forecasts.items()},
-                'ensemble': {k: v.tolist() if isinstance(v, np.ndarray) else v
-                           for k, v in ensemble_stats.items()},
-                'risk_assessment': convert_to_native_types(risk_assessment),
+                'forecasts': forecasts,
+                'ensemble': ensemble_stats,
+                'risk_assessment': risk_assessment,
                 'model_results': model_results,
-                'walk_forward': convert_to_native_types(walk_forward_results)
+                'walk_forward': walk_forward_results
             },
             'monte_carlo': {
-                'percentile_stats': convert_to_native_types(mc_results['percentile_stats']),
-                'mean': convert_to_native_types(mc_results['mean']),
-                'std': convert_to_native_types(mc_results['std']),
-                'input_stats': convert_to_native_types(mc_results.get('input_stats'))
+                'percentile_stats': mc_results['percentile_stats'],
+                'mean': mc_results['mean'],
+                'std': mc_results['std'],
+                'input_stats': mc_results.get('input_stats')
             },
-            'charts': {
-                'ml_forecast': chart_ml,
-                'monte_carlo': chart_mc,
-                'comparison': chart_comparison,
-                'walk_forward': walk_forward_charts
-            }
+            'charts': charts
         }
-        return jsonify(convert_to_native_types(response_data))
+        # orjson writes the NumPy arrays directly (NaN/Inf as null); the
+        # stdlib encoder needs them converted to lists first
+        if not ORJSON_AVAILABLE:
+            response_data = convert_to_native_types(response_data)
+        return jsonify(response_data)
 
     except Exception as e:
-        import traceback
-        return jsonify({'error': str(e), 'trace': traceback.format_exc()}), 500
+        return internal_error_response(e)
 
 
 @app.route('/deadline-analysis')
@@ -1193,6 +1492,172 @@ def deadline_analysis_page():
     return render_template('deadline_analysis.html')
 
 
+# Monte Carlo / ML sub-results of the deadline analysis. The UI re-posts the
+# same samples while tweaking display inputs such as the cost per week.
+_deadline_analysis_cache = TTLCache(  # inputs digest -> result dict
+    maxsize=CacheSettings.DEADLINE_ANALYSIS_MAXSIZE,
+    ttl=CacheSettings.DEADLINE_ANALYSIS_TTL
+)
+
+
+# Monte Carlo results of the how-many / when forecasts, keyed like the above
+_forecast_mc_cache = TTLCache(  # inputs digest -> result dict
+    maxsize=CacheSettings.FORECAST_MC_MAXSIZE,
+    ttl=CacheSettings.FORECAST_MC_TTL
+)
+
+
+# Encoded /api/forecast-* and /api/cost-analysis responses keyed by ETag.
+# Clients that send the ETag back in If-None-Match get a bare 304.
+_forecast_response_cache = TTLCache(  # ETag -> response body bytes
+    maxsize=CacheSettings.FORECAST_RESPONSE_MAXSIZE,
+    ttl=CacheSettings.FORECAST_RESPONSE_TTL
+)
+
+
+def forecast_response_etag() -> str:
+    """ETag of the current forecast POST: a digest of its path and raw body."""
+    digest = hashlib.blake2b(request.path.encode('utf-8'), digest_size=16)
+    digest.update(b'\0')
+    digest.update(request.get_data(cache=True))
+    return digest.hexdigest()
+
+
+def cached_forecast_response(etag: str):
+    """
+    Answer a repeated forecast POST from the response cache.
+
+    Returns a 304 when the client already holds ``etag``, the cached body
+    when only the server does, and ``None`` on a miss.
+    """
+    body = _forecast_response_cache.get(etag)
+    if body is None:
+        return None
+    # Flask-Compress tags compressed bodies as "<etag>:<encoding>"
+    if_none_match = request.if_none_match
+    if if_none_match.contains(etag) or any(tag.partition(':')[0] == etag for tag in if_none_match):
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    return response
+
+
+def remember_forecast_response(etag: str, response):
+    """Cache a successful forecast response under ``etag`` and tag it."""
+    if response.status_code == 200:
+        _forecast_response_cache.set(etag, response.get_data())
+        response.set_etag(etag)
+    return response
+
+
+def parse_team_focus(raw) -> float:
+    """Read a ``teamFocus`` payload value: a float clamped to [0, 1], 1.0 when missing or invalid."""
+    try:
+        value = float(raw) if raw is not None else 1.0
+    except (TypeError, ValueError):
+        value = 1.0
+    return max(0.0, min(1.0, value))
+
+
+def simulation_inputs_key(*parts) -> bytes:
+    """
+    Digest the inputs of a simulation or forecast into a cache key.
+
+    Sample lists are hashed as float64 bytes (so ``[3, 4]`` and ``[3.0, 4.0]``
+    match); any other value by its ``repr``. Each part is length-prefixed so
+    neighbouring parts cannot run into each other.
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    for part in parts:
+        if isinstance(part, (list, tuple, np.ndarray)):
+            blob = np.asarray(part, dtype=np.float64).tobytes()
+        else:
+            blob = repr(part).encode('utf-8')
+        digest.update(len(blob).to_bytes(8, 'little'))
+        digest.update(blob)
+    return digest.digest()
+
+
+def simulation_input_error(tp_samples, n_simulations, backlog=0) -> Optional[str]:
+    """
+    Check the size and type of simulation inputs before any work is done.
+
+    Returns:
+        An error message for a 400 response, or ``None`` when the inputs are
+        within ``SimulationDefaults`` limits.
+    """
+    if not isinstance(tp_samples, list):
+        return 'tpSamples must be a list of numbers'
+    if len(tp_samples) > SimulationDefaults.MAX_THROUGHPUT_SAMPLES:
+        return f'Too many throughput samples (max {SimulationDefaults.MAX_THROUGHPUT_SAMPLES})'
+    if not all(isinstance(sample, (int, float)) and not isinstance(sample, bool) for sample in tp_samples):
+        return 'tpSamples must be a list of numbers'
+    if not isinstance(n_simulations, int) or isinstance(n_simulations, bool) or n_simulations <= 0:
+        return 'nSimulations must be a positive integer'
+    if n_simulations > SimulationDefaults.MAX_SIMULATIONS:
+        return f'Too many simulations (max {SimulationDefaults.MAX_SIMULATIONS})'
+    if not isinstance(backlog, (int, float)) or isinstance(backlog, bool):
+        return 'Backlog must be a number'
+    if backlog < SimulationDefaults.MIN_BACKLOG:
+        return 'Backlog must not be negative'
+    if backlog > SimulationDefaults.MAX_BACKLOG:
+        return f'Backlog too large (max {SimulationDefaults.MAX_BACKLOG})'
+    return None
+
+
+def forecast_team_kwargs(data) -> Dict[str, Any]:
+    """Team and lead-time inputs shared by the ML forecast-how-many/when calls."""
+    return {
+        'team_size': data.get('teamSize', 1),
+        'min_contributors': data.get('minContributors'),
+        'max_contributors': data.get('maxContributors'),
+        's_curve_size': data.get('sCurveSize', 0),
+        'lt_samples': data.get('ltSamples', [])
+    }
+
+
+def forecast_pair_response(etag: str, mode: str, mc_fn, mc_kwargs: Dict[str, Any],
+                           ml_fn, ml_kwargs: Dict[str, Any], cache_bypass: bool = False):
+    """
+    Run the Monte Carlo and ML halves of a forecast endpoint and build its response.
+
+    ``mc_kwargs`` must carry ``tp_samples`` (a float64 array), ``n_simulations``
+    and ``focus_factor``. The Monte Carlo result is cached per ``mode`` and
+    inputs unless ``cache_bypass``; a miss runs in the simulation pool while
+    the ML forecast (8+ samples, focus-scaled throughput, at most 1000
+    simulations) runs here. ML errors are reported inside the payload.
+    """
+    mc_key = simulation_inputs_key(mode, *mc_kwargs.values())
+    mc_result = None if cache_bypass else _forecast_mc_cache.get(mc_key)
+    mc_future = submit_simulation(mc_fn, **mc_kwargs) if mc_result is None else None
+
+    ml_result = None
+    tp_array = mc_kwargs['tp_samples']
+    if len(tp_array) >= 8:
+        try:
+            ml_result = ml_fn(
+                tp_samples=np.maximum(tp_array * mc_kwargs['focus_factor'], 0.0),
+                n_simulations=min(mc_kwargs['n_simulations'], 1000),
+                **ml_kwargs
+            )
+        except Exception as e:
+            ml_result = {'error': str(e)}
+
+    if mc_result is None:
+        mc_result = collect_simulation(mc_future, mc_fn, **mc_kwargs)
+        _forecast_mc_cache.set(mc_key, mc_result)
+
+    response_data = {
+        'monte_carlo': mc_result,
+        'machine_learning': ml_result
+    }
+    # One root pass for the stdlib encoder; orjson writes NumPy values directly
+    if not ORJSON_AVAILABLE:
+        response_data = convert_to_native_types(response_data)
+    return remember_forecast_response(etag, jsonify(response_data))
+
+
 @app.route('/api/deadline-analysis', methods=['POST'])
 @login_required
 def api_deadline_analysis():
@@ -1237,15 +1702,11 @@ def api_deadline_analysis():
         lt_samples = data.get('ltSamples', [])
         split_rate_samples = data.get('splitRateSamples', [])
         n_simulations = data.get('nSimulations', 10000)
-        cost_per_person_week = data.get('costPerPersonWeek', 5000)  # Default: R$ 5,000/week
+        # Default: R$ 5,000/week when omitted; an explicit 0/null disables costs
+        cost_per_person_week = data.get('costPerPersonWeek', 5000)
         simulation_payload = data.get('simulationData')
 
-        team_focus_raw = data.get('teamFocus')
-        try:
-            team_focus_value = float(team_focus_raw) if team_focus_raw is not None else 1.0
-        except (TypeError, ValueError):
-            team_focus_value = 1.0
-        team_focus_value = max(0.0, min(1.0, team_focus_value))
+        team_focus_value = parse_team_focus(data.get('teamFocus'))
 
         simulation_data = None
 
@@ -1275,17 +1736,17 @@ def api_deadline_analysis():
                 'sCurveSize': s_curve_size,
                 'numberOfSimulations': n_simulations
             })
-            sim_focus_raw = simulation_data.get('teamFocus', team_focus_value)
-            try:
-                team_focus_value = float(sim_focus_raw)
-            except (TypeError, ValueError):
-                team_focus_value = 1.0
-            team_focus_value = max(0.0, min(1.0, team_focus_value))
+            team_focus_value = parse_team_focus(simulation_data.get('teamFocus', team_focus_value))
             simulation_data['teamFocus'] = team_focus_value
             simulation_data.setdefault('teamFocusPercent', round(team_focus_value * 100, 2))
 
         if not tp_samples:
             return jsonify({'error': 'Need throughput samples'}), 400
+        input_error = simulation_input_error(tp_samples, n_simulations, backlog)
+        if input_error:
+            return jsonify({'error': input_error}), 400
+        # Converted once and shared by the cache keys, Monte Carlo and ML
+        tp_array = np.ascontiguousarray(tp_samples, dtype=np.float64)
         if not deadline_date or not start_date:
             return jsonify({'error': 'Need start date and deadline date'}), 400
         if backlog <= 0:
@@ -1298,6 +1759,8 @@ def api_deadline_analysis():
             return jsonify({'error': str(exc)}), 400
 
         weeks_to_deadline = (deadline_dt - start_dt).days / 7.0
+        start_label = start_dt.strftime('%d/%m/%Y')
+        deadline_label = deadline_dt.strftime('%d/%m/%Y')
 
         input_stats = None
         if simulation_data:
@@ -1308,14 +1771,23 @@ def api_deadline_analysis():
             projected_weeks_p95 = float(percentile_stats.get('p95', projected_weeks_p85))
             input_stats = mc_simulation.get('input_stats')
         else:
-            mc_basic = analyze_deadline(
-                tp_samples=tp_samples,
-                backlog=backlog,
-                deadline_date=deadline_date,
-                start_date=start_date,
-                n_simulations=n_simulations,
-                focus_factor=team_focus_value
-            )
+            # Only the deadline-independent parts are read (and cached)
+            mc_key = simulation_inputs_key('mc', tp_array, backlog, n_simulations, team_focus_value)
+            mc_basic = _deadline_analysis_cache.get(mc_key)
+            if mc_basic is None:
+                mc_full = analyze_deadline(
+                    tp_samples=tp_array,
+                    backlog=backlog,
+                    deadline_date=deadline_date,
+                    start_date=start_date,
+                    n_simulations=n_simulations,
+                    focus_factor=team_focus_value
+                )
+                mc_basic = {
+                    'percentile_stats': mc_full.get('percentile_stats', {}),
+                    'input_stats': mc_full.get('input_stats'),
+                }
+                _deadline_analysis_cache.set(mc_key, mc_basic)
             percentile_stats = mc_basic.get('percentile_stats', {})
             projected_weeks_p85 = float(percentile_stats.get('p85', 0))
             projected_weeks_p50 = float(percentile_stats.get('p50', 0))
@@ -1329,53 +1801,42 @@ def api_deadline_analysis():
         # Calculate using the same complex simulation to ensure consistency
         # If it takes projected_weeks_pXX to complete backlog items, then in weeks_to_deadline we can complete:
         # (weeks_to_deadline / projected_weeks_pXX) * backlog
-        items_possible_p95 = int(round((weeks_to_deadline / projected_weeks_p95) * backlog)) if projected_weeks_p95 > 0 else 0
-        items_possible_p85 = int(round((weeks_to_deadline / projected_weeks_p85) * backlog)) if projected_weeks_p85 > 0 else 0
-        items_possible_p50 = int(round((weeks_to_deadline / projected_weeks_p50) * backlog)) if projected_weeks_p50 > 0 else 0
+        # Scalar math on purpose: for three values it is several times faster
+        # than building NumPy arrays, and round() of a float is already an int.
+        items_possible_p95 = round((weeks_to_deadline / projected_weeks_p95) * backlog) if projected_weeks_p95 > 0 else 0
+        items_possible_p85 = round((weeks_to_deadline / projected_weeks_p85) * backlog) if projected_weeks_p85 > 0 else 0
+        items_possible_p50 = round((weeks_to_deadline / projected_weeks_p50) * backlog) if projected_weeks_p50 > 0 else 0
+
+        # A P85 beyond twice the time available already settles the verdict, so
+        # infeasible deadlines skip the ML cross-check and the 30-day table
+        deadline_infeasible = weeks_to_deadline > 0 and projected_weeks_p85 > 2.0 * weeks_to_deadline
 
         # Additional 30-day forecast to power probability report
         items_forecast_30_days = None
-        try:
-            horizon_30_dt = start_dt + timedelta(days=30)
-            horizon_30_str = horizon_30_dt.strftime('%d/%m/%Y')
-            forecast_30_days = forecast_how_many(
-                tp_samples=tp_samples,
-                start_date=start_date,
-                end_date=horizon_30_str,
-                n_simulations=n_simulations,
-                focus_factor=team_focus_value
-            )
-            distribution_30 = forecast_30_days.get('distribution') or []
-            probability_rows_30 = []
-            if distribution_30:
-                seen_probs = set()
-                for prob in range(100, 0, -5):
-                    # FIX: Probability interpretation
-                    # 100% probability = percentile 0 (minimum value that occurs in 100% of cases)
-                    # 1% probability = percentile 99 (value that only 1% of cases exceed)
-                    percentile_value = mc_percentile(distribution_30, (100 - prob) / 100)
-                    probability_rows_30.append({
-                        'probability': prob,
-                        'items': int(round(percentile_value))
-                    })
-                    seen_probs.add(prob)
-                if 1 not in seen_probs:
-                    percentile_value = mc_percentile(distribution_30, 0.99)
-                    probability_rows_30.append({
-                        'probability': 1,
-                        'items': int(round(percentile_value))
-                    })
-
-            items_forecast_30_days = {
-                'start_date': forecast_30_days.get('start_date', start_dt.strftime('%d/%m/%Y')),
-                'end_date': forecast_30_days.get('end_date', horizon_30_str),
-                'days': forecast_30_days.get('days', 30),
-                'weeks': forecast_30_days.get('weeks'),
-                'items_mean': forecast_30_days.get('items_mean'),
-                'probability_table': probability_rows_30
-            }
-        except Exception:
-            items_forecast_30_days = None
+        if not deadline_infeasible:
+            try:
+                horizon_30_dt = start_dt + timedelta(days=30)
+                horizon_30_str = horizon_30_dt.strftime('%d/%m/%Y')
+                forecast_30_days = forecast_how_many(
+                    tp_samples=tp_array,
+                    start_date=start_date,
+                    end_date=horizon_30_str,
+                    n_simulations=n_simulations,
+                    focus_factor=team_focus_value
+                )
+                distribution_30 = forecast_30_days.get('distribution') or []
+                probability_rows_30 = build_probability_table(distribution_30)
+
+                items_forecast_30_days = {
+                    'start_date': forecast_30_days.get('start_date', start_label),
+                    'end_date': forecast_30_days.get('end_date', horizon_30_str),
+                    'days': forecast_30_days.get('days', 30),
+                    'weeks': forecast_30_days.get('weeks'),
+                    'items_mean': forecast_30_days.get('items_mean'),
+                    'probability_table': probability_rows_30
+                }
+            except Exception:
+                items_forecast_30_days = None
 
         # For scope completion: how many items from the backlog will be completed by the deadline?
         # This is the MINIMUM between what's possible and what's in the backlog
@@ -1385,9 +1846,10 @@ def api_deadline_analysis():
 
         # Get completion dates for each percentile ("Quando?")
         # Calculate dates directly from projected weeks to ensure consistency with deadline analysis
-        completion_date_p95 = (start_dt + timedelta(weeks=projected_weeks_p95)).strftime('%d/%m/%Y')
-        completion_date_p85 = (start_dt + timedelta(weeks=projected_weeks_p85)).strftime('%d/%m/%Y')
-        completion_date_p50 = (start_dt + timedelta(weeks=projected_weeks_p50)).strftime('%d/%m/%Y')
+        completion_date_p95, completion_date_p85, completion_date_p50 = (
+            (start_dt + timedelta(weeks=weeks)).strftime('%d/%m/%Y')
+            for weeks in (projected_weeks_p95, projected_weeks_p85, projected_weeks_p50)
+        )
 
         # Calculate percentages - DON'T limit to 100% to show real values
         # scope_completion_pct = how much of the BACKLOG will be completed by the deadline
@@ -1396,8 +1858,8 @@ def api_deadline_analysis():
         deadline_completion_pct_raw = (projected_weeks_p85 / weeks_to_deadline * 100) if weeks_to_deadline > 0 else 100
 
         mc_result = {
-            'deadline_date': deadline_dt.strftime('%d/%m/%Y'),
-            'start_date': start_dt.strftime('%d/%m/%Y'),
+            'deadline_date': deadline_label,
+            'start_date': start_label,
             'weeks_to_deadline': round(weeks_to_deadline, 1),
             'projected_weeks_p85': round(projected_weeks_p85, 1),
             'projected_weeks_p50': round(projected_weeks_p50, 1),
@@ -1405,9 +1867,9 @@ def api_deadline_analysis():
             'projected_work_p95': int(projected_work_p95),
             'projected_work_p85': int(projected_work_p85),
             'projected_work_p50': int(projected_work_p50),
-            'items_possible_p95': int(items_possible_p95),
-            'items_possible_p85': int(items_possible_p85),
-            'items_possible_p50': int(items_possible_p50),
+            'items_possible_p95': items_possible_p95,
+            'items_possible_p85': items_possible_p85,
+            'items_possible_p50': items_possible_p50,
             'completion_date_p95': completion_date_p95,
             'completion_date_p85': completion_date_p85,
             'completion_date_p50': completion_date_p50,
@@ -1464,136 +1926,155 @@ def api_deadline_analysis():
 
         # Machine Learning Analysis (if enough data)
         ml_result = None
-        if len(tp_samples) >= 8:
+        if len(tp_samples) >= 8 and not deadline_infeasible:
             try:
                 # Extract dependencies from simulation_data if available
                 dependencies = None
+                ml_key = None
+                ml_simulations = deadline_simulation_count(tp_array, n_simulations)
                 if simulation_data:
                     dependencies = simulation_data.get('dependencies')
-
-                ml_result = ml_analyze_deadline(
-                    tp_samples=tp_samples,
-                    backlog=backlog,
-                    deadline_date=deadline_date,
-                    start_date=start_date,
-                    team_size=team_size,
-                    min_contributors=min_contributors,
-                    max_contributors=max_contributors,
-                    s_curve_size=s_curve_size,
-                    lt_samples=lt_samples,
-                    split_rate_samples=split_rate_samples,
-                    n_simulations=min(n_simulations, 1000),
-                    dependencies=dependencies
-                )
+                else:
+                    # A full simulation payload has too many free inputs to key on
+                    ml_key = simulation_inputs_key(
+                        'ml', tp_array, lt_samples, split_rate_samples, backlog,
+                        deadline_date, start_date, team_size, min_contributors,
+                        max_contributors, s_curve_size, ml_simulations
+                    )
+                    ml_result = _deadline_analysis_cache.get(ml_key)
+
+                if ml_result is None:
+                    ml_result = ml_analyze_deadline(
+                        tp_samples=tp_array,
+                        backlog=backlog,
+                        deadline_date=deadline_date,
+                        start_date=start_date,
+                        team_size=team_size,
+                        min_contributors=min_contributors,
+                        max_contributors=max_contributors,
+                        s_curve_size=s_curve_size,
+                        lt_samples=lt_samples,
+                        split_rate_samples=split_rate_samples,
+                        n_simulations=ml_simulations,
+                        dependencies=dependencies
+                    )
+                    if ml_key is not None and 'error' not in ml_result:
+                        _deadline_analysis_cache.set(ml_key, ml_result)
             except Exception as e:
                 ml_result = {'error': str(e)}
 
-        mc_result_native = convert_to_native_types(mc_result)
+        # mc_result is assembled from plain values above; the ML result may hold
+        # NumPy values (NaN included) that the consensus checks below compare,
+        # and may be shared with _deadline_analysis_cache, so it gets a native copy
+        mc_result_native = mc_result
         ml_result_native = convert_to_native_types(ml_result) if ml_result else None
 
-        # Calculate effort-based costs
+        # Calculate effort-based costs; callers that do not show costs pass a
+        # zero/null costPerPersonWeek and skip the whole block
         cost_analysis = None
 
-        # Calculate costs from Monte Carlo results (always available)
-        mc_projected_weeks_p50 = mc_result_native.get('projected_weeks_p50', 0)
-        mc_projected_weeks_p85 = mc_result_native.get('projected_weeks_p85', 0)
-        mc_projected_weeks_p95 = mc_result_native.get('projected_weeks_p95', 0)
-
-        # Estimate effort for Monte Carlo using team size
-        # Effort = average contributors × weeks
-        avg_contributors_cost = avg_contributors or (team_size or 1)
-
-        mc_effort_p50 = mc_projected_weeks_p50 * avg_contributors_cost
-        mc_effort_p85 = mc_projected_weeks_p85 * avg_contributors_cost
-        mc_effort_p95 = mc_projected_weeks_p95 * avg_contributors_cost
-
-        # Calculate costs for Monte Carlo percentiles
-        mc_cost_percentiles = calculate_effort_based_cost_with_percentiles(
-            effort_percentiles={
-                'p50': mc_effort_p50,
-                'p85': mc_effort_p85,
-                'p95': mc_effort_p95
-            },
-            cost_per_person_week=cost_per_person_week,
-            currency="R$"
-        )
+        if cost_per_person_week:
+            # Calculate costs from Monte Carlo results (always available)
+            mc_projected_weeks_p50 = mc_result_native.get('projected_weeks_p50', 0)
+            mc_projected_weeks_p85 = mc_result_native.get('projected_weeks_p85', 0)
+            mc_projected_weeks_p95 = mc_result_native.get('projected_weeks_p95', 0)
+
+            # Estimate effort for Monte Carlo using team size
+            # Effort = average contributors × weeks
+            avg_contributors_cost = avg_contributors or (team_size or 1)
+
+            mc_effort_p50 = mc_projected_weeks_p50 * avg_contributors_cost
+            mc_effort_p85 = mc_projected_weeks_p85 * avg_contributors_cost
+            mc_effort_p95 = mc_projected_weeks_p95 * avg_contributors_cost
+
+            # Calculate costs for Monte Carlo percentiles
+            mc_cost_percentiles = calculate_effort_based_cost_with_percentiles(
+                effort_percentiles={
+                    'p50': mc_effort_p50,
+                    'p85': mc_effort_p85,
+                    'p95': mc_effort_p95
+                },
+                cost_per_person_week=cost_per_person_week,
+                currency="R$"
+            )
 
-        # Calculate main cost for P85
-        mc_cost_p85 = calculate_effort_based_cost(
-            effort_person_weeks=mc_effort_p85,
-            cost_per_person_week=cost_per_person_week,
-            currency="R$"
-        )
+            # Calculate main cost for P85
+            mc_cost_p85 = calculate_effort_based_cost(
+                effort_person_weeks=mc_effort_p85,
+                cost_per_person_week=cost_per_person_week,
+                currency="R$"
+            )
 
-        cost_analysis = {
-            'monte_carlo': {
-                'cost_p50': calculate_effort_based_cost(mc_effort_p50, cost_per_person_week, "R$"),
-                'cost_p85': mc_cost_p85,
-                'cost_p95': calculate_effort_based_cost(mc_effort_p95, cost_per_person_week, "R$"),
-                'cost_percentiles': mc_cost_percentiles,
-                'effort_p50': mc_effort_p50,
-                'effort_p85': mc_effort_p85,
-                'effort_p95': mc_effort_p95
-            },
-            'formula': 'Custo = Esforço (pessoa-semanas) × Custo por Pessoa-Semana',
-            'explanation': f'Monte Carlo: Com esforço de {mc_effort_p85:.1f} pessoa-semanas e custo de {mc_cost_p85["formatted_per_week"]} por semana, o custo total estimado (P85) é {mc_cost_p85["formatted_total"]}',
-            'team_info': {
-                'team_size': team_size,
-                'avg_contributors': avg_contributors_cost,
-                'cost_per_week': cost_per_person_week
+            cost_analysis = {
+                'monte_carlo': {
+                    'cost_p50': calculate_effort_based_cost(mc_effort_p50, cost_per_person_week, "R$"),
+                    'cost_p85': mc_cost_p85,
+                    'cost_p95': calculate_effort_based_cost(mc_effort_p95, cost_per_person_week, "R$"),
+                    'cost_percentiles': mc_cost_percentiles,
+                    'effort_p50': mc_effort_p50,
+                    'effort_p85': mc_effort_p85,
+                    'effort_p95': mc_effort_p95
+                },
+                'formula': 'Custo = Esforço (pessoa-semanas) × Custo por Pessoa-Semana',
+                'explanation': f'Monte Carlo: Com esforço de {mc_effort_p85:.1f} pessoa-semanas e custo de {mc_cost_p85["formatted_per_week"]} por semana, o custo total estimado (P85) é {mc_cost_p85["formatted_total"]}',
+                'team_info': {
+                    'team_size': team_size,
+                    'avg_contributors': avg_contributors_cost,
+                    'cost_per_week': cost_per_person_week
+                }
             }
-        }
 
-        # Add ML costs if available
-        if ml_result_native and isinstance(ml_result_native, dict) and 'error' not in ml_result_native:
-            # Get effort from ML result (P85 confidence level)
-            projected_effort_p85 = ml_result_native.get('projected_effort_p85')
-
-            if projected_effort_p85:
-                # Also get effort from percentile stats if available
-                percentile_stats = ml_result_native.get('percentile_stats', {})
-                projected_weeks_p50 = ml_result_native.get('projected_weeks_p50', 0)
-                projected_weeks_p85 = ml_result_native.get('projected_weeks_p85', 0)
-                projected_weeks_p95 = percentile_stats.get('p95', 0)
-
-                # Estimate effort for different percentiles using team size
-                ml_effort_p50 = projected_weeks_p50 * avg_contributors_cost
-                ml_effort_p95 = projected_weeks_p95 * avg_contributors_cost
-
-                # Calculate costs for all percentiles
-                ml_cost_percentiles = calculate_effort_based_cost_with_percentiles(
-                    effort_percentiles={
-                        'p50': ml_effort_p50,
-                        'p85': projected_effort_p85,
-                        'p95': ml_effort_p95
-                    },
-                    cost_per_person_week=cost_per_person_week,
-                    currency="R$"
-                )
+            # Add ML costs if available
+            if ml_result_native and isinstance(ml_result_native, dict) and 'error' not in ml_result_native:
+                # Get effort from ML result (P85 confidence level)
+                projected_effort_p85 = ml_result_native.get('projected_effort_p85')
+
+                if projected_effort_p85:
+                    # Also get effort from percentile stats if available
+                    percentile_stats = ml_result_native.get('percentile_stats', {})
+                    projected_weeks_p50 = ml_result_native.get('projected_weeks_p50', 0)
+                    projected_weeks_p85 = ml_result_native.get('projected_weeks_p85', 0)
+                    projected_weeks_p95 = percentile_stats.get('p95', 0)
+
+                    # Estimate effort for different percentiles using team size
+                    ml_effort_p50 = projected_weeks_p50 * avg_contributors_cost
+                    ml_effort_p95 = projected_weeks_p95 * avg_contributors_cost
+
+                    # Calculate costs for all percentiles
+                    ml_cost_percentiles = calculate_effort_based_cost_with_percentiles(
+                        effort_percentiles={
+                            'p50': ml_effort_p50,
+                            'p85': projected_effort_p85,
+                            'p95': ml_effort_p95
+                        },
+                        cost_per_person_week=cost_per_person_week,
+                        currency="R$"
+                    )
 
-                ml_cost_p85 = calculate_effort_based_cost(
-                    effort_person_weeks=projected_effort_p85,
-                    cost_per_person_week=cost_per_person_week,
-                    currency="R$"
-                )
+                    ml_cost_p85 = calculate_effort_based_cost(
+                        effort_person_weeks=projected_effort_p85,
+                        cost_per_person_week=cost_per_person_week,
+                        currency="R$"
+                    )
 
-                cost_analysis['machine_learning'] = {
-                    'cost_p50': calculate_effort_based_cost(ml_effort_p50, cost_per_person_week, "R$"),
-                    'cost_p85': ml_cost_p85,
-                    'cost_p95': calculate_effort_based_cost(ml_effort_p95, cost_per_person_week, "R$"),
-                    'cost_percentiles': ml_cost_percentiles,
-                    'effort_p50': ml_effort_p50,
-                    'effort_p85': projected_effort_p85,
-                    'effort_p95': ml_effort_p95
-                }
+                    cost_analysis['machine_learning'] = {
+                        'cost_p50': calculate_effort_based_cost(ml_effort_p50, cost_per_person_week, "R$"),
+                        'cost_p85': ml_cost_p85,
+                        'cost_p95': calculate_effort_based_cost(ml_effort_p95, cost_per_person_week, "R$"),
+                        'cost_percentiles': ml_cost_percentiles,
+                        'effort_p50': ml_effort_p50,
+                        'effort_p85': projected_effort_p85,
+                        'effort_p95': ml_effort_p95
+                    }
 
-                cost_analysis['explanation'] += f'\nMachine Learning: Com esforço de {projected_effort_p85:.1f} pessoa-semanas, o custo total estimado (P85) é {ml_cost_p85["formatted_total"]}'
+                    cost_analysis['explanation'] += f'\nMachine Learning: Com esforço de {projected_effort_p85:.1f} pessoa-semanas, o custo total estimado (P85) é {ml_cost_p85["formatted_total"]}'
 
         response_data = {
             'monte_carlo': mc_result_native,
             'machine_learning': ml_result_native,
             'cost_analysis': cost_analysis,
-            'consensus': None
+            'consensus': None,
+            'ml_skipped_reason': 'infeasible' if deadline_infeasible and len(tp_samples) >= 8 else None
         }
 
         if ml_result_native and isinstance(ml_result_native, dict) and 'error' not in ml_result_native:
@@ -1656,26 +2137,25 @@ def api_deadline_analysis():
         logger.info("=" * 60)
         logger.info("DEADLINE ANALYSIS COMPLETED SUCCESSFULLY")
         logger.info("=" * 60)
-        return jsonify(convert_to_native_types(response_data))
+        # Both method results are already native; only the cost figures may
+        # still hold NumPy scalars, which orjson writes directly
+        if not ORJSON_AVAILABLE:
+            response_data = convert_to_native_types(response_data)
+        return jsonify(response_data)
 
     except ValueError as e:
-        import traceback
-        error_msg = str(e)
-        trace_msg = traceback.format_exc()
-        logger.error("=" * 60)
-        logger.error(f"DEADLINE ANALYSIS ERROR (ValueError): {error_msg}")
-        logger.error(trace_msg)
-        logger.error("=" * 60)
-        return jsonify({'error': error_msg, 'trace': trace_msg, 'error_type': 'ValueError'}), 400
+        # Rejected input: a one-line warning, no traceback formatting
+        logger.warning(f"Deadline analysis rejected input: {e}")
+        payload = {'error': str(e), 'error_type': 'ValueError'}
+        if app.debug:
+            payload['trace'] = traceback.format_exc()
+        return jsonify(payload), 400
     except Exception as e:
-        import traceback
-        error_msg = str(e)
-        trace_msg = traceback.format_exc()
-        logger.error("=" * 60)
-        logger.error(f"DEADLINE ANALYSIS ERROR (Exception): {error_msg}")
-        logger.error(trace_msg)
-        logger.error("=" * 60)
-        return jsonify({'error': error_msg, 'trace': trace_msg, 'error_type': type(e).__name__}), 500
+        logger.exception(f"DEADLINE ANALYSIS ERROR ({type(e).__name__}): {e}")
+        payload = {'error': str(e), 'error_type': type(e).__name__}
+        if app.debug:
+            payload['trace'] = traceback.format_exc()
+        return jsonify(payload), 500
 
 
 @app.route('/api/forecast-how-many', methods=['POST'])
@@ -1694,68 +2174,48 @@ def api_forecast_how_many():
         "maxContributors": int (optional),
         "sCurveSize": int (optional),
         "ltSamples": list[float] (optional),
-        "nSimulations": int (optional)
+        "nSimulations": int (optional),
+        "cacheBypass": bool (optional, rerun the Monte Carlo simulation)
     }
     """
     try:
         data = request.json
+        etag = forecast_response_etag()
+        if not data.get('cacheBypass'):
+            cached_response = cached_forecast_response(etag)
+            if cached_response is not None:
+                return cached_response
+
         tp_samples = data.get('tpSamples', [])
         start_date = data.get('startDate')
         end_date = data.get('endDate')
-        team_size = data.get('teamSize', 1)
-        min_contributors = data.get('minContributors')
-        max_contributors = data.get('maxContributors')
-        s_curve_size = data.get('sCurveSize', 0)
-        lt_samples = data.get('ltSamples', [])
+
         n_simulations = data.get('nSimulations', 10000)
-        team_focus_raw = data.get('teamFocus')
-        try:
-            team_focus_value = float(team_focus_raw) if team_focus_raw is not None else 1.0
-        except (TypeError, ValueError):
-            team_focus_value = 1.0
-        team_focus_value = max(0.0, min(1.0, team_focus_value))
 
         if not tp_samples:
             return jsonify({'error': 'Need throughput samples'}), 400
+        input_error = simulation_input_error(tp_samples, n_simulations)
+        if input_error:
+            return jsonify({'error': input_error}), 400
         if not start_date or not end_date:
             return jsonify({'error': 'Need start date and end date'}), 400
 
-        # Monte Carlo
-        mc_result = forecast_how_many(
-            tp_samples=tp_samples,
-            start_date=start_date,
-            end_date=end_date,
-            n_simulations=n_simulations,
-            focus_factor=team_focus_value
+        return forecast_pair_response(
+            etag, 'how-many', forecast_how_many,
+            {
+                'tp_samples': np.ascontiguousarray(tp_samples, dtype=np.float64),
+                'start_date': start_date,
+                'end_date': end_date,
+                'n_simulations': n_simulations,
+                'focus_factor': parse_team_focus(data.get('teamFocus'))
+            },
+            ml_forecast_how_many,
+            {'start_date': start_date, 'end_date': end_date, **forecast_team_kwargs(data)},
+            cache_bypass=bool(data.get('cacheBypass'))
         )
 
-        # Machine Learning
-        ml_result = None
-        if len(tp_samples) >= 8:
-            try:
-                scaled_tp_samples = [max(0.0, sample * team_focus_value) for sample in tp_samples]
-                ml_result = ml_forecast_how_many(
-                    tp_samples=scaled_tp_samples,
-                    start_date=start_date,
-                    end_date=end_date,
-                    team_size=team_size,
-                    min_contributors=min_contributors,
-                    max_contributors=max_contributors,
-                    s_curve_size=s_curve_size,
-                    lt_samples=lt_samples,
-                    n_simulations=min(n_simulations, 1000)
-                )
-            except Exception as e:
-                ml_result = {'error': str(e)}
-
-        return jsonify({
-            'monte_carlo': convert_to_native_types(mc_result),
-            'machine_learning': convert_to_native_types(ml_result) if ml_result else None
-        })
-
     except Exception as e:
-        import traceback
-        return jsonify({'error': str(e), 'trace': traceback.format_exc()}), 500
+        return internal_error_response(e)
 
 
 @app.route('/api/forecast-when', methods=['POST'])
@@ -1775,64 +2235,53 @@ def api_forecast_when():
         "sCurveSize": int (optional),
         "ltSamples": list[float] (optional),
         "splitRateSamples": list[float] (optional),
-        "nSimulations": int (optional)
+        "nSimulations": int (optional),
+        "cacheBypass": bool (optional, rerun the Monte Carlo simulation)
     }
     """
     try:
         data = request.json
+        etag = forecast_response_etag()
+        if not data.get('cacheBypass'):
+            cached_response = cached_forecast_response(etag)
+            if cached_response is not None:
+                return cached_response
+
         tp_samples = data.get('tpSamples', [])
         backlog = data.get('backlog', 0)
         start_date = data.get('startDate')
-        team_size = data.get('teamSize', 1)
-        min_contributors = data.get('minContributors')
-        max_contributors = data.get('maxContributors')
-        s_curve_size = data.get('sCurveSize', 0)
-        lt_samples = data.get('ltSamples', [])
-        split_rate_samples = data.get('splitRateSamples', [])
         n_simulations = data.get('nSimulations', 10000)
-        team_focus_raw = data.get('teamFocus')
-        try:
-            team_focus_value = float(team_focus_raw) if team_focus_raw is not None else 1.0
-        except (TypeError, ValueError):
-            team_focus_value = 1.0
-        team_focus_value = max(0.0, min(1.0, team_focus_value))
 
-        # Monte Carlo
-        mc_result = forecast_when(
-            tp_samples=tp_samples,
-            backlog=backlog,
-            start_date=start_date,
-            n_simulations=n_simulations,
-            focus_factor=team_focus_value
-        )
-
-        # Machine Learning
-        ml_result = None
-        if len(tp_samples) >= 8:
-            try:
-                ml_result = ml_forecast_when(
-                    tp_samples=[max(0.0, sample * team_focus_value) for sample in tp_samples],
-                    backlog=backlog,
-                    start_date=start_date,
-                    team_size=team_size,
-                    min_contributors=min_contributors,
-                    max_contributors=max_contributors,
-                    s_curve_size=s_curve_size,
-                    lt_samples=lt_samples,
-                    split_rate_samples=split_rate_samples,
-                    n_simulations=min(n_simulations, 1000)
-                )
-            except Exception as e:
-                ml_result = {'error': str(e)}
+        # Malformed payloads are rejected before any simulation work
+        if not tp_samples:
+            return jsonify({'error': 'Need throughput samples'}), 400
+        input_error = simulation_input_error(tp_samples, n_simulations, backlog)
+        if input_error:
+            return jsonify({'error': input_error}), 400
+        if backlog <= 0:
+            return jsonify({'error': 'Backlog must be greater than zero'}), 400
 
-        return jsonify({
-            'monte_carlo': convert_to_native_types(mc_result),
-            'machine_learning': convert_to_native_types(ml_result) if ml_result else None
-        })
+        return forecast_pair_response(
+            etag, 'when', forecast_when,
+            {
+                'tp_samples': np.ascontiguousarray(tp_samples, dtype=np.float64),
+                'backlog': backlog,
+                'start_date': start_date,
+                'n_simulations': n_simulations,
+                'focus_factor': parse_team_focus(data.get('teamFocus'))
+            },
+            ml_forecast_when,
+            {
+                'backlog': backlog,
+                'start_date': start_date,
+                'split_rate_samples': data.get('splitRateSamples', []),
+                **forecast_team_kwargs(data)
+            },
+            cache_bypass=bool(data.get('cacheBypass'))
+        )
 
     except Exception as e:
-        import traceback
-        return jsonify({'error': str(e), 'trace': traceback.format_exc()}), 500
+        return internal_error_response(e)
 
 
 @app.route('/api/cost-analysis', methods=['POST'])
@@ -1852,7 +2301,8 @@ def api_cost_analysis():
         "teamSize": int (optional, tamanho da equipe),
         "minContributors": int (optional, contribuidores mínimos),
         "maxContributors": int (optional, contribuidores máximos),
-        "tpSamples": str or list (optional, amostras de throughput)
+        "tpSamples": str or list (optional, amostras de throughput),
+        "cacheBypass": bool (optional, rerun the simulation)
     }
 
     Returns:
@@ -1860,6 +2310,11 @@ def api_cost_analysis():
     """
     try:
         data = request.json
+        etag = forecast_response_etag()
+        if not data.get('cacheBypass'):
+            cached_response = cached_forecast_response(etag)
+            if cached_response is not None:
+                return cached_response
 
         optimistic = data.get('optimistic')
         most_likely = data.get('mostLikely')
@@ -1877,10 +2332,12 @@ def api_cost_analysis():
         if tp_samples_raw:
             if isinstance(tp_samples_raw, str):
                 # Parse string format "5, 6, 7, 4, 8"
-                try:
-                    throughput_samples = [float(x.strip()) for x in tp_samples_raw.split(',') if x.strip()]
-                except ValueError:
-                    return jsonify({'error': 'Invalid throughput samples format'}), 400
+                throughput_samples = parse_number_list(tp_samples_raw)
+                if throughput_samples is None:
+                    try:
+                        throughput_samples = [float(x.strip()) for x in tp_samples_raw.split(',') if x.strip()]
+                    except ValueError:
+                        return jsonify({'error': 'Invalid throughput samples format'}), 400
             elif isinstance(tp_samples_raw, list):
                 throughput_samples = [float(x) for x in tp_samples_raw]
 
@@ -1925,11 +2382,10 @@ def api_cost_analysis():
             'risk_metrics': risk_metrics
         }
 
-        return jsonify(convert_to_native_types(response_data))
+        return remember_forecast_response(etag, encoded_json_response(response_data))
 
     except Exception as e:
-        import traceback
-        return jsonify({'error': str(e), 'trace': traceback.format_exc()}), 500
+        return internal_error_response(e)
 
 
 # Print registered routes for debugging
@@ -1961,9 +2417,12 @@ def dependency_analysis():
     Returns:
         JSON with dependency analysis results
     """
-    try:
-        from dependency_analyzer import DependencyAnalyzer, create_dependencies_from_dict
+    if not DEPENDENCY_ANALYZER_AVAILABLE:
+        return jsonify({
+            'error': 'Dependency analysis module not available'
+        }), 500
 
+    try:
         data = request.json
         dependencies_data = data.get('dependencies', [])
 
@@ -1972,14 +2431,14 @@ def dependency_analysis():
                 'error': 'No dependencies provided'
             }), 400
 
-        # Validate dependency structure
+        # Validate dependency structure (one C-level subset check per entry;
+        # the field-by-field scan only runs to name the first missing field)
         for dep in dependencies_data:
-            required_fields = ['id', 'name', 'source_project', 'target_project']
-            for field in required_fields:
-                if field not in dep:
-                    return jsonify({
-                        'error': f'Dependency missing required field: {field}'
-                    }), 400
+            if not isinstance(dep, dict) or not dep.keys() >= _DEPENDENCY_REQUIRED_SET:
+                field = next(f for f in _DEPENDENCY_REQUIRED_FIELDS if f not in dep)
+                return jsonify({
+                    'error': f'Dependency missing required field: {field}'
+                }), 400
 
         # Create dependency objects
         dependencies = create_dependencies_from_dict(dependencies_data)
@@ -1991,13 +2450,12 @@ def dependency_analysis():
         num_simulations = data.get('num_simulations', 10000)
         result = analyzer.analyze(num_simulations=num_simulations)
 
-        # Convert to JSON-serializable format
-        return jsonify(convert_to_native_types(result.to_dict()))
+        result_data = result.to_dict()
+        # orjson writes the NumPy results directly (NaN/Inf as null)
+        if not ORJSON_AVAILABLE:
+            result_data = convert_to_native_types(result_data)
+        return jsonify(result_data)
 
-    except ImportError:
-        return jsonify({
-            'error': 'Dependency analysis module not available'
-        }), 500
     except Exception as e:
         return jsonify({
             'error': f'Error analyzing dependencies: {str(e)}'
@@ -2025,7 +2483,7 @@ def visualize_dependencies():
             }), 400
 
         # Create visualizer
-        visualizer = ForecastVisualizer()
+        visualizer = FORECAST_VISUALIZER
 
         # Generate visualization
         image_data_url = visualizer.plot_dependency_impact(dep_analysis)
@@ -2092,14 +2550,10 @@ def api_risk_summary():
             baseline_duration_weeks=baseline_duration_weeks
         )
 
-        return jsonify(convert_to_native_types(result))
+        return encoded_json_response(result)
 
     except Exception as e:
-        import traceback
-        return jsonify({
-            'error': str(e),
-            'trace': traceback.format_exc()
-        }), 500
+        return internal_error_response(e)
 
 
 @app.route('/api/trend-analysis', methods=['POST'])
@@ -2128,26 +2582,30 @@ def api_trend_analysis():
             if raw is None:
                 return []
             if isinstance(raw, str):
-                tokens = [chunk.strip() for chunk in re.split(r'[\s,;\\n]+', raw)]
-                values = []
-                for token in tokens:
-                    if not token:
-                        continue
-                    try:
-                        values.append(float(token.replace(',', '.')))
-                    except ValueError:
-                        raise ValueError(f'Invalid {label} samples format')
+                tokens = _SAMPLE_SPLIT_RE.split(raw.strip())
+                values = parse_number_list(','.join(token for token in tokens if token))
+                if values is None:
+                    values = []
+                    for token in tokens:
+                        if not token:
+                            continue
+                        try:
+                            values.append(float(token.replace(',', '.')))
+                        except ValueError:
+                            raise ValueError(f'Invalid {label} samples format')
             elif isinstance(raw, list):
-                values = []
-                for item in raw:
-                    try:
-                        values.append(float(item))
-                    except (TypeError, ValueError):
-                        raise ValueError(f'{label} samples must contain numeric values')
+                # np.fromiter reads None as NaN where float() rejects it
+                if None in raw:
+                    raise ValueError(f'{label} samples must contain numeric values')
+                try:
+                    values = np.fromiter(raw, dtype=np.float64, count=len(raw))
+                except (TypeError, ValueError):
+                    raise ValueError(f'{label} samples must contain numeric values')
             else:
                 raise ValueError(f'{label} samples must be provided as list or text')
 
-            return [value for value in values if np.isfinite(value)]
+            values = np.asarray(values, dtype=np.float64)
+            return values[np.isfinite(values)].tolist()
 
         try:
             throughput_samples = parse_samples(tp_samples_raw, 'Throughput')
@@ -2158,40 +2616,44 @@ def api_trend_analysis():
         metrics_results = []
         warnings = []
 
+        # Fail fast before any analysis when neither series is long enough
+        tp_ok = len(throughput_samples) >= 3
+        lt_ok = len(lead_time_samples) >= 3
         if throughput_samples:
-            if len(throughput_samples) < 3:
+            if not tp_ok:
                 warnings.append('Pelo menos 3 amostras de throughput são necessárias para analisar tendências.')
-            else:
-                throughput_result = comprehensive_trend_analysis(
-                    throughput_samples,
-                    metric_name=metric_name or 'throughput',
-                    higher_is_better=True
-                )
-                throughput_result['metric_key'] = 'throughput'
-                throughput_result['display_name'] = 'Throughput'
-                metrics_results.append(throughput_result)
         elif tp_samples_raw is not None:
             warnings.append('Pelo menos 3 amostras de throughput são necessárias para analisar tendências.')
-
         if lead_time_samples:
-            if len(lead_time_samples) < 3:
+            if not lt_ok:
                 warnings.append('Pelo menos 3 amostras de lead time são necessárias para analisar tendências.')
-            else:
-                lead_time_result = comprehensive_trend_analysis(
-                    lead_time_samples,
-                    metric_name='lead_time',
-                    higher_is_better=False
-                )
-                lead_time_result['metric_key'] = 'lead_time'
-                lead_time_result['display_name'] = 'Lead Time'
-                metrics_results.append(lead_time_result)
         elif lt_samples_raw not in (None, []):
             warnings.append('Pelo menos 3 amostras de lead time são necessárias para analisar tendências.')
 
-        if not metrics_results:
+        if not (tp_ok or lt_ok):
             message = 'Forneça pelo menos 3 amostras de throughput ou lead time para calcular tendências.'
             return jsonify({'error': message, 'warnings': warnings}), 400
 
+        if tp_ok:
+            throughput_result = comprehensive_trend_analysis(
+                throughput_samples,
+                metric_name=metric_name or 'throughput',
+                higher_is_better=True
+            )
+            throughput_result['metric_key'] = 'throughput'
+            throughput_result['display_name'] = 'Throughput'
+            metrics_results.append(throughput_result)
+
+        if lt_ok:
+            lead_time_result = comprehensive_trend_analysis(
+                lead_time_samples,
+                metric_name='lead_time',
+                higher_is_better=False
+            )
+            lead_time_result['metric_key'] = 'lead_time'
+            lead_time_result['display_name'] = 'Lead Time'
+            metrics_results.append(lead_time_result)
+
         response_payload = {
             'metrics': metrics_results
         }
@@ -2221,14 +2683,13 @@ def api_trend_analysis():
                 'higher_is_better': primary_metric.get('higher_is_better')
             })
 
-        return jsonify(convert_to_native_types(response_payload))
+        # orjson writes the NumPy results directly (NaN/Inf as null)
+        if not ORJSON_AVAILABLE:
+            response_payload = convert_to_native_types(response_payload)
+        return jsonify(response_payload)
 
     except Exception as e:
-        import traceback
-        return jsonify({
-            'error': str(e),
-            'trace': traceback.format_exc()
-        }), 500
+        return internal_error_response(e)
 
 
 # ============================================================================
@@ -2242,8 +2703,16 @@ def handle_projects():
     session = get_session()
     try:
         if request.method == 'GET':
-            projects = scoped_project_query(session).order_by(Project.created_at.desc()).all()
-            return jsonify([p.to_dict() for p in projects])
+            # Select plain columns plus a per-project forecast count in one query,
+            # skipping ORM instances and the per-project forecasts lazy load; the
+            # correlated count only touches forecasts of the listed projects
+            forecasts_count = select(func.count(Forecast.id)).where(
+                Forecast.project_id == Project.id
+            ).scalar_subquery()
+            rows = scoped_project_query(session).with_entities(
+                *Project.dict_columns(), forecasts_count
+            ).order_by(Project.created_at.desc()).all()
+            return jsonify([Project.row_to_dict(row[:-1], row[-1]) for row in rows])
 
         elif request.method == 'POST':
             data = request.json or {}
@@ -2267,13 +2736,11 @@ def handle_projects():
             session.add(project)
             session.commit()
             session.refresh(project)
-            return jsonify(project.to_dict()), 201
+            return jsonify(project.to_dict(forecasts_count=0)), 201
 
     except Exception as e:
         session.rollback()
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/projects/<int:project_id>', methods=['GET', 'PUT', 'DELETE'])
@@ -2319,7 +2786,7 @@ def handle_project(project_id):
                 project.stakeholder = data['stakeholder']
             if 'tags' in data:
                 project.tags = json.dumps(data['tags']) if isinstance(data['tags'], list) else data['tags']
-            project.updated_at = datetime.utcnow()
+            project.updated_at = utc_now()
             session.commit()
             return jsonify(project.to_dict())
 
@@ -2331,8 +2798,6 @@ def handle_project(project_id):
     except Exception as e:
         session.rollback()
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 # ============================================================================
@@ -2380,8 +2845,6 @@ def handle_portfolios():
     except Exception as e:
         session.rollback()
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>', methods=['GET', 'PUT', 'DELETE'])
@@ -2429,7 +2892,7 @@ def handle_portfolio(portfolio_id):
             if 'tags' in data:
                 portfolio.tags = json.dumps(data['tags'])
 
-            portfolio.updated_at = datetime.utcnow()
+            portfolio.updated_at = utc_now()
             session.commit()
             return jsonify(portfolio.to_dict())
 
@@ -2441,8 +2904,6 @@ def handle_portfolio(portfolio_id):
     except Exception as e:
         session.rollback()
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/projects', methods=['GET', 'POST'])
@@ -2527,8 +2988,6 @@ def handle_portfolio_projects(portfolio_id):
     except Exception as e:
         session.rollback()
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/projects/<int:project_id>', methods=['PUT', 'DELETE'])
@@ -2591,15 +3050,13 @@ def handle_portfolio_project(portfolio_id, project_id):
         elif request.method == 'DELETE':
             # Soft delete - mark as inactive
             portfolio_project.is_active = False
-            portfolio_project.removed_at = datetime.utcnow()
+            portfolio_project.removed_at = utc_now()
             session.commit()
             return '', 204
 
     except Exception as e:
         session.rollback()
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/projects/<int:project_id>/dependencies', methods=['POST'])
@@ -2758,12 +3215,7 @@ def add_project_dependency(portfolio_id, project_id):
 
     except Exception as e:
         session.rollback()
-        import traceback
-        print(f"Error adding dependency: {e}")
-        print(traceback.format_exc())
-        return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
+        return internal_error_response(e)
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/projects/<int:project_id>/dependencies/<int:target_id>', methods=['DELETE'])
@@ -2841,12 +3293,7 @@ def remove_project_dependency(portfolio_id, project_id, target_id):
 
     except Exception as e:
         session.rollback()
-        import traceback
-        print(f"Error removing dependency: {e}")
-        print(traceback.format_exc())
-        return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
+        return internal_error_response(e)
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/simulate', methods=['POST'])
@@ -2992,7 +3439,7 @@ def simulate_portfolio(portfolio_id):
         simulation_run = SimulationRun(
             portfolio_id=portfolio_id,
             user_id=current_user.id,
-            simulation_name=data.get('simulation_name', f'Simulation {datetime.utcnow().strftime("%Y-%m-%d %H:%M")}'),
+            simulation_name=data.get('simulation_name', f'Simulation {utc_now().strftime("%Y-%m-%d %H:%M")}'),
             simulation_type='portfolio_completion',
             description=data.get('description'),
             n_simulations=n_simulations,
@@ -3033,8 +3480,6 @@ def simulate_portfolio(portfolio_id):
     except Exception as e:
         session.rollback()
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/simulate-with-dependencies', methods=['POST'])
@@ -3057,7 +3502,6 @@ def simulate_portfolio_with_dependencies_endpoint(portfolio_id):
             ProjectForecastInput,
             simulate_portfolio_with_dependencies
         )
-        from dependency_analyzer import Dependency, create_dependencies_from_dict
 
         # Verify portfolio ownership
         portfolio = session.query(Portfolio).filter(
@@ -3208,7 +3652,7 @@ def simulate_portfolio_with_dependencies_endpoint(portfolio_id):
         simulation_run = SimulationRun(
             portfolio_id=portfolio_id,
             user_id=current_user.id,
-            simulation_name=data.get('simulation_name', f'Simulation with Dependencies {datetime.utcnow().strftime("%Y-%m-%d %H:%M")}'),
+            simulation_name=data.get('simulation_name', f'Simulation with Dependencies {utc_now().strftime("%Y-%m-%d %H:%M")}'),
             simulation_type='portfolio_with_dependencies',
             description=data.get('description', 'Multi-team forecasting with dependency analysis'),
             n_simulations=n_simulations,
@@ -3257,12 +3701,7 @@ def simulate_portfolio_with_dependencies_endpoint(portfolio_id):
         return jsonify({'error': str(e)}), 400
     except Exception as e:
         session.rollback()
-        import traceback
-        print(f"Error in simulate_portfolio_with_dependencies: {e}")
-        print(traceback.format_exc())
-        return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
+        return internal_error_response(e)
 
 
 @app.route('/api/projects/<int:project_id>/pbc-analysis', methods=['POST'])
@@ -3318,12 +3757,7 @@ def analyze_project_pbc(project_id):
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        import traceback
-        print(f"Error in PBC analysis: {e}")
-        print(traceback.format_exc())
-        return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
+        return internal_error_response(e)
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/simulations', methods=['GET'])
@@ -3350,8 +3784,6 @@ def get_portfolio_simulations(portfolio_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/cod-analysis', methods=['POST'])
@@ -3487,8 +3919,6 @@ def analyze_portfolio_cod(portfolio_id):
     except Exception as e:
         session.rollback()
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/delay-impact', methods=['POST'])
@@ -3565,8 +3995,6 @@ def calculate_project_delay_impact(portfolio_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/dashboard', methods=['GET'])
@@ -3744,8 +4172,6 @@ def get_portfolio_dashboard(portfolio_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 # ============================================================================
@@ -3811,8 +4237,6 @@ def handle_portfolio_risks(portfolio_id):
     except Exception as e:
         session.rollback()
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/risks/<int:risk_id>', methods=['GET', 'PUT', 'DELETE'])
@@ -3856,9 +4280,9 @@ def handle_portfolio_risk(portfolio_id, risk_id):
                 risk.status = data['status']
                 # Set dates based on status
                 if data['status'] == 'occurred' and not risk.occurred_date:
-                    risk.occurred_date = datetime.utcnow()
+                    risk.occurred_date = utc_now()
                 elif data['status'] == 'closed' and not risk.closed_date:
-                    risk.closed_date = datetime.utcnow()
+                    risk.closed_date = utc_now()
             if 'owner' in data:
                 risk.owner = data['owner']
             if 'mitigation_plan' in data:
@@ -3874,7 +4298,7 @@ def handle_portfolio_risk(portfolio_id, risk_id):
 
             # Recalculate risk score
             risk.calculate_risk_score()
-            risk.last_reviewed_date = datetime.utcnow()
+            risk.last_reviewed_date = utc_now()
 
             session.commit()
             return jsonify(risk.to_dict()), 200
@@ -3887,8 +4311,6 @@ def handle_portfolio_risk(portfolio_id, risk_id):
     except Exception as e:
         session.rollback()
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/risks/analysis', methods=['GET'])
@@ -3932,8 +4354,6 @@ def portfolio_risk_analysis(portfolio_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/risks/suggest', methods=['POST'])
@@ -3979,8 +4399,6 @@ def suggest_portfolio_risks(portfolio_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 # ============================================================================
@@ -4110,8 +4528,6 @@ def optimize_portfolio(portfolio_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/efficient-frontier', methods=['GET'])
@@ -4210,16 +4626,12 @@ def portfolio_efficient_frontier(portfolio_id):
             'risk_free_rate': analysis['risk_free_rate']
         }
 
-        return jsonify(convert_to_native_types(response)), 200
+        if not ORJSON_AVAILABLE:
+            response = convert_to_native_types(response)
+        return jsonify(response), 200
 
     except Exception as e:
-        import traceback
-        return jsonify({
-            'error': str(e),
-            'trace': traceback.format_exc()
-        }), 500
-    finally:
-        session.close()
+        return internal_error_response(e)
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/scenarios', methods=['POST'])
@@ -4314,8 +4726,6 @@ def compare_scenarios(portfolio_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/pareto', methods=['POST'])
@@ -4390,8 +4800,6 @@ def generate_pareto_frontier(portfolio_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/export/excel', methods=['GET'])
@@ -4469,8 +4877,6 @@ def export_portfolio_to_excel(portfolio_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolios/<int:portfolio_id>/export/pdf', methods=['GET'])
@@ -4548,8 +4954,6 @@ def export_portfolio_to_pdf(portfolio_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/forecasts', methods=['GET', 'POST'])
@@ -4623,13 +5027,7 @@ def handle_forecasts():
 
     except Exception as e:
         session.rollback()
-        import traceback
-        return jsonify({
-            'error': str(e),
-            'trace': traceback.format_exc()
-        }), 500
-    finally:
-        session.close()
+        return internal_error_response(e)
 
 
 @app.route('/api/forecasts/<int:forecast_id>', methods=['GET', 'DELETE'])
@@ -4653,8 +5051,6 @@ def handle_forecast(forecast_id):
     except Exception as e:
         session.rollback()
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/forecasts/<int:forecast_id>/export', methods=['GET'])
@@ -4676,8 +5072,6 @@ def export_forecast(forecast_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/forecasts/import', methods=['POST'])
@@ -4739,13 +5133,7 @@ def import_forecast():
 
     except Exception as e:
         session.rollback()
-        import traceback
-        return jsonify({
-            'error': str(e),
-            'trace': traceback.format_exc()
-        }), 500
-    finally:
-        session.close()
+        return internal_error_response(e)
 
 
 # ============================================================================
@@ -4867,6 +5255,30 @@ def portfolio_executive_dashboard():
         """, 500
 
 
+ACTUAL_MUTABLE_FIELDS = frozenset({
+    'actual_completion_date',
+    'actual_weeks_taken',
+    'actual_items_completed',
+    'actual_scope_delivered_pct',
+    'notes',
+})
+
+
+def compute_actual_errors(actual, forecast):
+    """(Re)derive an actual's error fields from the forecast it is compared against."""
+    actual.weeks_error = None
+    actual.weeks_error_pct = None
+    if actual.actual_weeks_taken and forecast.projected_weeks_p85:
+        actual.weeks_error = actual.actual_weeks_taken - forecast.projected_weeks_p85
+        actual.weeks_error_pct = (actual.weeks_error / forecast.projected_weeks_p85) * 100
+
+    actual.scope_error_pct = None
+    if actual.actual_items_completed and forecast.backlog:
+        actual_scope_pct = (actual.actual_items_completed / forecast.backlog) * 100
+        expected_scope_pct = forecast.scope_completion_pct or 100
+        actual.scope_error_pct = actual_scope_pct - expected_scope_pct
+
+
 @app.route('/api/actuals', methods=['GET', 'POST'])
 @login_required
 def handle_actuals():
@@ -4874,14 +5286,18 @@ def handle_actuals():
     session = get_session()
     try:
         if request.method == 'GET':
-            # Optional filter by forecast_id
+            # Optional filter by forecast_id, paginated newest first
             forecast_id = request.args.get('forecast_id', type=int)
-            query = scoped_actual_query(session).order_by(Actual.recorded_at.desc())
+            limit = request.args.get('limit', type=int, default=PaginationDefaults.DEFAULT_PAGE_SIZE)
+            offset = request.args.get('offset', type=int, default=PaginationDefaults.DEFAULT_OFFSET)
+            limit = min(max(limit, PaginationDefaults.MIN_PAGE_SIZE), PaginationDefaults.MAX_PAGE_SIZE)
+            offset = max(offset, 0)
 
+            query = scoped_actual_query(session)
             if forecast_id:
                 query = query.filter(Actual.forecast_id == forecast_id)
 
-            actuals = query.all()
+            actuals = query.order_by(Actual.recorded_at.desc()).limit(limit).offset(offset).all()
             return jsonify([a.to_dict() for a in actuals])
 
         elif request.method == 'POST':
@@ -4909,33 +5325,17 @@ def handle_actuals():
                 except Exception:
                     actual_weeks_taken = None
 
-            # Calculate errors
-            weeks_error = None
-            weeks_error_pct = None
-            if actual_weeks_taken and forecast.projected_weeks_p85:
-                weeks_error = actual_weeks_taken - forecast.projected_weeks_p85
-                weeks_error_pct = (weeks_error / forecast.projected_weeks_p85) * 100
-
-            scope_error_pct = None
-            actual_items_completed = data.get('actual_items_completed')
-            if actual_items_completed and forecast.backlog:
-                actual_scope_pct = (actual_items_completed / forecast.backlog) * 100
-                expected_scope_pct = forecast.scope_completion_pct or 100
-                scope_error_pct = actual_scope_pct - expected_scope_pct
-
             # Create actual record
             actual = Actual(
                 forecast_id=forecast_id,
                 actual_completion_date=actual_completion_date,
                 actual_weeks_taken=actual_weeks_taken,
-                actual_items_completed=actual_items_completed,
+                actual_items_completed=data.get('actual_items_completed'),
                 actual_scope_delivered_pct=data.get('actual_scope_delivered_pct'),
-                weeks_error=weeks_error,
-                weeks_error_pct=weeks_error_pct,
-                scope_error_pct=scope_error_pct,
                 notes=data.get('notes'),
                 recorded_by=data.get('recorded_by') or getattr(current_user, 'name', None)
             )
+            compute_actual_errors(actual, forecast)
 
             session.add(actual)
             session.commit()
@@ -4944,13 +5344,7 @@ def handle_actuals():
 
     except Exception as e:
         session.rollback()
-        import traceback
-        return jsonify({
-            'error': str(e),
-            'trace': traceback.format_exc()
-        }), 500
-    finally:
-        session.close()
+        return internal_error_response(e)
 
 
 @app.route('/api/actuals/<int:actual_id>', methods=['GET', 'PUT', 'DELETE'])
@@ -4967,27 +5361,17 @@ def handle_actual(actual_id):
             return jsonify(actual.to_dict())
 
         elif request.method == 'PUT':
-            data = request.json
+            data = request.json or {}
 
-            # Update fields
-            if 'actual_completion_date' in data:
-                actual.actual_completion_date = data['actual_completion_date']
-            if 'actual_weeks_taken' in data:
-                actual.actual_weeks_taken = data['actual_weeks_taken']
-            if 'actual_items_completed' in data:
-                actual.actual_items_completed = data['actual_items_completed']
-            if 'actual_scope_delivered_pct' in data:
-                actual.actual_scope_delivered_pct = data['actual_scope_delivered_pct']
-            if 'notes' in data:
-                actual.notes = data['notes']
+            # Update whitelisted fields only
+            for field, value in data.items():
+                if field in ACTUAL_MUTABLE_FIELDS:
+                    setattr(actual, field, value)
 
             # Recalculate errors
-            forecast = actual.forecast
-            if actual.actual_weeks_taken and forecast.projected_weeks_p85:
-                actual.weeks_error = actual.actual_weeks_taken - forecast.projected_weeks_p85
-                actual.weeks_error_pct = (actual.weeks_error / forecast.projected_weeks_p85) * 100
+            compute_actual_errors(actual, actual.forecast)
 
-            actual.recorded_at = datetime.utcnow()
+            actual.recorded_at = utc_now()
             session.commit()
             return jsonify(actual.to_dict())
 
@@ -4998,9 +5382,53 @@ def handle_actual(actual_id):
 
     except Exception as e:
         session.rollback()
-        return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
+        return internal_error_response(e)
+
+
+COMPARISON_COLUMNS = (
+    'forecast_id', 'forecast_name', 'project_name', 'created_at',
+    'forecasted_weeks', 'actual_weeks', 'error_weeks', 'error_pct',
+    'backlog', 'notes',
+)
+RECENT_COMPARISON_COLUMNS = (
+    'forecast_id', 'forecast_name', 'project_name', 'created_at',
+    'forecasted_weeks', 'actual_weeks', 'error_pct',
+)
+_COMPARISON_WEEK_COLUMNS = ['forecasted_weeks', 'actual_weeks', 'error_weeks', 'error_pct']
+
+
+def build_comparison_rows(records, columns=COMPARISON_COLUMNS):
+    """
+    Tabulate (Forecast, Actual) pairs into rounded comparison rows.
+
+    Pairs without a P85 projection or actual duration are skipped; zero or
+    missing errors are reported as null. Rounding runs once per column.
+    """
+    rows = [
+        (
+            forecast.id,
+            forecast.name,
+            forecast.project.name if forecast.project else None,
+            forecast.created_at.isoformat(),
+            forecast.projected_weeks_p85,
+            actual.actual_weeks_taken,
+            actual.weeks_error,
+            actual.weeks_error_pct,
+            forecast.backlog,
+            actual.notes,
+        )
+        for forecast, actual in records
+        if forecast.projected_weeks_p85 and actual.actual_weeks_taken
+    ]
+    if not rows:
+        return []
+
+    frame = pd.DataFrame(rows, columns=COMPARISON_COLUMNS, dtype=object)
+    weeks = frame[_COMPARISON_WEEK_COLUMNS].astype(float)
+    keep = weeks.notna() & (weeks != 0)
+    frame[_COMPARISON_WEEK_COLUMNS] = weeks.round(2).astype(object).where(keep, None)
+
+    return frame[list(columns)].to_dict(orient='records')
 
 
 @app.route('/api/accuracy-analysis', methods=['GET'])
@@ -5045,7 +5473,7 @@ def accuracy_analysis():
         forecasts_p85 = []
         actuals_weeks = []
         dates = []
-        tp_samples_list = []
+        avg_tp_samples = None
 
         for forecast, actual in records:
             if forecast.projected_weeks_p85 and actual.actual_weeks_taken:
@@ -5053,14 +5481,15 @@ def accuracy_analysis():
                 actuals_weeks.append(actual.actual_weeks_taken)
                 dates.append(forecast.created_at)
 
-                # Try to extract throughput samples from input_data
-                try:
-                    input_data = json.loads(forecast.input_data)
-                    tp_samples = input_data.get('tpSamples', [])
-                    if tp_samples:
-                        tp_samples_list.append(tp_samples)
-                except:
-                    pass
+                # Only the first forecast with throughput samples is used, so stop
+                # decoding input_data once one has been found
+                if avg_tp_samples is None and forecast.input_data:
+                    try:
+                        tp_samples = fast_json_loads(forecast.input_data).get('tpSamples')
+                        if tp_samples:
+                            avg_tp_samples = tp_samples
+                    except (ValueError, TypeError, AttributeError):
+                        pass
 
         if len(forecasts_p85) < 2:
             return jsonify({
@@ -5079,7 +5508,6 @@ def accuracy_analysis():
         )
 
         # Detect data quality issues
-        avg_tp_samples = tp_samples_list[0] if tp_samples_list else None
         issues = detect_data_quality_issues(
             forecasts_p85,
             actuals_weeks,
@@ -5093,29 +5521,15 @@ def accuracy_analysis():
         quality_ratings = metrics.get_quality_rating()
 
         # Prepare detailed comparison data
-        comparisons = []
-        for forecast, actual in records:
-            if forecast.projected_weeks_p85 and actual.actual_weeks_taken:
-                comparisons.append({
-                    'forecast_id': forecast.id,
-                    'forecast_name': forecast.name,
-                    'project_name': forecast.project.name if forecast.project else None,
-                    'created_at': forecast.created_at.isoformat(),
-                    'forecasted_weeks': round(forecast.projected_weeks_p85, 2),
-                    'actual_weeks': round(actual.actual_weeks_taken, 2),
-                    'error_weeks': round(actual.weeks_error, 2) if actual.weeks_error else None,
-                    'error_pct': round(actual.weeks_error_pct, 2) if actual.weeks_error_pct else None,
-                    'backlog': forecast.backlog,
-                    'notes': actual.notes
-                })
+        comparisons = build_comparison_rows(records)
 
-        return jsonify({
+        # The comparison list grows with the history size, so it is streamed row by row
+        return stream_json_response({
             'metrics': metrics.to_dict(),
             'time_series_metrics': ts_metrics,
             'quality_ratings': quality_ratings,
             'issues': issues,
             'recommendations': recommendations,
-            'comparisons': comparisons,
             'summary': {
                 'total_comparisons': len(comparisons),
                 'date_range': {
@@ -5123,18 +5537,12 @@ def accuracy_analysis():
                     'last': dates[0].isoformat() if dates else None
                 }
             }
-        })
+        }, 'comparisons', comparisons)
 
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        import traceback
-        return jsonify({
-            'error': str(e),
-            'trace': traceback.format_exc()
-        }), 500
-    finally:
-        session.close()
+        return internal_error_response(e)
 
 
 @app.route('/api/forecast-vs-actual/dashboard', methods=['GET'])
@@ -5180,52 +5588,41 @@ def forecast_vs_actual_dashboard_data():
         metrics = calculate_accuracy_metrics(forecasts_p85, actuals_weeks)
         quality_ratings = metrics.get_quality_rating()
 
-        # Get project-wise breakdown
-        project_stats = {}
+        # Get project-wise breakdown, scored for all projects in one vectorized pass
+        project_names = []
+        project_positions = {}
+        group_forecasts = []
+        group_actuals = []
+        group_idx = []
         for forecast, actual in records:
             if not forecast.project or not forecast.projected_weeks_p85 or not actual.actual_weeks_taken:
                 continue
 
             project_name = forecast.project.name
-            if project_name not in project_stats:
-                project_stats[project_name] = {
-                    'forecasts': [],
-                    'actuals': [],
-                    'count': 0
-                }
+            if project_name not in project_positions:
+                project_positions[project_name] = len(project_names)
+                project_names.append(project_name)
 
-            project_stats[project_name]['forecasts'].append(forecast.projected_weeks_p85)
-            project_stats[project_name]['actuals'].append(actual.actual_weeks_taken)
-            project_stats[project_name]['count'] += 1
+            group_forecasts.append(forecast.projected_weeks_p85)
+            group_actuals.append(actual.actual_weeks_taken)
+            group_idx.append(project_positions[project_name])
 
-        # Calculate metrics per project
         project_metrics = {}
-        for project_name, data in project_stats.items():
-            if len(data['forecasts']) >= 2:
-                try:
-                    proj_metrics = calculate_accuracy_metrics(data['forecasts'], data['actuals'])
-                    project_metrics[project_name] = {
-                        'mape': proj_metrics.mape,
-                        'accuracy_rate': proj_metrics.accuracy_rate,
-                        'count': data['count'],
-                        'bias': proj_metrics.bias_direction
-                    }
-                except:
-                    pass
+        grouped_metrics = calculate_grouped_accuracy_metrics(
+            group_forecasts, group_actuals, group_idx, len(project_names)
+        ) if project_names else []
+        for project_name, proj_metrics in zip(project_names, grouped_metrics):
+            if proj_metrics is None:
+                continue
+            project_metrics[project_name] = {
+                'mape': proj_metrics['mape'],
+                'accuracy_rate': proj_metrics['accuracy_rate'],
+                'count': proj_metrics['count'],
+                'bias': proj_metrics['bias_direction']
+            }
 
         # Recent comparisons (last 10)
-        recent_comparisons = []
-        for forecast, actual in records[:10]:
-            if forecast.projected_weeks_p85 and actual.actual_weeks_taken:
-                recent_comparisons.append({
-                    'forecast_id': forecast.id,
-                    'forecast_name': forecast.name,
-                    'project_name': forecast.project.name if forecast.project else None,
-                    'created_at': forecast.created_at.isoformat(),
-                    'forecasted_weeks': round(forecast.projected_weeks_p85, 2),
-                    'actual_weeks': round(actual.actual_weeks_taken, 2),
-                    'error_pct': round(actual.weeks_error_pct, 2) if actual.weeks_error_pct else None
-                })
+        recent_comparisons = build_comparison_rows(records[:10], columns=RECENT_COMPARISON_COLUMNS)
 
         return jsonify({
             'has_data': True,
@@ -5241,13 +5638,7 @@ def forecast_vs_actual_dashboard_data():
         })
 
     except Exception as e:
-        import traceback
-        return jsonify({
-            'error': str(e),
-            'trace': traceback.format_exc()
-        }), 500
-    finally:
-        session.close()
+        return internal_error_response(e)
 
 
 @app.route('/api/backtest', methods=['POST'])
@@ -5361,16 +5752,14 @@ def api_backtest():
                 'report': generate_backtest_report(summary)
             }
 
-        return jsonify(convert_to_native_types(response))
+        if not ORJSON_AVAILABLE:
+            response = convert_to_native_types(response)
+        return jsonify(response)
 
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        import traceback
-        return jsonify({
-            'error': str(e),
-            'trace': traceback.format_exc()
-        }), 500
+        return internal_error_response(e)
 
 
 @app.route('/api/backtest-project', methods=['POST'])
@@ -5433,19 +5822,17 @@ def backtest_project():
 
                 if tp_samples and isinstance(tp_samples, list) and len(tp_samples) > 0:
                     all_tp_samples.extend(tp_samples)
-                    print(f"✓ Forecast {forecast.id}: {len(tp_samples)} samples")
+                    logger.debug(f"Forecast {forecast.id}: {len(tp_samples)} samples")
                 else:
-                    print(f"⚠ Forecast {forecast.id}: No TP samples (keys: {list(input_data.keys())})")
+                    logger.debug(f"Forecast {forecast.id}: no TP samples (keys: {list(input_data.keys())})")
 
                 if backlog > 0:
                     backlog_values.append(backlog)
             except Exception as e:
-                print(f"✗ Error parsing forecast {forecast.id}: {e}")
-                import traceback
-                traceback.print_exc()
+                logger.warning(f"Error parsing forecast {forecast.id}: {e}")
                 continue
 
-        print(f"\n=== Summary: {len(all_tp_samples)} total samples from {len(forecasts)} forecasts ===")
+        logger.debug(f"Backtest project {project_id}: {len(all_tp_samples)} samples from {len(forecasts)} forecasts")
 
         # Validation
         if not all_tp_samples:
@@ -5507,24 +5894,69 @@ def backtest_project():
             'report': generate_backtest_report(summary)
         }
 
-        return jsonify(convert_to_native_types(response))
+        if not ORJSON_AVAILABLE:
+            response = convert_to_native_types(response)
+        return jsonify(response)
 
     except ValueError as e:
         return jsonify({'error': str(e)}), 400
     except Exception as e:
-        import traceback
-        return jsonify({
-            'error': str(e),
-            'trace': traceback.format_exc()
-        }), 500
-    finally:
-        db_session.close()
+        return internal_error_response(e)
 
 
 # ============================================================================
 # PORTFOLIO MANAGEMENT API ENDPOINTS
 # ============================================================================
 
+_portfolio_dashboard_cache = TTLCache(
+    maxsize=CacheSettings.PORTFOLIO_DASHBOARD_MAXSIZE,
+    ttl=CacheSettings.PORTFOLIO_DASHBOARD_TTL
+)
+
+
+_project_health_cache = TTLCache(
+    maxsize=CacheSettings.PROJECT_HEALTH_MAXSIZE,
+    ttl=CacheSettings.PROJECT_HEALTH_TTL
+)
+
+
+def cached_project_health_score(project):
+    """
+    Return the health score for a project loaded with its forecasts and actuals.
+
+    Scores are memoized on the project revision (updated_at) plus the count and
+    latest timestamp of its forecasts and actuals, all read from loaded rows.
+    """
+    forecasts = project.forecasts
+    actuals = [actual for forecast in forecasts for actual in forecast.actuals]
+    cache_key = (
+        project.id,
+        project.updated_at,
+        len(forecasts),
+        max((f.created_at for f in forecasts if f.created_at), default=None),
+        len(actuals),
+        max((a.recorded_at for a in actuals if a.recorded_at), default=None),
+    )
+
+    health_score = _project_health_cache.get(cache_key)
+    if health_score is None:
+        actuals_map = {forecast.id: forecast.actuals for forecast in forecasts}
+        health_score = calculate_project_health_score(project, forecasts, actuals_map)
+        _project_health_cache.set(cache_key, health_score)
+    return health_score
+
+
+def _portfolio_dashboard_response(body, etag):
+    """Wrap pre-encoded dashboard JSON with private caching headers (304 when body is None)."""
+    if body is None:
+        response = app.response_class(status=304)
+    else:
+        response = app.response_class(body, mimetype='application/json')
+    response.set_etag(etag)
+    response.headers['Cache-Control'] = f'private, max-age={CacheSettings.PORTFOLIO_DASHBOARD_TTL}'
+    return response
+
+
 @app.route('/api/portfolio/dashboard', methods=['GET'])
 @login_required
 def portfolio_dashboard():
@@ -5565,49 +5997,49 @@ def portfolio_dashboard():
         elif requested_project_ids:
             projects_query = projects_query.filter(Project.id.in_(requested_project_ids))
 
-        # Get all projects after filters
-        projects = projects_query.all()
+        # Cheap sentinel query (ids + timestamps only) used to key the dashboard cache
+        project_stamps = projects_query.with_entities(Project.id, Project.updated_at).order_by(Project.id).all()
 
-        if not projects:
+        if not project_stamps:
             return jsonify({
                 'has_data': False,
                 'message': 'Nenhum projeto cadastrado. Crie projetos para visualizar o portfolio.'
             })
 
-        selected_project_ids = [p.id for p in projects]
+        selected_project_ids = [row.id for row in project_stamps]
+        forecast_stamp = scoped_forecast_query(session).filter(
+            Forecast.project_id.in_(selected_project_ids)
+        ).with_entities(func.count(Forecast.id), func.max(Forecast.created_at)).one()
+        actual_stamp = session.query(func.count(Actual.id), func.max(Actual.recorded_at)).join(
+            Forecast, Actual.forecast_id == Forecast.id
+        ).filter(Forecast.project_id.in_(selected_project_ids)).one()
+
+        principal = current_principal()
+        cache_key = (
+            principal.id,
+            principal.is_admin,
+            portfolio_id,
+            tuple(sorted(requested_project_ids)),
+            tuple((row.id, row.updated_at) for row in project_stamps),
+            tuple(forecast_stamp),
+            tuple(actual_stamp),
+        )
+        etag = hashlib.sha1(repr(cache_key).encode('utf-8')).hexdigest()
 
-        # Get forecasts for each project
-        forecasts_query = scoped_forecast_query(session)
-        if selected_project_ids:
-            forecasts_query = forecasts_query.filter(Forecast.project_id.in_(selected_project_ids))
-        all_forecasts = forecasts_query.all()
+        if request.if_none_match.contains(etag):
+            return _portfolio_dashboard_response(None, etag)
 
-        forecasts_by_project = {}
-        for forecast in all_forecasts:
-            forecasts_by_project.setdefault(forecast.project_id, []).append(forecast)
+        cached_body = _portfolio_dashboard_cache.get(cache_key)
+        if cached_body is not None:
+            return _portfolio_dashboard_response(cached_body, etag)
 
-        # Get actuals mapped by forecast_id
-        forecast_ids = [f.id for f in all_forecasts]
-        if forecast_ids:
-            actuals_query = scoped_actual_query(session).filter(Actual.forecast_id.in_(forecast_ids))
-            all_actuals = actuals_query.all()
-        else:
-            all_actuals = []
+        # Load projects with their forecasts and actuals eagerly (one SELECT per level)
+        projects = projects_query.options(
+            selectinload(Project.forecasts).selectinload(Forecast.actuals)
+        ).all()
 
-        actuals_map = {}
-        for actual in all_actuals:
-            actuals_map.setdefault(actual.forecast_id, []).append(actual)
-
-        # Calculate health scores for each project
-        health_scores = []
-        for project in projects:
-            project_forecasts = forecasts_by_project.get(project.id, [])
-            health_score = calculate_project_health_score(
-                project,
-                project_forecasts,
-                actuals_map
-            )
-            health_scores.append(health_score)
+        # Calculate health scores for each project (memoized per project revision)
+        health_scores = [cached_project_health_score(project) for project in projects]
 
         # Analyze capacity
         capacity_analysis = analyze_portfolio_capacity(projects)
@@ -5623,7 +6055,7 @@ def portfolio_dashboard():
         total_business_value = sum(p.business_value for p in active_projects)
         avg_health_score = np.mean([hs.overall_score for hs in health_scores]) if health_scores else 0
 
-        return jsonify({
+        payload = {
             'has_data': True,
             'summary': {
                 'total_projects': len(projects),
@@ -5638,16 +6070,15 @@ def portfolio_dashboard():
             'prioritization_matrix': prioritization_matrix.to_dict(),
             'alerts': alerts,
             'projects': [p.to_dict() for p in projects]
-        })
+        }
+        # Cache the encoded bytes so warm hits skip serialization entirely
+        body = fast_json_dumps(payload)
+        _portfolio_dashboard_cache.set(cache_key, body)
+
+        return _portfolio_dashboard_response(body, etag)
 
     except Exception as e:
-        import traceback
-        return jsonify({
-            'error': str(e),
-            'trace': traceback.format_exc()
-        }), 500
-    finally:
-        session.close()
+        return internal_error_response(e)
 
 
 @app.route('/api/portfolio/health/<int:project_id>', methods=['GET'])
@@ -5682,8 +6113,6 @@ def project_health_details(project_id):
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolio/capacity', methods=['GET'])
@@ -5703,8 +6132,6 @@ def portfolio_capacity():
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 @app.route('/api/portfolio/prioritization', methods=['GET'])
@@ -5720,8 +6147,6 @@ def portfolio_prioritization():
 
     except Exception as e:
         return jsonify({'error': str(e)}), 500
-    finally:
-        session.close()
 
 
 # ============================================================================
@@ -5730,48 +6155,66 @@ def portfolio_prioritization():
 
 # Global CoD forecaster caches
 _default_cod_forecaster = None
-_cod_forecasters_by_user = {}
+_cod_forecasters_by_user = TTLCache(  # user_id -> (trained_at, forecaster)
+    maxsize=CacheSettings.COD_FORECASTER_MAXSIZE
+)
 
 
 def _load_default_cod_forecaster():
     """Load the shared default CoD forecaster (trained with synthetic data)."""
     global _default_cod_forecaster
     if _default_cod_forecaster is None:
-        _default_cod_forecaster = CoDForecaster()
         try:
-            sample_data = generate_sample_cod_data(n_samples=100)
-            _default_cod_forecaster.train_models(sample_data)
-            logger.info("CoD Forecaster initialized with sample data")
-            _default_cod_forecaster.train_models(sample_data, use_hyperparam_search=False)
-            print("CoD Forecaster initialized with sample data", flush=True)
+            _default_cod_forecaster = load_default_cod_forecaster(COD_DEFAULT_MODEL_PATH)
         except Exception as exc:
             logger.warning(f"Could not initialize default CoD forecaster: {exc}")
+            _default_cod_forecaster = CoDForecaster()
     return _default_cod_forecaster
 
 
+# Warm the default forecaster at startup so no request pays for training it
+if Config.WARM_COD_DEFAULT_FORECASTER:
+    _load_default_cod_forecaster()
+
+
 def _load_user_cod_forecaster(user_id: int):
-    """Load a user-specific CoD forecaster from cache or database."""
-    if user_id in _cod_forecasters_by_user:
-        return _cod_forecasters_by_user[user_id]
+    """
+    Load a user-specific CoD forecaster from cache or database.
 
+    Cached entries are ``(trained_at, forecaster)`` pairs held in a bounded
+    LRU. Each lookup only reads ``trained_at`` to confirm the cached model is
+    still current (another worker or the Celery task may have retrained it),
+    so invalidation is shared across workers; ``model_blob`` is fetched and
+    unpickled only when the timestamp changed.
+    """
     session = get_session()
+    trained_at = (
+        session.query(CoDModel.trained_at)
+        .filter(CoDModel.user_id == user_id)
+        .scalar()
+    )
+
+    cached = _cod_forecasters_by_user.get(user_id)
+    if cached is not None and cached[0] == trained_at:
+        return cached[1]
+
+    row = (
+        session.query(CoDModel.model_blob, CoDModel.trained_at)
+        .filter(CoDModel.user_id == user_id)
+        .one_or_none()
+    )
+    if row is None or not row.model_blob:
+        _cod_forecasters_by_user.pop(user_id, None)
+        return None
+
     try:
-        cod_model = (
-            session.query(CoDModel)
-            .filter(CoDModel.user_id == user_id)
-            .one_or_none()
-        )
-        if cod_model and cod_model.model_blob:
-            try:
-                forecaster = pickle.loads(cod_model.model_blob)
-                _cod_forecasters_by_user[user_id] = forecaster
-                return forecaster
-            except Exception as exc:
-                logger.warning(f"Could not unpickle CoD model for user {user_id}: {exc}")
-    finally:
-        session.close()
+        forecaster = load_cod_forecaster(row.model_blob)
+    except Exception as exc:
+        logger.warning(f"Could not unpickle CoD model for user {user_id}: {exc}")
+        return None
 
-    return None
+    _cod_forecasters_by_user.set(user_id, (row.trained_at, forecaster))
+    return forecaster
 
 
 def invalidate_user_cod_cache(user_id: int):
@@ -5779,9 +6222,17 @@ def invalidate_user_cod_cache(user_id: int):
     _cod_forecasters_by_user.pop(user_id, None)
 
 
-def get_cod_forecaster():
-    """Return the appropriate CoD forecaster for the current context."""
-    user_id = getattr(current_user, 'id', None) if getattr(current_user, 'is_authenticated', False) else None
+def get_cod_forecaster(user=None):
+    """
+    Return the appropriate CoD forecaster for the current context.
+
+    Args:
+        user: Already-resolved current user; resolves ``current_user`` once
+              when omitted. Anonymous users go straight to the default model.
+    """
+    if user is None:
+        user = current_user._get_current_object()
+    user_id = user.id if getattr(user, 'is_authenticated', False) else None
 
     if user_id:
         user_forecaster = _load_user_cod_forecaster(user_id)
@@ -5791,77 +6242,91 @@ def get_cod_forecaster():
     return _load_default_cod_forecaster()
 
 
-def get_user_cod_assets(user_id: int):
-    """Fetch persisted CoD dataset and model for a user."""
-    session = get_session()
-    try:
-        dataset = (
-            session.query(CoDTrainingDataset)
-            .filter(CoDTrainingDataset.user_id == user_id)
-            .order_by(CoDTrainingDataset.created_at.desc())
-            .first()
-        )
-        model = (
-            session.query(CoDModel)
-            .filter(CoDModel.user_id == user_id)
-            .one_or_none()
-        )
-        return dataset, model
-    finally:
-        session.close()
-
-
-def _normalize_cod_dataframe(df: pd.DataFrame) -> pd.DataFrame:
-    """Standardize column names for CoD datasets."""
-    df = df.copy()
-    df.columns = [str(col).strip() for col in df.columns]
-    rename_map = {}
-    lower_map = {col.lower(): col for col in df.columns}
-    for expected in COD_REQUIRED_COLUMNS.union(COD_OPTIONAL_COLUMNS):
-        lower_expected = expected.lower()
-        original = lower_map.get(lower_expected)
-        if original and original != expected:
-            rename_map[original] = expected
-    if rename_map:
-        df = df.rename(columns=rename_map)
-    return df
-
-
-def load_cod_dataframe(file_storage) -> pd.DataFrame:
-    """Load and validate a CSV file containing CoD training data."""
-    try:
-        df = pd.read_csv(file_storage)
-    except Exception as exc:
-        raise ValueError(f'Não foi possível ler o CSV: {exc}')
+class CoDModelMetadata(NamedTuple):
+    """Scalar CoD model columns; ``blob_len`` is the stored model size in bytes."""
+    id: int
+    trained_at: Optional[datetime]
+    sample_count: Optional[int]
+    model_meta: Optional[Dict[str, Any]]
+    blob_len: Optional[int]
 
-    df = _normalize_cod_dataframe(df)
-    missing = COD_REQUIRED_COLUMNS.difference(df.columns)
-    if missing:
-        raise ValueError(f'Colunas obrigatórias ausentes: {", ".join(sorted(missing))}')
 
-    numeric_columns = [col for col in COD_REQUIRED_COLUMNS if col not in {'project_type'}]
-    for column in numeric_columns:
-        df[column] = pd.to_numeric(df[column], errors='coerce')
+_COD_MODEL_METADATA_COLUMNS = (
+    CoDModel.id,
+    CoDModel.trained_at,
+    CoDModel.sample_count,
+    CoDModel.model_meta,
+    func.length(CoDModel.model_blob).label('blob_len'),
+)
+
 
-    df = df.dropna(subset=numeric_columns)
-    df = df[df['team_size'] > 0]
-    df = df[df['duration_weeks'] > 0]
-    df = df[df['cod_weekly'] > 0]
-    df = df[df['num_stakeholders'] >= 0]
+def get_user_cod_asset_metadata(user_id: int):
+    """
+    Fetch CoD dataset and model metadata for a user without the stored payloads.
+
+    The dataset is loaded without its records/Feather bytes and the model is
+    returned as a CoDModelMetadata tuple, so status checks never pull the
+    pickled model over the wire. Both come back from one outer-joined query;
+    the model-only query runs just for users without a dataset.
+    """
+    session = get_session()
+    row = (
+        session.query(CoDTrainingDataset, *_COD_MODEL_METADATA_COLUMNS)
+        .outerjoin(CoDModel, CoDModel.user_id == CoDTrainingDataset.user_id)
+        .options(load_only(
+            CoDTrainingDataset.id,
+            CoDTrainingDataset.name,
+            CoDTrainingDataset.original_filename,
+            CoDTrainingDataset.column_names,
+            CoDTrainingDataset.row_count,
+            CoDTrainingDataset.created_at,
+        ))
+        .filter(CoDTrainingDataset.user_id == user_id)
+        .order_by(CoDTrainingDataset.created_at.desc())
+        .first()
+    )
+    if row is not None:
+        dataset, model_columns = row[0], tuple(row[1:])
+        model = CoDModelMetadata(*model_columns) if model_columns[0] is not None else None
+        return dataset, model
+
+    model_row = (
+        session.query(*_COD_MODEL_METADATA_COLUMNS)
+        .filter(CoDModel.user_id == user_id)
+        .one_or_none()
+    )
+    return None, CoDModelMetadata(*model_row) if model_row is not None else None
 
-    if 'project_type' in df.columns:
-        df['project_type'] = df['project_type'].fillna('Unknown').astype(str)
 
-    if 'risk_level' in df.columns:
-        df['risk_level'] = pd.to_numeric(df['risk_level'], errors='coerce')
-        df = df.dropna(subset=['risk_level'])
+def get_user_cod_training_state(user_id: int):
+    """
+    Return the freshness of a user's CoD model relative to their latest dataset.
 
-    df = df.reset_index(drop=True)
+    Runs a single Core SELECT and returns a row with ``dataset_created_at``,
+    ``trained_at`` and ``has_model``, or None when the user has no dataset.
+    """
+    statement = (
+        select(
+            CoDTrainingDataset.created_at.label('dataset_created_at'),
+            CoDModel.trained_at,
+            (func.length(CoDModel.model_blob) > 0).label('has_model'),
+        )
+        .select_from(CoDTrainingDataset)
+        .outerjoin(CoDModel, CoDModel.user_id == CoDTrainingDataset.user_id)
+        .where(CoDTrainingDataset.user_id == user_id)
+        .order_by(CoDTrainingDataset.created_at.desc())
+        .limit(1)
+    )
+    return get_session().execute(statement).first()
 
-    if len(df) < 10:
-        raise ValueError('É necessário pelo menos 10 linhas válidas para treinar o modelo.')
 
-    return df
+def cod_model_is_stale(state) -> bool:
+    """True when the dataset in ``state`` was uploaded after the model was trained."""
+    return bool(
+        state.trained_at
+        and state.dataset_created_at
+        and state.dataset_created_at > state.trained_at
+    )
 
 
 @app.route('/downloads/cod-sample', methods=['GET'])
@@ -5870,12 +6335,19 @@ def download_cod_sample():
     """Provide the sample CoD CSV for users."""
     if not COD_SAMPLE_PATH.exists():
         return jsonify({'error': 'Sample dataset indisponível no servidor.'}), 404
-    return send_file(
-        str(COD_SAMPLE_PATH),
+    # Immutable per deploy: let browsers revalidate via ETag/Last-Modified (304)
+    response = send_from_directory(
+        COD_SAMPLE_PATH.parent,
+        COD_SAMPLE_PATH.name,
         mimetype='text/csv',
         as_attachment=True,
-        download_name='cod_training_sample.csv'
+        download_name='cod_training_sample.csv',
+        conditional=True,
+        max_age=CacheSettings.COD_SAMPLE_MAX_AGE
     )
+    response.cache_control.public = False
+    response.cache_control.private = True
+    return response
 
 
 @app.route('/api/cod/dataset', methods=['GET'])
@@ -5883,20 +6355,21 @@ def download_cod_sample():
 def cod_dataset_status():
     """Return metadata about the user's CoD training dataset and model."""
     user_id = current_user.id
-    dataset, model = get_user_cod_assets(user_id)
+    dataset, model = get_user_cod_asset_metadata(user_id)
 
     dataset_payload = dataset.to_dict() if dataset else None
 
-    has_model = bool(model and model.model_blob)
+    has_model = bool(model and model.blob_len)
     model_payload = None
     if has_model:
+        model_meta = model.model_meta or {}
         model_payload = {
             'id': model.id,
             'trained_at': model.trained_at.isoformat() if model.trained_at else None,
             'sample_count': model.sample_count,
-            'metrics': model.get_metrics(),
-            'feature_names': json.loads(model.feature_names) if model.feature_names else None,
-            'project_types': json.loads(model.project_types) if model.project_types else None,
+            'metrics': model_meta.get('metrics'),
+            'feature_names': model_meta.get('feature_names'),
+            'project_types': model_meta.get('project_types'),
         }
 
     retrain_required = False
@@ -5933,9 +6406,6 @@ def upload_cod_dataset():
     except ValueError as exc:
         return jsonify({'error': str(exc)}), 400
 
-    records = json.loads(df.to_json(orient='records'))
-    column_names = df.columns.tolist()
-
     session = get_session()
     dataset_payload = None
     try:
@@ -5949,10 +6419,8 @@ def upload_cod_dataset():
 
         dataset.name = dataset_name
         dataset.original_filename = file.filename
-        dataset.data = json.dumps(records)
-        dataset.column_names = json.dumps(column_names)
-        dataset.row_count = len(records)
-        dataset.created_at = datetime.utcnow()
+        store_cod_dataset_frame(dataset, df)
+        dataset.created_at = utc_now()
 
         session.add(dataset)
         session.commit()
@@ -5960,8 +6428,6 @@ def upload_cod_dataset():
     except Exception as exc:
         session.rollback()
         return jsonify({'error': f'Falha ao salvar dataset: {exc}'}), 500
-    finally:
-        session.close()
 
     return jsonify({
         'message': 'Dataset carregado com sucesso.',
@@ -5973,88 +6439,137 @@ def upload_cod_dataset():
 @app.route('/api/cod/train', methods=['POST'])
 @login_required
 def train_cod_model():
-    """Train and persist a user-specific CoD model."""
+    """
+    Train and persist a user-specific CoD model.
+
+    With background training enabled the job goes to the Celery queue and the
+    client gets a 202 with a status URL to poll; otherwise it trains inline.
+    """
     user_id = current_user.id
-    dataset, _ = get_user_cod_assets(user_id)
+    options = request.get_json(silent=True)
+    full_search = bool(isinstance(options, dict) and options.get('full_search'))
 
-    if not dataset:
-        return jsonify({'error': 'Nenhum dataset encontrado. Faça upload de um CSV antes de treinar.'}), 400
+    if Config.ASYNC_COD_TRAINING and COD_TASKS_AVAILABLE:
+        try:
+            task = train_cod_model_async.apply_async(args=(user_id, full_search), retry=False)
+        except Exception as exc:
+            logger.warning(f"Could not queue CoD training for user {user_id}, training inline: {exc}")
+        else:
+            return jsonify({
+                'task_id': task.id,
+                'status': 'PENDING',
+                'message': 'Treinamento do modelo de CoD enfileirado.',
+                'poll_url': url_for('cod_training_status', task_id=task.id)
+            }), 202
 
+    session = get_session()
     try:
-        records = json.loads(dataset.data)
-        df = pd.DataFrame(records)
-        df = _normalize_cod_dataframe(df)
-        numeric_columns = [col for col in COD_REQUIRED_COLUMNS if col not in {'project_type'}]
-        for column in numeric_columns:
-            df[column] = pd.to_numeric(df[column], errors='coerce')
-        df = df.dropna(subset=numeric_columns)
-        forecaster = CoDForecaster()
-        options = request.get_json(silent=True)
-        full_search = isinstance(options, dict) and options.get('full_search')
-        search_iterations = 30 if full_search else 12
-        forecaster.train_models(
-            df,
-            use_hyperparam_search=True,
-            search_iterations=search_iterations
-        )
-    except ValueError as exc:
+        cod_model, forecaster, model_payload = train_user_cod_model(session, user_id, full_search)
+    except (LookupError, ValueError) as exc:
         return jsonify({'error': str(exc)}), 400
     except Exception as exc:
         return jsonify({'error': f'Falha ao treinar o modelo: {exc}'}), 500
 
-    metrics_summary = {}
-    for model_name, model_data in forecaster.models.items():
-        metrics_summary[model_name] = {
-            'mae': float(model_data['mae']),
-            'rmse': float(model_data['rmse']),
-            'r2': float(model_data['r2']),
-            'mape': float(model_data['mape']),
-            'best_params': model_data.get('best_params'),
-        }
+    _cod_forecasters_by_user.set(user_id, (cod_model.trained_at, forecaster))
 
-    feature_names_json = json.dumps(forecaster.feature_names)
-    project_types_json = json.dumps(forecaster.project_types)
-    model_blob = pickle.dumps(forecaster)
+    return jsonify({
+        'message': 'Modelo de CoD treinado com sucesso.',
+        'model': model_payload
+    })
 
-    session = get_session()
-    try:
-        cod_model = (
-            session.query(CoDModel)
-            .filter(CoDModel.user_id == user_id)
-            .one_or_none()
-        )
-        if cod_model is None:
-            cod_model = CoDModel(user_id=user_id)
 
-        cod_model.model_blob = model_blob
-        cod_model.metrics = json.dumps(metrics_summary)
-        cod_model.sample_count = len(df)
-        cod_model.feature_names = feature_names_json
-        cod_model.project_types = project_types_json
-        cod_model.trained_at = datetime.utcnow()
+@app.route('/api/cod/train/status/<task_id>', methods=['GET'])
+@login_required
+def cod_training_status(task_id):
+    """Report the state of a queued CoD training job."""
+    if not COD_TASKS_AVAILABLE:
+        return jsonify({'error': 'Treinamento em segundo plano indisponível.'}), 404
+
+    result = AsyncResult(task_id, app=celery_app)
+    state = result.state
+    payload = {'task_id': task_id, 'state': state}
+    if state in _UNATTRIBUTED_TASK_STATES:
+        return jsonify(payload)
+
+    outcome = owned_task_info(result)
+    if outcome is None:
+        return jsonify({'error': 'Tarefa não encontrada.'}), 404
+
+    if state == 'SUCCESS':
+        if outcome.get('error'):
+            payload['error'] = outcome['error']
+        else:
+            payload['message'] = 'Modelo de CoD treinado com sucesso.'
+            payload['model'] = outcome.get('model')
 
-        session.add(cod_model)
-        session.commit()
+    return jsonify(payload)
 
-        model_payload = {
-            'trained_at': cod_model.trained_at.isoformat() if cod_model.trained_at else None,
-            'sample_count': cod_model.sample_count,
-            'metrics': metrics_summary,
-            'feature_names': forecaster.feature_names,
-            'project_types': forecaster.project_types,
-        }
-    except Exception as exc:
-        session.rollback()
-        return jsonify({'error': f'Falha ao salvar o modelo treinado: {exc}'}), 500
-    finally:
-        session.close()
 
-    _cod_forecasters_by_user[user_id] = forecaster
+COD_PREDICT_REQUIRED_FIELDS = frozenset({
+    'budget_millions',
+    'duration_weeks',
+    'team_size',
+    'num_stakeholders',
+    'business_value',
+    'complexity',
+})
+# Numeric inputs coerced to float before they reach the forecaster
+COD_PREDICT_NUMERIC_FIELDS = COD_PREDICT_REQUIRED_FIELDS | {'risk_level'}
+COD_PREDICT_BATCH_MAX = 500
+
 
-    return jsonify({
-        'message': 'Modelo de CoD treinado com sucesso.',
-        'model': model_payload
-    })
+def parse_cod_prediction_input(data):
+    """
+    Validate a CoD prediction payload in a single pass.
+
+    Returns:
+        Tuple of (project dict with numeric fields as floats, error message).
+        Exactly one of the two is ``None``.
+    """
+    if not isinstance(data, dict):
+        return None, 'Request body must be a JSON object'
+
+    missing = COD_PREDICT_REQUIRED_FIELDS.difference(data)
+    if missing:
+        return None, f"Missing required fields: {', '.join(sorted(missing))}"
+
+    project = dict(data)
+    for field in COD_PREDICT_NUMERIC_FIELDS.intersection(project):
+        try:
+            project[field] = float(project[field])
+        except (TypeError, ValueError):
+            return None, f'Field {field} must be numeric'
+
+    return project, None
+
+
+def resolve_cod_prediction_forecaster():
+    """
+    Pick the forecaster for a prediction request, once per request.
+
+    Returns:
+        Tuple of (forecaster, None) or (None, error response) when the user's
+        model is missing, stale, or not trained yet.
+    """
+    user = current_user._get_current_object()
+    if getattr(user, 'is_authenticated', False):
+        training_state = get_user_cod_training_state(user.id)
+        if training_state is not None and not training_state.has_model:
+            return None, (jsonify({
+                'error': 'Carregue e treine seu modelo de CoD antes de realizar previsões.',
+                'retrain_required': True
+            }), 409)
+        if training_state is not None and cod_model_is_stale(training_state):
+            return None, (jsonify({
+                'error': 'Seu dataset foi atualizado. Re-treine o modelo para usar as previsões.',
+                'retrain_required': True
+            }), 409)
+
+    forecaster = get_cod_forecaster(user)
+    if not forecaster.trained:
+        return None, (jsonify({'error': 'CoD model not trained yet'}), 503)
+
+    return forecaster, None
 
 
 @app.route('/api/cod/predict', methods=['POST'])
@@ -6062,42 +6577,50 @@ def train_cod_model():
 def predict_cod():
     """Predict Cost of Delay for a project."""
     try:
-        data = request.json
+        project, error = parse_cod_prediction_input(request.get_json(silent=True))
+        if error:
+            return jsonify({'error': error}), 400
 
-        # Validate required fields
-        required = ['budget_millions', 'duration_weeks', 'team_size',
-                   'num_stakeholders', 'business_value', 'complexity']
-        for field in required:
-            if field not in data:
-                return jsonify({'error': f'Missing required field: {field}'}), 400
+        forecaster, blocked = resolve_cod_prediction_forecaster()
+        if blocked:
+            return blocked
 
-        if getattr(current_user, 'is_authenticated', False):
-            dataset, model = get_user_cod_assets(current_user.id)
-            if dataset and (not model or not model.model_blob):
-                return jsonify({
-                    'error': 'Carregue e treine seu modelo de CoD antes de realizar previsões.',
-                    'retrain_required': True
-                }), 409
-            if dataset and model and model.trained_at and dataset.created_at and dataset.created_at > model.trained_at:
-                return jsonify({
-                    'error': 'Seu dataset foi atualizado. Re-treine o modelo para usar as previsões.',
-                    'retrain_required': True
-                }), 409
+        # Predict
+        result = forecaster.predict_cod(project)
 
-        # Get forecaster
-        forecaster = get_cod_forecaster()
+        return jsonify(result)
 
-        if not forecaster.trained:
-            return jsonify({'error': 'CoD model not trained yet'}), 503
+    except Exception as e:
+        return internal_error_response(e)
 
-        # Predict
-        result = forecaster.predict_cod(data)
 
-        return jsonify(result)
+@app.route('/api/cod/predict_batch', methods=['POST'])
+@login_required
+def predict_cod_batch():
+    """Predict Cost of Delay for a list of projects in one model pass."""
+    try:
+        data = request.get_json(silent=True) or {}
+        raw_projects = data.get('projects') if isinstance(data, dict) else None
+        if not isinstance(raw_projects, list) or not raw_projects:
+            return jsonify({'error': 'projects must be a non-empty list'}), 400
+        if len(raw_projects) > COD_PREDICT_BATCH_MAX:
+            return jsonify({'error': f'At most {COD_PREDICT_BATCH_MAX} projects per batch'}), 400
+
+        projects = []
+        for index, raw_project in enumerate(raw_projects):
+            project, error = parse_cod_prediction_input(raw_project)
+            if error:
+                return jsonify({'error': f'Project {index}: {error}'}), 400
+            projects.append(project)
+
+        forecaster, blocked = resolve_cod_prediction_forecaster()
+        if blocked:
+            return blocked
+
+        return jsonify({'predictions': forecaster.predict_cod_batch(projects)})
 
     except Exception as e:
-        import traceback
-        return jsonify({'error': str(e), 'trace': traceback.format_exc()}), 500
+        return internal_error_response(e)
 
 
 @app.route('/api/cod/calculate_total', methods=['POST'])
@@ -6116,8 +6639,7 @@ def calculate_total_cod():
         return jsonify(result)
 
     except Exception as e:
-        import traceback
-        return jsonify({'error': str(e), 'trace': traceback.format_exc()}), 500
+        return internal_error_response(e)
 
 
 @app.route('/api/cod/feature_importance', methods=['GET'])
@@ -6126,10 +6648,10 @@ def cod_feature_importance():
     """Get feature importance for CoD model."""
     try:
         if getattr(current_user, 'is_authenticated', False):
-            dataset, model = get_user_cod_assets(current_user.id)
-            if dataset and (not model or not model.model_blob):
+            training_state = get_user_cod_training_state(current_user.id)
+            if training_state is not None and not training_state.has_model:
                 return jsonify({'error': 'Modelo ainda não treinado com o dataset atual.', 'retrain_required': True}), 409
-            if dataset and model and model.trained_at and dataset.created_at and dataset.created_at > model.trained_at:
+            if training_state is not None and cod_model_is_stale(training_state):
                 return jsonify({'error': 'Re-treine o modelo após atualizar o dataset.', 'retrain_required': True}), 409
 
         forecaster = get_cod_forecaster()
@@ -6147,8 +6669,7 @@ def cod_feature_importance():
         })
 
     except Exception as e:
-        import traceback
-        return jsonify({'error': str(e), 'trace': traceback.format_exc()}), 500
+        return internal_error_response(e)
 
 
 @app.route('/api/cod/model_info', methods=['GET'])
@@ -6160,8 +6681,8 @@ def cod_model_info():
         model_record = None
 
         if getattr(current_user, 'is_authenticated', False):
-            dataset, model_record = get_user_cod_assets(current_user.id)
-            if dataset and (not model_record or not model_record.model_blob):
+            dataset, model_record = get_user_cod_asset_metadata(current_user.id)
+            if dataset and (not model_record or not model_record.blob_len):
                 return jsonify({
                     'trained': False,
                     'error': 'Modelo ainda não treinado com o dataset atual.',
@@ -6191,7 +6712,7 @@ def cod_model_info():
                 'best_params': data.get('best_params'),
             }
 
-        source = 'custom' if model_record and model_record.model_blob else 'default'
+        source = 'custom' if model_record and model_record.blob_len else 'default'
 
         response = {
             'trained': True,
@@ -6204,7 +6725,7 @@ def cod_model_info():
         if model_record:
             response['trained_at'] = model_record.trained_at.isoformat() if model_record.trained_at else None
             response['sample_count'] = model_record.sample_count
-            response['metrics_snapshot'] = model_record.get_metrics()
+            response['metrics_snapshot'] = (model_record.model_meta or {}).get('metrics')
 
         if dataset:
             response['dataset'] = dataset.to_dict()
@@ -6212,8 +6733,7 @@ def cod_model_info():
         return jsonify(response)
 
     except Exception as e:
-        import traceback
-        return jsonify({'error': str(e), 'trace': traceback.format_exc()}), 500
+        return internal_error_response(e)
 
 
 # ============================================================================
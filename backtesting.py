@@ -6,7 +6,7 @@ import numpy as np
 from typing import List, Dict, Optional, Tuple
 from dataclasses import dataclass
 from datetime import datetime, timedelta
-from monte_carlo_unified import simulate_throughput_forecast, forecast_when
+from monte_carlo_unified import simulate_throughput_percentiles, forecast_when, simulation_rng
 from accuracy_metrics import calculate_accuracy_metrics, AccuracyMetrics
 
 
@@ -149,6 +149,7 @@ def run_walk_forward_backtest(
 
     tp_array = np.array(tp_samples, dtype=float)
     results = []
+    rng = simulation_rng()
 
     # Walk forward through the data with configurable stride
     # Start at min_train_size and advance by fold_stride each iteration
@@ -165,15 +166,16 @@ def run_walk_forward_backtest(
 
         try:
             # Make forecast using training data
-            mc_result = simulate_throughput_forecast(
+            percentile_stats = simulate_throughput_percentiles(
                 train_data,
                 backlog,
-                n_simulations
+                n_simulations,
+                rng=rng
             )
 
             # Get forecasted value based on confidence level
             percentile_key = confidence_level.lower()
-            forecasted_weeks = mc_result['percentile_stats'][percentile_key]
+            forecasted_weeks = percentile_stats[percentile_key]
 
             # Calculate actual weeks using test data
             # Average throughput from test period
@@ -268,6 +270,7 @@ def run_expanding_window_backtest(
 
     tp_array = np.array(tp_samples, dtype=float)
     results = []
+    rng = simulation_rng()
 
     # Start with initial_train_size and expand
     for i in range(initial_train_size, len(tp_array)):
@@ -279,14 +282,15 @@ def run_expanding_window_backtest(
 
         try:
             # Make forecast
-            mc_result = simulate_throughput_forecast(
+            percentile_stats = simulate_throughput_percentiles(
                 train_data,
                 backlog,
-                n_simulations
+                n_simulations,
+                rng=rng
             )
 
             percentile_key = confidence_level.lower()
-            forecasted_weeks = mc_result['percentile_stats'][percentile_key]
+            forecasted_weeks = percentile_stats[percentile_key]
 
             # Actual weeks based on next sample
             actual_throughput = test_data[0]
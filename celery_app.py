@@ -14,7 +14,7 @@ celery_app = Celery(
     'forecaster',
     broker=CELERY_BROKER_URL,
     backend=CELERY_RESULT_BACKEND,
-    include=['tasks.simulation_tasks']  # Auto-discover tasks
+    include=['tasks.simulation_tasks', 'tasks.cod_tasks', 'tasks.ml_tasks']  # Auto-discover tasks
 )
 
 # Celery configuration
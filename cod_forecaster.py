@@ -48,6 +48,7 @@ class CoDForecaster:
         self.feature_names = []
         self.project_types = []  # Store project types seen during training
         self.trained = False
+        self._feature_importance_cache = {}  # model_name -> importance DataFrame
 
     def prepare_features(self, projects_df: pd.DataFrame) -> Tuple[pd.DataFrame, pd.Series]:
         """
@@ -88,9 +89,11 @@ class CoDForecaster:
         features['stakeholder_density'] = projects_df['num_stakeholders'] / projects_df['team_size']
         features['value_per_week'] = projects_df['business_value'] / projects_df['duration_weeks']
 
-        # Calculate risk level if not provided
+        # Calculate risk level if not provided (per row, for mixed batches)
         if 'risk_level' not in projects_df.columns:
             projects_df['risk_level'] = projects_df.get('complexity', 3)
+        else:
+            projects_df['risk_level'] = projects_df['risk_level'].fillna(projects_df['complexity'])
 
         features['risk_complexity_score'] = projects_df['risk_level'] * projects_df['complexity']
 
@@ -275,6 +278,7 @@ class CoDForecaster:
 
         # Persist results
         self.models = models_results
+        self._feature_importance_cache = {}
 
         self.trained = True
         print(f"\n{'='*60}")
@@ -292,39 +296,60 @@ class CoDForecaster:
         Returns:
             Dictionary with CoD predictions
         """
+        return self.predict_cod_batch([project], model_name=model_name)[0]
+
+    def predict_cod_batch(self, projects: List[Dict], model_name: str = 'RandomForest') -> List[Dict]:
+        """
+        Predict Cost of Delay for several projects at once.
+
+        Features are built and scaled once for the whole batch and each model
+        runs a single ``predict`` over the full matrix.
+
+        Args:
+            projects: List of dictionaries with project characteristics
+            model_name: Name of model to use
+
+        Returns:
+            List of prediction dictionaries, in the same order as ``projects``
+        """
         if not self.trained:
             raise ValueError("Models not trained. Call train_models() first.")
 
-        # Prepare features
-        project_df = pd.DataFrame([project])
-        X, _ = self.prepare_features(project_df)
-        X_scaled = self.scaler.transform(X)
+        if model_name not in self.models:
+            raise KeyError(model_name)
 
-        # Predict with selected model
-        model = self.models[model_name]['model']
-        cod_weekly = model.predict(X_scaled)[0]
+        if not projects:
+            return []
 
-        # Get predictions from all models (for ensemble)
-        all_predictions = []
-        for m_name, m_data in self.models.items():
-            pred = m_data['model'].predict(X_scaled)[0]
-            all_predictions.append(pred)
+        # Prepare features
+        projects_df = pd.DataFrame(projects)
+        X, _ = self.prepare_features(projects_df)
+        X_scaled = self.scaler.transform(X)
 
-        cod_weekly_mean = np.mean(all_predictions)
-        cod_weekly_std = np.std(all_predictions)
-
-        return {
-            'cod_weekly': float(cod_weekly),
-            'cod_weekly_mean': float(cod_weekly_mean),
-            'cod_weekly_std': float(cod_weekly_std),
-            'cod_daily': float(cod_weekly / 7),
-            'cod_monthly': float(cod_weekly * 4.33),
-            'model_used': model_name,
-            'confidence_interval_95': (
-                float(cod_weekly_mean - 1.96 * cod_weekly_std),
-                float(cod_weekly_mean + 1.96 * cod_weekly_std)
-            )
-        }
+        # One prediction vector per model (rows: models, columns: projects)
+        all_predictions = np.vstack([
+            m_data['model'].predict(X_scaled) for m_data in self.models.values()
+        ])
+        selected = all_predictions[list(self.models).index(model_name)]
+
+        cod_weekly_mean = all_predictions.mean(axis=0)
+        cod_weekly_std = all_predictions.std(axis=0)
+
+        results = []
+        for cod_weekly, mean, std in zip(selected, cod_weekly_mean, cod_weekly_std):
+            results.append({
+                'cod_weekly': float(cod_weekly),
+                'cod_weekly_mean': float(mean),
+                'cod_weekly_std': float(std),
+                'cod_daily': float(cod_weekly / 7),
+                'cod_monthly': float(cod_weekly * 4.33),
+                'model_used': model_name,
+                'confidence_interval_95': (
+                    float(mean - 1.96 * std),
+                    float(mean + 1.96 * std)
+                )
+            })
+        return results
 
     def calculate_total_cod(self, cod_weekly: float, delay_weeks: float) -> Dict:
         """
@@ -354,11 +379,17 @@ class CoDForecaster:
             model_name: Name of model
 
         Returns:
-            DataFrame with feature importance
+            DataFrame with feature importance. The frame is memoized until the
+            next ``train_models`` call, so callers must not mutate it.
         """
         if not self.trained:
             raise ValueError("Models not trained.")
 
+        # Forecasters unpickled from older blobs predate the cache attribute
+        cache = self.__dict__.setdefault('_feature_importance_cache', {})
+        if model_name in cache:
+            return cache[model_name]
+
         model = self.models[model_name]['model']
 
         if hasattr(model, 'feature_importances_'):
@@ -368,10 +399,11 @@ class CoDForecaster:
                 'feature': self.feature_names,
                 'importance': importances
             }).sort_values('importance', ascending=False)
-
-            return importance_df
         else:
-            return None
+            importance_df = None
+
+        cache[model_name] = importance_df
+        return importance_df
 
 
 def generate_sample_cod_data(n_samples: int = 100) -> pd.DataFrame:
@@ -0,0 +1,288 @@
+"""
+Cost of Delay training data and model persistence.
+
+Validation and storage of user-uploaded CoD datasets, (de)serialization of
+trained forecasters, and the train-and-persist routine shared by the web
+endpoints and the Celery worker.
+"""
+
+import io
+import json
+import os
+import tempfile
+from datetime import datetime, timezone
+from typing import Any, Dict, Optional, Tuple
+
+import joblib
+import pandas as pd
+
+from cod_forecaster import CoDForecaster, generate_sample_cod_data
+from logger import get_logger
+from models import CoDModel, CoDTrainingDataset
+
+try:
+    import pyarrow  # noqa: F401 - backs DataFrame.to_feather/read_feather
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+logger = get_logger('cod_training')
+
+COD_REQUIRED_COLUMNS = {
+    'budget_millions',
+    'duration_weeks',
+    'team_size',
+    'num_stakeholders',
+    'business_value',
+    'complexity',
+    'cod_weekly',
+}
+COD_OPTIONAL_COLUMNS = {'project_type', 'risk_level'}
+COD_NUMERIC_COLUMNS = sorted(COD_REQUIRED_COLUMNS - {'project_type'})
+# Case-insensitive lookup used to canonicalize uploaded CoD column names
+_COD_CANONICAL_BY_LOWER = {col.lower(): col for col in COD_REQUIRED_COLUMNS | COD_OPTIONAL_COLUMNS}
+
+
+def dump_cod_forecaster(forecaster) -> bytes:
+    """
+    Serialize a trained CoD forecaster for ``CoDModel.model_blob``.
+
+    joblib with pickle protocol 5 writes NumPy buffers out-of-band instead of
+    copying them through intermediate ``bytes`` objects; compression is off
+    because load time matters more than blob size here.
+    """
+    buffer = io.BytesIO()
+    joblib.dump(forecaster, buffer, compress=0, protocol=5)
+    return buffer.getvalue()
+
+
+def load_cod_forecaster(blob: bytes):
+    """Deserialize a ``CoDModel.model_blob`` (joblib or legacy plain pickle)."""
+    return joblib.load(io.BytesIO(blob))
+
+
+def load_default_cod_forecaster(cache_path: Optional[str] = None) -> CoDForecaster:
+    """
+    Return the shared default CoD forecaster trained on synthetic data.
+
+    When ``cache_path`` points at a previously dumped forecaster it is loaded
+    instead of retraining; otherwise the forecaster is trained and written
+    there (atomically, so concurrent workers never read a partial file).
+
+    Args:
+        cache_path: Optional joblib file used to persist the default model
+
+    Returns:
+        Trained CoDForecaster
+    """
+    if cache_path and os.path.exists(cache_path):
+        try:
+            with open(cache_path, 'rb') as handle:
+                forecaster = load_cod_forecaster(handle.read())
+            if getattr(forecaster, 'trained', False):
+                logger.info(f"Loaded default CoD forecaster from {cache_path}")
+                return forecaster
+        except Exception as exc:
+            logger.warning(f"Ignoring unreadable default CoD model {cache_path}: {exc}")
+
+    forecaster = CoDForecaster()
+    forecaster.train_models(generate_sample_cod_data(n_samples=100))
+    logger.info("CoD Forecaster initialized with sample data")
+
+    if cache_path:
+        try:
+            directory = os.path.dirname(os.path.abspath(cache_path))
+            fd, tmp_path = tempfile.mkstemp(dir=directory, suffix='.tmp')
+            with os.fdopen(fd, 'wb') as handle:
+                handle.write(dump_cod_forecaster(forecaster))
+            os.chmod(tmp_path, 0o644)
+            os.replace(tmp_path, cache_path)
+        except OSError as exc:
+            logger.warning(f"Could not persist default CoD model to {cache_path}: {exc}")
+
+    return forecaster
+
+
+def fetch_user_cod_assets(session, user_id: int):
+    """Fetch persisted CoD dataset and model for a user in a single round-trip."""
+    row = (
+        session.query(CoDTrainingDataset, CoDModel)
+        .outerjoin(CoDModel, CoDModel.user_id == CoDTrainingDataset.user_id)
+        .filter(CoDTrainingDataset.user_id == user_id)
+        .order_by(CoDTrainingDataset.created_at.desc())
+        .first()
+    )
+    if row is not None:
+        return row[0], row[1]
+
+    model = (
+        session.query(CoDModel)
+        .filter(CoDModel.user_id == user_id)
+        .one_or_none()
+    )
+    return None, model
+
+
+def _normalize_cod_dataframe(df: pd.DataFrame) -> pd.DataFrame:
+    """Standardize column names for CoD datasets (renames ``df``'s columns in place)."""
+    df.columns = [str(col).strip() for col in df.columns]
+    rename_map = {
+        col: _COD_CANONICAL_BY_LOWER[col.lower()]
+        for col in df.columns
+        if _COD_CANONICAL_BY_LOWER.get(col.lower(), col) != col
+    }
+    return df.rename(columns=rename_map) if rename_map else df
+
+
+def _coerce_cod_numeric_columns(df: pd.DataFrame) -> pd.DataFrame:
+    """Parse the numeric CoD columns in one pass, skipping ones already numeric."""
+    pending = [col for col in COD_NUMERIC_COLUMNS if not pd.api.types.is_numeric_dtype(df[col])]
+    if pending:
+        df[pending] = df[pending].apply(pd.to_numeric, errors='coerce')
+    return df
+
+
+def load_cod_dataframe(file_storage) -> pd.DataFrame:
+    """Load and validate a CSV file containing CoD training data."""
+    try:
+        df = pd.read_csv(file_storage)
+    except Exception as exc:
+        raise ValueError(f'Não foi possível ler o CSV: {exc}')
+
+    df = _normalize_cod_dataframe(df)
+    missing = COD_REQUIRED_COLUMNS.difference(df.columns)
+    if missing:
+        raise ValueError(f'Colunas obrigatórias ausentes: {", ".join(sorted(missing))}')
+
+    df = _coerce_cod_numeric_columns(df)
+
+    valid_rows = (
+        df[COD_NUMERIC_COLUMNS].notna().all(axis=1)
+        & (df['team_size'] > 0)
+        & (df['duration_weeks'] > 0)
+        & (df['cod_weekly'] > 0)
+        & (df['num_stakeholders'] >= 0)
+    )
+    df = df[valid_rows]
+
+    if 'project_type' in df.columns:
+        df['project_type'] = df['project_type'].fillna('Unknown').astype(str)
+
+    if 'risk_level' in df.columns:
+        df['risk_level'] = pd.to_numeric(df['risk_level'], errors='coerce')
+        df = df.dropna(subset=['risk_level'])
+
+    df = df.reset_index(drop=True)
+
+    if len(df) < 10:
+        raise ValueError('É necessário pelo menos 10 linhas válidas para treinar o modelo.')
+
+    return df
+
+
+def store_cod_dataset_frame(dataset: CoDTrainingDataset, df: pd.DataFrame) -> None:
+    """
+    Persist a validated CoD DataFrame on ``dataset``.
+
+    Uses Feather (Arrow IPC) bytes when pyarrow is installed so dtypes survive
+    the round-trip; otherwise falls back to the legacy JSON records column.
+    """
+    if PYARROW_AVAILABLE:
+        buffer = io.BytesIO()
+        df.to_feather(buffer)
+        dataset.data_blob = buffer.getvalue()
+        dataset.data_format = 'feather'
+        dataset.data = ''
+    else:
+        dataset.data = df.to_json(orient='records')
+        dataset.data_format = 'json'
+        dataset.data_blob = None
+    dataset.column_names = json.dumps(df.columns.tolist())
+    dataset.row_count = len(df)
+
+
+def load_cod_dataset_frame(dataset: CoDTrainingDataset) -> pd.DataFrame:
+    """Rebuild the training DataFrame stored by ``store_cod_dataset_frame``."""
+    if dataset.data_format == 'feather' and dataset.data_blob:
+        # Stored after validation with dtypes intact: no renaming or coercion needed
+        return pd.read_feather(io.BytesIO(dataset.data_blob))
+
+    df = pd.DataFrame(json.loads(dataset.data))
+    df = _normalize_cod_dataframe(df)
+    df = _coerce_cod_numeric_columns(df)
+    return df.dropna(subset=COD_NUMERIC_COLUMNS)
+
+
+def summarize_cod_metrics(forecaster: CoDForecaster) -> Dict[str, Dict[str, Any]]:
+    """Extract JSON-safe validation metrics for each trained CoD model."""
+    return {
+        model_name: {
+            'mae': float(model_data['mae']),
+            'rmse': float(model_data['rmse']),
+            'r2': float(model_data['r2']),
+            'mape': float(model_data['mape']),
+            'best_params': model_data.get('best_params'),
+        }
+        for model_name, model_data in forecaster.models.items()
+    }
+
+
+def train_user_cod_model(session, user_id: int, full_search: bool = False) -> Tuple[CoDModel, CoDForecaster, Dict[str, Any]]:
+    """
+    Train a user's CoD model on their latest dataset and persist it.
+
+    Shared by the synchronous ``/api/cod/train`` route and the Celery task.
+
+    Args:
+        session: Database session used to read the dataset and store the model
+        user_id: Owner of the dataset/model
+        full_search: Run the wider hyperparameter search (30 vs 12 iterations)
+
+    Returns:
+        Tuple of (persisted CoDModel, trained forecaster, model payload for API responses)
+
+    Raises:
+        LookupError: If the user has not uploaded a dataset
+        ValueError: If the dataset cannot be used for training
+    """
+    dataset, cod_model = fetch_user_cod_assets(session, user_id)
+    if not dataset:
+        raise LookupError('Nenhum dataset encontrado. Faça upload de um CSV antes de treinar.')
+
+    df = load_cod_dataset_frame(dataset)
+    forecaster = CoDForecaster()
+    forecaster.train_models(
+        df,
+        use_hyperparam_search=True,
+        search_iterations=30 if full_search else 12
+    )
+    metrics_summary = summarize_cod_metrics(forecaster)
+
+    if cod_model is None:
+        cod_model = CoDModel(user_id=user_id)
+
+    cod_model.model_blob = dump_cod_forecaster(forecaster)
+    cod_model.model_meta = {
+        'metrics': metrics_summary,
+        'feature_names': list(forecaster.feature_names),
+        'project_types': list(forecaster.project_types),
+    }
+    cod_model.sample_count = len(df)
+    cod_model.trained_at = datetime.now(timezone.utc).replace(tzinfo=None)
+
+    try:
+        session.add(cod_model)
+        session.commit()
+    except Exception:
+        session.rollback()
+        raise
+
+    logger.info(f"Trained CoD model for user {user_id} on {len(df)} rows")
+    model_payload = {
+        'trained_at': cod_model.trained_at.isoformat() if cod_model.trained_at else None,
+        'sample_count': cod_model.sample_count,
+        'metrics': metrics_summary,
+        'feature_names': forecaster.feature_names,
+        'project_types': forecaster.project_types,
+    }
+    return cod_model, forecaster, model_payload
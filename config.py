@@ -30,6 +30,39 @@ class Config:
     CELERY_BROKER_URL = os.environ.get('CELERY_BROKER_URL', 'redis://localhost:6379/0')
     CELERY_RESULT_BACKEND = os.environ.get('CELERY_RESULT_BACKEND', 'redis://localhost:6379/0')
 
+    # Queue CoD model training on Celery instead of running it in the request.
+    # Defaults to on whenever a broker is explicitly configured.
+    ASYNC_COD_TRAINING = os.environ.get(
+        'FLOW_FORECASTER_ASYNC_COD_TRAINING',
+        'true' if os.environ.get('CELERY_BROKER_URL') else 'false'
+    ).lower() in ('1', 'true', 'yes')
+
+    # Same for the ML throughput forecast (K-Fold CV + walk-forward validation)
+    ASYNC_ML_FORECAST = os.environ.get(
+        'FLOW_FORECASTER_ASYNC_ML_FORECAST',
+        'true' if os.environ.get('CELERY_BROKER_URL') else 'false'
+    ).lower() in ('1', 'true', 'yes')
+
+    # Default (synthetic-data) CoD forecaster: train it at startup and reuse a
+    # dumped copy across restarts. Empty path means "next to app.py".
+    WARM_COD_DEFAULT_FORECASTER = os.environ.get(
+        'FLOW_FORECASTER_WARM_COD_DEFAULT', 'true'
+    ).lower() in ('1', 'true', 'yes')
+    COD_DEFAULT_MODEL_PATH = os.environ.get('FLOW_FORECASTER_COD_DEFAULT_MODEL', '')
+
+    # Worker processes for Monte Carlo jobs run alongside a request (e.g. the
+    # 30-day table in /api/simulate). 0 runs everything inline.
+    MC_POOL_WORKERS = int(os.environ.get('FLOW_FORECASTER_MC_POOL_WORKERS', '2'))
+
+    # Processes for the per-origin fits of ML walk-forward validation
+    # (joblib n_jobs: -1 = all cores, 1 = sequential). Kept small by default
+    # since each worker loads its own copy of scikit-learn.
+    ML_WALK_FORWARD_JOBS = int(os.environ.get('FLOW_FORECASTER_ML_WALK_FORWARD_JOBS', '2'))
+
+    # Threads rendering the independent charts of one response (ML, Monte
+    # Carlo, comparison, walk-forward). Below 2 they are drawn in order.
+    CHART_RENDER_THREADS = int(os.environ.get('FLOW_FORECASTER_CHART_RENDER_THREADS', '4'))
+
     # Compression settings
     COMPRESS_MIMETYPES = [
         'text/html', 'text/css', 'text/xml', 'application/json',
@@ -37,6 +70,11 @@ class Config:
     ]
     COMPRESS_LEVEL = 6  # Balance between speed and compression (1-9)
     COMPRESS_MIN_SIZE = 500  # Only compress responses > 500 bytes
+    # Prefer Brotli; at flask-compress's default quality 4 it is larger than gzip-6
+    # on simulate payloads, while quality 5 in text mode is ~6% smaller
+    COMPRESS_ALGORITHM = ['br', 'gzip']
+    COMPRESS_BR_LEVEL = 5
+    COMPRESS_BR_MODE = 1  # brotli.MODE_TEXT (UTF-8 JSON/HTML)
 
 
 # ============================================================================
@@ -59,9 +97,14 @@ class SimulationDefaults:
     # Backlog defaults
     DEFAULT_BACKLOG = 0
     MIN_BACKLOG = 0
+    MAX_BACKLOG = 100000
 
     # Throughput defaults
     MIN_THROUGHPUT_SAMPLES = 3  # Minimum samples required for simulation
+    MAX_THROUGHPUT_SAMPLES = 10000  # Larger payloads are rejected before any work
+
+    # Simulation runs encoded per chunk when streaming /api/simulate results
+    STREAM_CHUNK_ROWS = 1000
 
 
 # ============================================================================
@@ -201,6 +244,12 @@ class MLDefaults:
     MIN_FORECAST_DAYS = 1
     MAX_FORECAST_DAYS = 365
 
+    # Monte Carlo runs layered on the ML deadline forecast: stable throughput
+    # (low coefficient of variation) converges with far fewer runs
+    MIN_DEADLINE_SIMULATIONS = 200
+    MAX_DEADLINE_SIMULATIONS = 1000
+    DEADLINE_SIMULATIONS_PER_CV = 1500
+
 
 # ============================================================================
 # Cost of Delay (CoD) Defaults
@@ -346,6 +395,55 @@ class SecuritySettings:
     }
 
 
+# ============================================================================
+# Response Caching
+# ============================================================================
+
+class CacheSettings:
+    """In-process cache sizes and lifetimes."""
+
+    # Portfolio dashboard payloads (per user + filter combination)
+    PORTFOLIO_DASHBOARD_TTL = 30  # seconds
+    PORTFOLIO_DASHBOARD_MAXSIZE = 256
+
+    # Per-project health scores, keyed on project/forecast/actual revisions
+    PROJECT_HEALTH_TTL = 300  # seconds
+    PROJECT_HEALTH_MAXSIZE = 1024
+
+    # Unpickled per-user CoD forecasters; freshness is checked against
+    # CoDModel.trained_at on every lookup, so entries never need to expire
+    COD_FORECASTER_MAXSIZE = 64
+
+    # Browser cache lifetime for the static CoD sample CSV download
+    COD_SAMPLE_MAX_AGE = 86400  # seconds
+
+    # Monte Carlo / ML sub-results of /api/deadline-analysis, keyed on a
+    # digest of the numeric inputs
+    DEADLINE_ANALYSIS_TTL = 300  # seconds
+    DEADLINE_ANALYSIS_MAXSIZE = 128
+
+    # Monte Carlo results of /api/forecast-how-many and /api/forecast-when;
+    # charts and panel toggles re-post identical inputs
+    FORECAST_MC_TTL = 300  # seconds
+    FORECAST_MC_MAXSIZE = 256
+
+    # Full response bodies of the same endpoints and /api/cost-analysis, keyed
+    # by their ETag (a digest of the request body) so repeat POSTs skip the
+    # simulations and encoding
+    FORECAST_RESPONSE_TTL = 300  # seconds
+    FORECAST_RESPONSE_MAXSIZE = 256
+
+    # Trained MLForecaster instances keyed on the throughput history and
+    # model settings, so refreshes with unchanged samples skip K-Fold training
+    ML_FORECASTER_TTL = 600  # seconds
+    ML_FORECASTER_MAXSIZE = 64
+
+    # Users resolved by the Flask-Login user loader. The TTL bounds how long an
+    # account change made through another worker takes to be seen here.
+    USER_LOADER_TTL = 60  # seconds
+    USER_LOADER_MAXSIZE = 1024
+
+
 # ============================================================================
 # Rate Limiting (for future implementation)
 # ============================================================================
@@ -3,6 +3,8 @@ Cost Analysis using PERT-Beta Distribution
 Implements Monte Carlo simulation for cost forecasting based on PERT estimates
 """
 
+from functools import lru_cache
+
 import numpy as np
 import scipy.stats as stats
 from typing import Dict, Any, List, Tuple
@@ -210,6 +212,28 @@ def simulate_pert_beta_cost(
     }
 
 
+@lru_cache(maxsize=256)
+def _rate_breakdown(cost_per_person_week: float, currency: str) -> Dict[str, Any]:
+    """
+    Rate-only fields of the effort cost breakdown.
+
+    A deadline analysis prices several effort percentiles at the same rate, so
+    these are built once per (rate, currency). Callers must copy, not mutate.
+    """
+    cost_per_person_month = cost_per_person_week * 4.33  # Average weeks per month
+    cost_per_person_year = cost_per_person_week * 52  # Weeks per year
+
+    return {
+        'cost_per_person_week': float(cost_per_person_week),
+        'cost_per_person_month': float(cost_per_person_month),
+        'cost_per_person_year': float(cost_per_person_year),
+        'currency': currency,
+        'formatted_per_week': f"{currency} {cost_per_person_week:,.2f}",
+        'formatted_per_month': f"{currency} {cost_per_person_month:,.2f}",
+        'formatted_per_year': f"{currency} {cost_per_person_year:,.2f}"
+    }
+
+
 def calculate_effort_based_cost(
     effort_person_weeks: float,
     cost_per_person_week: float,
@@ -246,20 +270,12 @@ def calculate_effort_based_cost(
         }
     """
     total_cost = effort_person_weeks * cost_per_person_week
-    cost_per_person_month = cost_per_person_week * 4.33  # Average weeks per month
-    cost_per_person_year = cost_per_person_week * 52  # Weeks per year
 
     return {
         'total_cost': float(total_cost),
         'effort_person_weeks': float(effort_person_weeks),
-        'cost_per_person_week': float(cost_per_person_week),
-        'cost_per_person_month': float(cost_per_person_month),
-        'cost_per_person_year': float(cost_per_person_year),
-        'currency': currency,
         'formatted_total': f"{currency} {total_cost:,.2f}",
-        'formatted_per_week': f"{currency} {cost_per_person_week:,.2f}",
-        'formatted_per_month': f"{currency} {cost_per_person_month:,.2f}",
-        'formatted_per_year': f"{currency} {cost_per_person_year:,.2f}"
+        **_rate_breakdown(cost_per_person_week, currency)
     }
 
 
@@ -306,7 +322,7 @@ def calculate_effort_based_cost_with_percentiles(
 
     results['cost_per_person_week'] = cost_per_person_week
     results['currency'] = currency
-    results['formatted_rate'] = f"{currency} {cost_per_person_week:,.2f}/semana"
+    results['formatted_rate'] = f"{_rate_breakdown(cost_per_person_week, currency)['formatted_per_week']}/semana"
 
     return results
 
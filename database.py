@@ -108,6 +108,53 @@ def ensure_schema():
                     if hydration:
                         connection.execute(text(hydration))
 
+        if 'cod_training_datasets' in table_names:
+            existing_dataset_columns = {col['name'] for col in inspector.get_columns('cod_training_datasets')}
+            blob_type = 'BYTEA' if is_postgresql else 'BLOB'
+            dataset_columns = [
+                (
+                    'data_format',
+                    "ALTER TABLE cod_training_datasets ADD COLUMN data_format VARCHAR(20) DEFAULT 'json'",
+                    "UPDATE cod_training_datasets SET data_format = 'json' WHERE data_format IS NULL",
+                ),
+                ('data_blob', f"ALTER TABLE cod_training_datasets ADD COLUMN data_blob {blob_type}", None),
+            ]
+            for column_name, ddl, hydration in dataset_columns:
+                if column_name not in existing_dataset_columns:
+                    connection.execute(text(ddl))
+                    existing_dataset_columns.add(column_name)
+                    if hydration:
+                        connection.execute(text(hydration))
+
+        if 'cod_models' in table_names:
+            existing_cod_model_columns = {col['name'] for col in inspector.get_columns('cod_models')}
+            cod_model_columns = [
+                (
+                    'model_meta',
+                    "ALTER TABLE cod_models ADD COLUMN model_meta TEXT",
+                    (
+                        "UPDATE cod_models SET model_meta = "
+                        "'{\"metrics\": ' || COALESCE(metrics, 'null') || "
+                        "', \"feature_names\": ' || COALESCE(feature_names, 'null') || "
+                        "', \"project_types\": ' || COALESCE(project_types, 'null') || '}' "
+                        "WHERE model_meta IS NULL"
+                    ),
+                ),
+            ]
+            for column_name, ddl, hydration in cod_model_columns:
+                if column_name not in existing_cod_model_columns:
+                    connection.execute(text(ddl))
+                    existing_cod_model_columns.add(column_name)
+                    if hydration:
+                        connection.execute(text(hydration))
+
+        if 'actuals' in table_names:
+            existing_actual_indexes = {index['name'] for index in inspector.get_indexes('actuals')}
+            if 'ix_actuals_forecast_recorded_at' not in existing_actual_indexes:
+                connection.execute(text(
+                    "CREATE INDEX ix_actuals_forecast_recorded_at ON actuals (forecast_id, recorded_at)"
+                ))
+
         if 'users' in table_names:
             existing_user_columns = {col['name'] for col in inspector.get_columns('users')}
 
@@ -186,12 +233,18 @@ def ensure_schema():
 
 
 def get_session():
-    """Get a new database session."""
+    """
+    Get the session bound to the current thread/request.
+
+    Sessions come from a scoped registry, so repeated calls within a request
+    share one session. Callers should not close it themselves; the Flask
+    app removes it at teardown via close_session().
+    """
     return Session()
 
 
 def close_session():
-    """Close the current session."""
+    """Close the current scoped session and discard it from the registry."""
     Session.remove()
 
 
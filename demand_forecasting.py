@@ -221,8 +221,10 @@ class DemandForecastService:
             "history_points": length,
             "horizon": horizon,
             "dates": [ts.strftime("%Y-%m-%d") for ts in future_index],
-            "forecasts": {name: arr.tolist() for name, arr in forecasts.items()},
-            "ensemble": {key: value.tolist() for key, value in ensemble.items()},
+            # generate() converts the whole payload once; _to_native turns
+            # each array into a list in a single tolist() call
+            "forecasts": forecasts,
+            "ensemble": ensemble,
             "model_results": model_results,
             "risk": _to_native(risk_assessment),
             "summary": {
@@ -10,11 +10,13 @@ import statistics
 from typing import Dict, List, Optional, Any
 from datetime import datetime, timedelta
 
+from config import MLDefaults
 from ml_forecaster import MLForecaster
 from monte_carlo_unified import (
     calculate_contributors_distribution,
     random_sample_average,
-    random_integer
+    random_integer,
+    simulation_rng
 )
 
 
@@ -46,7 +48,8 @@ class MLDeadlineForecaster:
             split_rate_samples: Split rate samples
             dependencies: List of dependency dictionaries (optional)
         """
-        self.tp_samples = tp_samples
+        # Converted once; training and every forecast reuse the same array
+        self.tp_samples = np.ascontiguousarray(tp_samples, dtype=np.float64)
         self.team_size = team_size if team_size is not None else 1
         self.min_contributors = min_contributors if min_contributors is not None else self.team_size
         self.max_contributors = max_contributors if max_contributors is not None else self.team_size
@@ -138,11 +141,11 @@ class MLDeadlineForecaster:
         print(f"[CACHE] Training ML models for the first time...", flush=True)
 
         # Train ML models WITHOUT Grid Search (faster for low-memory environments)
-        self.ml_forecaster.train_models(np.array(self.tp_samples), use_kfold_cv=False)
+        self.ml_forecaster.train_models(self.tp_samples, use_kfold_cv=False)
 
         # Get ML forecast (ensemble of all models) and cache it
         self._cached_forecasts = self.ml_forecaster.forecast(
-            np.array(self.tp_samples),
+            self.tp_samples,
             steps=forecast_steps,
             model_name='ensemble'
         )
@@ -180,7 +183,12 @@ class MLDeadlineForecaster:
         completion_times = []
         effort_totals = []
 
+        # Standard-normal noise for every simulated week, drawn in one batch
+        # and scaled by the ensemble std below
+        noise = simulation_rng().standard_normal((n_simulations, forecast_steps * 2))
+
         for sim in range(n_simulations):
+            sim_noise = noise[sim]
             # Apply split rate
             split_rate = self._apply_split_rate()
             total_tasks = backlog * split_rate
@@ -198,12 +206,12 @@ class MLDeadlineForecaster:
                 if week < forecast_steps:
                     # Use ML forecast (with some random variation)
                     base_tp = ensemble_stats['mean'][week]
-                    variation = np.random.normal(0, ensemble_stats['std'][week])
+                    variation = ensemble_stats['std'][week] * sim_noise[week]
                     forecast_tp = max(0, base_tp + variation)
                 else:
                     # Extend using last forecast value
                     base_tp = ensemble_stats['mean'][-1]
-                    forecast_tp = max(0, base_tp + np.random.normal(0, ensemble_stats['std'][-1]))
+                    forecast_tp = max(0, base_tp + ensemble_stats['std'][-1] * sim_noise[week])
 
                 # Apply team dynamics
                 percent_complete = ((total_tasks - remaining) / total_tasks * 100) if total_tasks > 0 else 0
@@ -255,6 +263,24 @@ class MLDeadlineForecaster:
 # ML DEADLINE ANALYSIS FUNCTIONS
 # ============================================================================
 
+def deadline_simulation_count(tp_samples: List[float], requested: int) -> int:
+    """
+    Number of simulations to run for the ML deadline analysis.
+
+    Scales with the coefficient of variation of the throughput history:
+    ``MIN + PER_CV * cv`` clipped to ``[MIN, MAX]`` runs, never above
+    ``requested``.
+    """
+    tp = np.asarray(tp_samples, dtype=float)
+    cv = float(tp.std() / max(tp.mean(), 1e-9)) if tp.size else 1.0
+    budget = int(np.clip(
+        MLDefaults.MIN_DEADLINE_SIMULATIONS + MLDefaults.DEADLINE_SIMULATIONS_PER_CV * cv,
+        MLDefaults.MIN_DEADLINE_SIMULATIONS,
+        MLDefaults.MAX_DEADLINE_SIMULATIONS
+    ))
+    return min(requested, budget)
+
+
 def ml_analyze_deadline(
     tp_samples: List[float],
     backlog: int,
@@ -463,7 +489,7 @@ def ml_forecast_how_many(
         # Need to generate forecasts for the required horizon
         print(f"[CACHE] Generating new forecasts for {weeks} weeks", flush=True)
         ml_forecasts = forecaster.ml_forecaster.forecast(
-            np.array(tp_samples),
+            forecaster.tp_samples,
             steps=weeks,
             model_name='ensemble'
         )
@@ -471,15 +497,17 @@ def ml_forecast_how_many(
 
     # Simulate total items
     items_completed = []
+    noise = simulation_rng().standard_normal((n_simulations, max(weeks, 0)))
 
     for sim in range(n_simulations):
         total_items = 0
+        sim_noise = noise[sim]
 
         for week_idx in range(weeks):
             # ML forecast with variation
             if week_idx < len(ensemble_stats['mean']):
                 base_tp = ensemble_stats['mean'][week_idx]
-                variation = np.random.normal(0, ensemble_stats['std'][week_idx])
+                variation = ensemble_stats['std'][week_idx] * sim_noise[week_idx]
                 forecast_tp = max(0, base_tp + variation)
             else:
                 forecast_tp = ensemble_stats['mean'][-1]
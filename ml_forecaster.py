@@ -3,6 +3,7 @@ ML Forecaster Module
 Implements Machine Learning models for throughput forecasting
 """
 
+import os
 import numpy as np
 import pandas as pd
 from typing import Dict, Tuple, List, Optional
@@ -19,6 +20,9 @@ from sklearn.neighbors import KNeighborsRegressor
 from sklearn.pipeline import Pipeline
 from sklearn.preprocessing import StandardScaler
 from sklearn.svm import SVR
+from joblib import Parallel, delayed
+
+from config import Config
 
 try:
     from xgboost import XGBRegressor
@@ -36,6 +40,41 @@ except ImportError:
 
 warnings.filterwarnings('ignore')
 
+# Worker processes for walk-forward validation fits (joblib semantics: -1 uses
+# every core, 1 keeps it sequential); fewer jobs than the minimum run inline
+WALK_FORWARD_N_JOBS = Config.ML_WALK_FORWARD_JOBS or 1
+WALK_FORWARD_MIN_PARALLEL_JOBS = 4
+
+
+def _walk_forward_origin(max_lag: int, base_model, data: np.ndarray,
+                         origin: int, steps: int) -> Tuple[Optional[np.ndarray], Optional[str]]:
+    """
+    Fit a fresh copy of ``base_model`` on ``data[:origin]`` and forecast ``steps`` ahead.
+
+    Module-level so joblib can ship it to worker processes. Failures are
+    returned as messages instead of raised, so one bad origin does not abort
+    the whole batch.
+
+    Returns:
+        (forecast, None) on success, (None, None) when no lag features could
+        be built, or (None, error message) when fitting/forecasting failed
+    """
+    helper = MLForecaster(max_lag=max_lag)
+    train_data = data[:origin]
+    try:
+        X_train, y_train = helper.prepare_features(train_data)
+        if len(X_train) == 0:
+            return None, None
+
+        wf_model = clone(base_model)
+        helper._ensure_valid_neighbors(wf_model, len(X_train))
+        wf_model.fit(X_train, y_train)
+
+        history_slice = train_data[-(max_lag + 3):]
+        return helper._forecast_with_model(wf_model, history_slice, steps), None
+    except Exception as exc:
+        return None, str(exc)
+
 
 class MLForecaster:
     """Machine Learning forecasting for throughput prediction"""
@@ -711,9 +750,29 @@ class MLForecaster:
         print(f"Forecast horizon per origin: {forecast_steps}")
         print(f"{'=' * 60}\n")
 
+        # Every (model, origin) fit is independent: collect them all first so
+        # they can be spread over worker processes
+        origins: List[Tuple[int, int]] = []
+        for origin in range(n_train, n_samples, forecast_steps):
+            steps_to_forecast = min(forecast_steps, n_samples - origin)
+            if steps_to_forecast <= 0:
+                break
+            origins.append((origin, steps_to_forecast))
+
+        jobs = [
+            (model_name, origin, steps)
+            for model_name in self.models
+            for origin, steps in origins
+            if origin >= self.max_lag + 3
+        ]
+        outcomes = dict(zip(
+            ((model_name, origin) for model_name, origin, _ in jobs),
+            self._run_walk_forward_jobs(data, jobs)
+        ))
+
         wf_results: Dict[str, Dict] = {}
 
-        for model_name, base_model in self.models.items():
+        for model_name in self.models:
             print(f"\n{model_name} - Walk-Forward Validation:")
             print("-" * 60)
 
@@ -723,65 +782,45 @@ class MLForecaster:
             forecast_origins: List[int] = []
             per_origin: List[Dict] = []
 
-            for origin in range(n_train, n_samples, forecast_steps):
-                train_data = data[:origin]
-
-                if len(train_data) < self.max_lag + 3:
+            for origin, steps_to_forecast in origins:
+                if (model_name, origin) not in outcomes:
                     print(f"Skipping origin {origin}: insufficient training history.")
                     continue
 
-                remaining_samples = n_samples - origin
-                steps_to_forecast = min(forecast_steps, remaining_samples)
-                if steps_to_forecast <= 0:
-                    break
+                forecast_values, error = outcomes[(model_name, origin)]
+                if error is not None:
+                    print(f"Warning: Forecast failed at origin {origin}: {error}")
+                    continue
+                if forecast_values is None:
+                    print(f"Skipping origin {origin}: no features after lag preparation.")
+                    continue
 
                 actual_values = data[origin:origin + steps_to_forecast]
                 origin_indices = list(range(origin, origin + steps_to_forecast))
 
-                try:
-                    X_train, y_train = self.prepare_features(train_data)
-                    if len(X_train) == 0:
-                        print(f"Skipping origin {origin}: no features after lag preparation.")
-                        continue
-
-                    wf_model = clone(base_model)
-                    self._ensure_valid_neighbors(wf_model, len(X_train))
-                    wf_model.fit(X_train, y_train)
-
-                    history_slice = train_data[-(self.max_lag + 3):]
-                    forecast_values = self._forecast_with_model(
-                        wf_model,
-                        history_slice,
-                        steps_to_forecast
-                    )
-
-                    origin_mae = mean_absolute_error(actual_values, forecast_values)
-                    origin_rmse = np.sqrt(mean_squared_error(actual_values, forecast_values))
-                    origin_mape = float(np.mean(
-                        np.abs(actual_values - forecast_values) /
-                        np.maximum(np.abs(actual_values), 1e-3)
-                    ) * 100)
-
-                    predictions.extend(forecast_values.tolist())
-                    actuals.extend(actual_values.tolist())
-                    indices.extend(origin_indices)
-                    forecast_origins.append(origin)
-                    per_origin.append({
-                        'origin': origin,
-                        'indices': origin_indices,
-                        'steps': steps_to_forecast,
-                        'actual': actual_values.tolist(),
-                        'predicted': forecast_values.tolist(),
-                        'mae': float(origin_mae),
-                        'rmse': float(origin_rmse),
-                        'mape': origin_mape
-                    })
-
-                    print(f"Origin {origin}: steps={steps_to_forecast} | MAE={origin_mae:.3f} | RMSE={origin_rmse:.3f} | MAPE={origin_mape:.2f}%")
-
-                except Exception as exc:
-                    print(f"Warning: Forecast failed at origin {origin}: {exc}")
-                    continue
+                origin_mae = mean_absolute_error(actual_values, forecast_values)
+                origin_rmse = np.sqrt(mean_squared_error(actual_values, forecast_values))
+                origin_mape = float(np.mean(
+                    np.abs(actual_values - forecast_values) /
+                    np.maximum(np.abs(actual_values), 1e-3)
+                ) * 100)
+
+                predictions.extend(forecast_values.tolist())
+                actuals.extend(actual_values.tolist())
+                indices.extend(origin_indices)
+                forecast_origins.append(origin)
+                per_origin.append({
+                    'origin': origin,
+                    'indices': origin_indices,
+                    'steps': steps_to_forecast,
+                    'actual': actual_values.tolist(),
+                    'predicted': forecast_values.tolist(),
+                    'mae': float(origin_mae),
+                    'rmse': float(origin_rmse),
+                    'mape': origin_mape
+                })
+
+                print(f"Origin {origin}: steps={steps_to_forecast} | MAE={origin_mae:.3f} | RMSE={origin_rmse:.3f} | MAPE={origin_mape:.2f}%")
 
             if predictions and actuals:
                 predictions_np = np.array(predictions, dtype=float)
@@ -857,6 +896,29 @@ class MLForecaster:
 
         return wf_results
 
+    def _run_walk_forward_jobs(self, data: np.ndarray,
+                               jobs: List[Tuple[str, int, int]]) -> List[Tuple[Optional[np.ndarray], Optional[str]]]:
+        """
+        Fit and forecast every walk-forward (model, origin, steps) job.
+
+        Jobs run in ``WALK_FORWARD_N_JOBS`` joblib worker processes on
+        multi-core hosts when there are enough of them to pay for the
+        dispatch, sequentially otherwise.
+
+        Returns:
+            One (forecast, error message) pair per job, in job order
+        """
+        n_jobs = WALK_FORWARD_N_JOBS
+        calls = (
+            (self.max_lag, self.models[model_name], data, origin, steps)
+            for model_name, origin, steps in jobs
+        )
+        if n_jobs == 1 or (os.cpu_count() or 1) < 2 or len(jobs) < WALK_FORWARD_MIN_PARALLEL_JOBS:
+            return [_walk_forward_origin(*args) for args in calls]
+        return Parallel(n_jobs=n_jobs, prefer='processes')(
+            delayed(_walk_forward_origin)(*args) for args in calls
+        )
+
     def assess_forecast_risk(self, data: np.ndarray) -> Dict:
         """
         Assess risk of using ML forecasts based on data characteristics.
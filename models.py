@@ -4,7 +4,8 @@ SQLAlchemy models for persisting forecasts, projects, and actuals
 """
 from datetime import datetime, timedelta
 import secrets
-from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, ForeignKey, Boolean, LargeBinary
+from sqlalchemy import create_engine, Column, Integer, String, Float, DateTime, Text, ForeignKey, Boolean, LargeBinary, Index
+from sqlalchemy.types import TypeDecorator
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship, sessionmaker
 from flask_login import UserMixin
@@ -14,6 +15,28 @@ import json
 Base = declarative_base()
 
 
+class JSONEncodedText(TypeDecorator):
+    """
+    JSON value stored in a TEXT column.
+
+    SQLAlchemy encodes on write and decodes once when the row is loaded, so
+    callers work with Python lists/dicts. Storage is identical to the
+    hand-encoded JSON text columns, so existing rows need no migration.
+    """
+    impl = Text
+    cache_ok = True
+
+    def process_bind_param(self, value, dialect):
+        if value is None:
+            return None
+        return json.dumps(value)
+
+    def process_result_value(self, value, dialect):
+        if not value:
+            return None
+        return json.loads(value)
+
+
 class User(Base, UserMixin):
     """User entity for authentication and multi-tenancy"""
     __tablename__ = 'users'
@@ -118,27 +141,37 @@ class Project(Base):
     user = relationship('User', back_populates='projects')
     forecasts = relationship('Forecast', back_populates='project', cascade='all, delete-orphan')
 
-    def to_dict(self):
-        return {
-            'id': self.id,
-            'name': self.name,
-            'description': self.description,
-            'team_size': self.team_size,
-            'status': self.status,
-            'priority': self.priority,
-            'business_value': self.business_value,
-            'risk_level': self.risk_level,
-            'capacity_allocated': self.capacity_allocated,
-            'strategic_importance': self.strategic_importance,
-            'start_date': self.start_date,
-            'target_end_date': self.target_end_date,
-            'owner': self.owner,
-            'stakeholder': self.stakeholder,
-            'tags': json.loads(self.tags) if self.tags else [],
-            'created_at': self.created_at.isoformat() if self.created_at else None,
-            'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'forecasts_count': len(self.forecasts) if self.forecasts else 0
-        }
+    # Columns serialized by to_dict(), in output order
+    DICT_COLUMNS = (
+        'id', 'name', 'description', 'team_size', 'status', 'priority',
+        'business_value', 'risk_level', 'capacity_allocated', 'strategic_importance',
+        'start_date', 'target_end_date', 'owner', 'stakeholder', 'tags',
+        'created_at', 'updated_at'
+    )
+
+    @classmethod
+    def dict_columns(cls):
+        """Column attributes for selecting exactly what to_dict() needs."""
+        return tuple(getattr(cls, name) for name in cls.DICT_COLUMNS)
+
+    @classmethod
+    def row_to_dict(cls, row, forecasts_count=0):
+        """Serialize a row selected with dict_columns() without building an ORM instance."""
+        data = dict(zip(cls.DICT_COLUMNS, row))
+        data['tags'] = json.loads(data['tags']) if data['tags'] else []
+        data['created_at'] = data['created_at'].isoformat() if data['created_at'] else None
+        data['updated_at'] = data['updated_at'].isoformat() if data['updated_at'] else None
+        data['forecasts_count'] = forecasts_count
+        return data
+
+    def to_dict(self, forecasts_count=None):
+        """Serialize the project; pass ``forecasts_count`` to avoid loading the forecasts."""
+        if forecasts_count is None:
+            forecasts_count = len(self.forecasts) if self.forecasts else 0
+        return self.row_to_dict(
+            [getattr(self, name) for name in self.DICT_COLUMNS],
+            forecasts_count
+        )
 
 
 class Forecast(Base):
@@ -237,6 +270,11 @@ class Actual(Base):
     # Relationship
     forecast = relationship('Forecast', back_populates='actuals')
 
+    __table_args__ = (
+        # Serves the newest-first listing per forecast without a sort step
+        Index('ix_actuals_forecast_recorded_at', 'forecast_id', 'recorded_at'),
+    )
+
     def to_dict(self):
         return {
             'id': self.id,
@@ -379,7 +417,9 @@ class CoDTrainingDataset(Base):
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False, index=True)
     name = Column(String(200), nullable=True)
     original_filename = Column(String(255), nullable=False)
-    data = Column(Text, nullable=False)  # JSON array of records
+    data = Column(Text, nullable=False)  # JSON array of records (empty when data_format='feather')
+    data_format = Column(String(20), nullable=False, default='json')  # 'json' or 'feather'
+    data_blob = Column(LargeBinary, nullable=True)  # Arrow IPC (Feather) bytes
     column_names = Column(Text, nullable=False)  # JSON array of column names
     row_count = Column(Integer, nullable=False)
     created_at = Column(DateTime, default=datetime.utcnow)
@@ -480,16 +520,19 @@ class CoDModel(Base):
     user_id = Column(Integer, ForeignKey('users.id'), nullable=False, unique=True, index=True)
     model_blob = Column(LargeBinary, nullable=False)
     scaler_blob = Column(LargeBinary, nullable=True)
-    feature_names = Column(Text, nullable=True)  # JSON array
-    project_types = Column(Text, nullable=True)  # JSON array
+    # Legacy per-field columns; superseded by model_meta and no longer written
+    feature_names = Column(JSONEncodedText, nullable=True)  # list of str
+    project_types = Column(JSONEncodedText, nullable=True)  # list of str
     metrics = Column(Text, nullable=True)  # JSON summary
+    # {"metrics": {...}, "feature_names": [...], "project_types": [...]}
+    model_meta = Column(JSONEncodedText, nullable=True)
     sample_count = Column(Integer, nullable=True)
     trained_at = Column(DateTime, default=datetime.utcnow)
 
     user = relationship('User', back_populates='cod_model')
 
     def get_metrics(self):
-        return json.loads(self.metrics) if self.metrics else None
+        return (self.model_meta or {}).get('metrics')
 
 
 class PortfolioRisk(Base):
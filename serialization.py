@@ -0,0 +1,54 @@
+"""
+JSON-safe conversion of NumPy results shared by the web app and Celery tasks.
+"""
+
+from math import isfinite
+
+import numpy as np
+
+# Leaf types that are already JSON-native and pass through untouched
+_PASSTHROUGH_TYPES = frozenset({str, int, bool, type(None)})
+
+
+def convert_to_native_types(obj):
+    """Convert numpy types to native Python types for JSON serialization."""
+    # Exact-type dispatch for the common leaves and containers first, so big
+    # nested payloads skip the isinstance chain below for every element
+    cls = type(obj)
+    if cls in _PASSTHROUGH_TYPES:
+        return obj
+    if cls is float:
+        return obj if isfinite(obj) else None
+    if cls is dict:
+        return {key: convert_to_native_types(value) for key, value in obj.items()}
+    if cls is list:
+        return [convert_to_native_types(item) for item in obj]
+
+    if isinstance(obj, np.ndarray):
+        kind = obj.dtype.kind
+        if kind == 'f':
+            # Sanitize NaN/Inf in one vectorized pass instead of per element
+            non_finite = ~np.isfinite(obj)
+            if non_finite.any():
+                cleaned = obj.astype(object)
+                cleaned[non_finite] = None
+                return cleaned.tolist()
+            return obj.tolist()
+        if kind in 'iub':
+            return obj.tolist()
+        return [convert_to_native_types(item) for item in obj.tolist()]
+    elif isinstance(obj, np.integer):
+        return int(obj)
+    elif isinstance(obj, np.floating):
+        value = float(obj)
+        return value if isfinite(value) else None
+    elif isinstance(obj, np.bool_):
+        return bool(obj)
+    elif isinstance(obj, float):
+        return obj if isfinite(obj) else None
+    elif isinstance(obj, dict):
+        return {key: convert_to_native_types(value) for key, value in obj.items()}
+    elif isinstance(obj, list):
+        return [convert_to_native_types(item) for item in obj]
+    else:
+        return obj
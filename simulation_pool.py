@@ -0,0 +1,89 @@
+"""
+Process pool for running independent Monte Carlo jobs alongside a request.
+
+Simulations are CPU-bound pure Python/NumPy loops, so overlapping two of them
+in threads gains nothing under the GIL. Jobs submitted here run in a small
+lazily-created process pool; when the pool is disabled, unavailable or broken
+the job simply runs inline in the caller.
+"""
+
+import os
+import random
+import threading
+from concurrent.futures import Future, ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Any, Callable, Optional
+
+import numpy as np
+
+from config import Config
+from logger import get_logger
+
+logger = get_logger('simulation_pool')
+
+_pool: Optional[ProcessPoolExecutor] = None
+_pool_lock = threading.Lock()
+
+
+def _reseed_worker():
+    """Give each worker its own random streams instead of the parent's forked state."""
+    random.seed()
+    np.random.seed()
+
+
+def _get_pool() -> Optional[ProcessPoolExecutor]:
+    """Create the shared pool on first use; ``None`` when it is disabled."""
+    global _pool
+    workers = Config.MC_POOL_WORKERS
+    if workers < 1 or (os.cpu_count() or 1) < 2:
+        return None
+    with _pool_lock:
+        if _pool is None:
+            _pool = ProcessPoolExecutor(max_workers=workers, initializer=_reseed_worker)
+        return _pool
+
+
+def _discard_pool():
+    """Drop a broken pool so the next submission starts a fresh one."""
+    global _pool
+    with _pool_lock:
+        broken, _pool = _pool, None
+    if broken is not None:
+        broken.shutdown(wait=False, cancel_futures=True)
+
+
+def submit_simulation(fn: Callable[..., Any], **kwargs) -> Optional[Future]:
+    """
+    Start ``fn(**kwargs)`` in the process pool.
+
+    ``fn`` must be a module-level function and ``kwargs`` picklable.
+
+    Returns:
+        The pending Future, or ``None`` when the job should run inline.
+    """
+    pool = _get_pool()
+    if pool is None:
+        return None
+    try:
+        return pool.submit(fn, **kwargs)
+    except (BrokenProcessPool, RuntimeError) as exc:
+        logger.warning(f"Simulation pool unavailable, running inline: {exc}")
+        _discard_pool()
+        return None
+
+
+def collect_simulation(future: Optional[Future], fn: Callable[..., Any], **kwargs) -> Any:
+    """
+    Return the result of a job started with :func:`submit_simulation`.
+
+    Falls back to calling ``fn(**kwargs)`` in-process when nothing was
+    submitted or the worker process died.
+    """
+    if future is None:
+        return fn(**kwargs)
+    try:
+        return future.result()
+    except BrokenProcessPool as exc:
+        logger.warning(f"Simulation worker died, rerunning inline: {exc}")
+        _discard_pool()
+        return fn(**kwargs)
@@ -527,6 +527,58 @@ $(document).ready(function() {
         $container.show();
     }
 
+    const ML_FORECAST_POLL_INTERVAL_MS = 2000;
+    // Matches the worker's 10-minute hard time limit; a task still pending
+    // after that was lost (no worker or expired result backend)
+    const ML_FORECAST_MAX_POLL_ATTEMPTS = 300;
+
+    function renderMLForecast(data, forecastSteps) {
+        hideLoading();
+        $('#results-container').show();
+        $('#ml-results').show();
+        $('#mc-results').hide();
+        $('#comparison-results').hide();
+
+        // Display results
+        displayRiskAssessment(data.risk_assessment);
+        displayModelPerformance(data.model_results);
+        $('#ml-chart').attr('src', data.charts.ml_forecast);
+        $('#history-chart').attr('src', data.charts.historical_analysis);
+        displayWalkForwardResults(data.walk_forward, forecastSteps);
+
+        if (window.renderInputStats) {
+            window.renderInputStats('#advanced-input-stats', null, { showLeadTime: false });
+        }
+    }
+
+    function pollMLForecast(pollUrl, forecastSteps, attempt) {
+        attempt = attempt || 1;
+        $.ajax({
+            url: pollUrl,
+            method: 'GET',
+            success: function(response) {
+                if (response.state === 'SUCCESS' || response.state === 'FAILURE') {
+                    if (response.result) {
+                        renderMLForecast(response.result, forecastSteps);
+                    } else {
+                        displayError(response.error || 'Unknown error occurred');
+                    }
+                    return;
+                }
+                if (attempt >= ML_FORECAST_MAX_POLL_ATTEMPTS) {
+                    displayError('ML forecast timed out waiting for the worker. Please try again.');
+                    return;
+                }
+                setTimeout(function() {
+                    pollMLForecast(pollUrl, forecastSteps, attempt + 1);
+                }, ML_FORECAST_POLL_INTERVAL_MS);
+            },
+            error: function(xhr) {
+                displayError(xhr.responseJSON?.error || 'Unknown error occurred');
+            }
+        });
+    }
+
     $('#runML').on('click', function() {
         const tpSamples = parseSamples($('#tpSamples').val());
         const forecastSteps = parseInt($('#forecastSteps').val());
@@ -540,8 +592,6 @@ $(document).ready(function() {
         showLoading();
         clearWalkForwardCharts();
         $('#walk-forward-results').hide();
-        clearWalkForwardCharts();
-        $('#walk-forward-results').hide();
 
         if (window.renderInputStats) {
             window.renderInputStats('#advanced-input-stats', null, { showLeadTime: false });
@@ -557,23 +607,13 @@ $(document).ready(function() {
                 model: 'ensemble',
                 startDate: startDate
             }),
-            success: function(data) {
-                hideLoading();
-                $('#results-container').show();
-                $('#ml-results').show();
-                $('#mc-results').hide();
-                $('#comparison-results').hide();
-
-                // Display results
-                displayRiskAssessment(data.risk_assessment);
-                displayModelPerformance(data.model_results);
-                $('#ml-chart').attr('src', data.charts.ml_forecast);
-                $('#history-chart').attr('src', data.charts.historical_analysis);
-                displayWalkForwardResults(data.walk_forward, forecastSteps);
-
-                if (window.renderInputStats) {
-                    window.renderInputStats('#advanced-input-stats', null, { showLeadTime: false });
+            success: function(data, textStatus, xhr) {
+                // 202: queued on the worker, poll until the forecast is ready
+                if (xhr.status === 202 && data.poll_url) {
+                    pollMLForecast(data.poll_url, forecastSteps);
+                    return;
                 }
+                renderMLForecast(data, forecastSteps);
             },
             error: function(xhr) {
                 displayError(xhr.responseJSON?.error || 'Unknown error occurred');
@@ -298,6 +298,56 @@ $(document).ready(function() {
         });
     });
 
+    const COD_TRAINING_POLL_INTERVAL_MS = 2000;
+
+    function finishCodTraining(button) {
+        button.prop('disabled', false).text('🛠️ Treinar modelo com meus dados');
+    }
+
+    function handleCodTrainingSuccess(message) {
+        const successMessage = message || 'Modelo treinado com sucesso.';
+        showSuccess(successMessage);
+        $('#codTrainingMessage').html('<div class="alert alert-success mt-2 mb-0">' + successMessage + '</div>');
+        loadCodDatasetStatus();
+
+        if ($('#model-info-panel').is(':visible')) {
+            loadCodModelInfo();
+        }
+    }
+
+    function handleCodTrainingError(errorMessage, retrainRequired) {
+        showError(errorMessage);
+        $('#codTrainingMessage').html('<div class="alert alert-danger mt-2 mb-0">' + errorMessage + '</div>');
+        if (retrainRequired) {
+            loadCodDatasetStatus();
+        }
+    }
+
+    function pollCodTraining(pollUrl, button) {
+        $.ajax({
+            url: pollUrl,
+            method: 'GET',
+            success: function(response) {
+                if (response.state === 'SUCCESS' || response.state === 'FAILURE') {
+                    if (response.error) {
+                        handleCodTrainingError(response.error, false);
+                    } else {
+                        handleCodTrainingSuccess(response.message);
+                    }
+                    finishCodTraining(button);
+                    return;
+                }
+                setTimeout(function() {
+                    pollCodTraining(pollUrl, button);
+                }, COD_TRAINING_POLL_INTERVAL_MS);
+            },
+            error: function(xhr) {
+                handleCodTrainingError(xhr.responseJSON?.error || 'Falha ao consultar o treinamento.', false);
+                finishCodTraining(button);
+            }
+        });
+    }
+
     $('#trainCodModel').on('click', function() {
         const button = $(this);
         if (button.prop('disabled')) {
@@ -310,25 +360,20 @@ $(document).ready(function() {
         $.ajax({
             url: '/api/cod/train',
             method: 'POST',
-            success: function(response) {
-                showSuccess(response.message || 'Modelo treinado com sucesso.');
-                $('#codTrainingMessage').html('<div class="alert alert-success mt-2 mb-0">' + (response.message || 'Modelo treinado com sucesso.') + '</div>');
-                loadCodDatasetStatus();
-
-                if ($('#model-info-panel').is(':visible')) {
-                    loadCodModelInfo();
+            success: function(response, textStatus, xhr) {
+                if (xhr.status === 202 && response.poll_url) {
+                    pollCodTraining(response.poll_url, button);
+                    return;
                 }
+                handleCodTrainingSuccess(response.message);
+                finishCodTraining(button);
             },
             error: function(xhr) {
-                const errorMessage = xhr.responseJSON?.error || 'Falha ao treinar o modelo.';
-                showError(errorMessage);
-                $('#codTrainingMessage').html('<div class="alert alert-danger mt-2 mb-0">' + errorMessage + '</div>');
-                if (xhr.responseJSON?.retrain_required) {
-                    loadCodDatasetStatus();
-                }
-            },
-            complete: function() {
-                button.prop('disabled', false).text('🛠️ Treinar modelo com meus dados');
+                handleCodTrainingError(
+                    xhr.responseJSON?.error || 'Falha ao treinar o modelo.',
+                    xhr.responseJSON?.retrain_required
+                );
+                finishCodTraining(button);
             }
         });
     });
@@ -2534,6 +2534,13 @@
                         </div>
                     </div>
                 </div>`;
+        } else if (response.ml_skipped_reason === 'infeasible') {
+            mlComparisonHtml = `
+                <div class="col-lg-12 mt-3">
+                    <div class="alert alert-warning mb-0 text-left" role="alert">
+                        Machine Learning comparison skipped: the Monte Carlo P85 is more than twice the time available before the deadline.
+                    </div>
+                </div>`;
         }
 
         let consensusHtml = '';
@@ -7,9 +7,13 @@ from .simulation_tasks import (
     run_ml_deadline_async,
     run_backtest_async
 )
+from .cod_tasks import train_cod_model_async
+from .ml_tasks import run_ml_forecast_async
 
 __all__ = [
     'run_monte_carlo_async',
     'run_ml_deadline_async',
-    'run_backtest_async'
+    'run_backtest_async',
+    'train_cod_model_async',
+    'run_ml_forecast_async'
 ]
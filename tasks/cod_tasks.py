@@ -0,0 +1,54 @@
+"""
+Celery Tasks for Cost of Delay model training
+Moves the hyperparameter search for user CoD models off the web workers
+"""
+import traceback
+from celery_app import celery_app
+from cod_training import train_user_cod_model
+from tasks.simulation_tasks import DatabaseTask
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name='tasks.train_cod_model_async',
+    max_retries=0
+)
+def train_cod_model_async(self, user_id: int, full_search: bool = False):
+    """
+    Train and persist a user's CoD model asynchronously
+
+    Args:
+        user_id (int): Owner of the training dataset
+        full_search (bool): Run the wider hyperparameter search
+
+    Returns:
+        dict: ``user_id`` plus either the ``model`` payload or an ``error``
+              message when training fails, so the status endpoint can check
+              ownership either way
+    """
+    self.update_state(
+        state='PROGRESS',
+        meta={
+            'user_id': user_id,
+            'stage': 'Training CoD model',
+            'progress': 10,
+            'total': 100,
+            'status': 'Running hyperparameter search...'
+        }
+    )
+
+    print(f"[CELERY] Starting CoD training task {self.request.id} for user {user_id}")
+
+    try:
+        _, _, model_payload = train_user_cod_model(self.session, user_id, full_search)
+    except (LookupError, ValueError) as exc:
+        # Bad or missing dataset: report to the client instead of failing the task
+        return {'user_id': user_id, 'error': str(exc)}
+    except Exception as exc:
+        print(f"[CELERY] Error in CoD training task {self.request.id}: {exc}")
+        print(traceback.format_exc())
+        return {'user_id': user_id, 'error': f'Falha ao treinar o modelo: {exc}'}
+
+    print(f"[CELERY] CoD training task {self.request.id} completed")
+    return {'user_id': user_id, 'model': model_payload}
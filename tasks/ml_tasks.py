@@ -0,0 +1,62 @@
+"""
+Celery Tasks for ML throughput forecasts
+Moves K-Fold CV training and walk-forward validation off the web workers
+"""
+import traceback
+from celery_app import celery_app
+from ml_forecast_job import run_ml_forecast
+from serialization import convert_to_native_types
+from tasks.simulation_tasks import DatabaseTask
+
+
+@celery_app.task(
+    bind=True,
+    base=DatabaseTask,
+    name='tasks.run_ml_forecast_async',
+    max_retries=0,
+    time_limit=600
+)
+def run_ml_forecast_async(self, data: dict, user_id: int = None):
+    """
+    Execute the ML throughput forecast asynchronously
+
+    Args:
+        data (dict): Forecast parameters including:
+            - tpSamples (list): Throughput samples
+            - forecastSteps (int): Periods to forecast
+            - model (str): Model name or 'ensemble'
+            - startDate (str): First sample date
+        user_id (int, optional): User who requested the forecast
+
+    Returns:
+        dict: ``user_id`` plus either the forecast ``result`` or an ``error``
+              message, so the status endpoint can check ownership either way
+    """
+    self.update_state(
+        state='PROGRESS',
+        meta={
+            'user_id': user_id,
+            'stage': 'Training ML models',
+            'progress': 10,
+            'total': 100,
+            'status': 'Running K-Fold CV and walk-forward validation...'
+        }
+    )
+
+    print(f"[CELERY] Starting ML forecast task {self.request.id}")
+
+    try:
+        result = run_ml_forecast(
+            data['tpSamples'],
+            forecast_steps=data.get('forecastSteps', 4),
+            model_name=data.get('model', 'ensemble'),
+            start_date=data.get('startDate')
+        )
+    except Exception as exc:
+        print(f"[CELERY] Error in ML forecast task {self.request.id}: {exc}")
+        print(traceback.format_exc())
+        return {'user_id': user_id, 'error': f'Falha na previsão com Machine Learning: {exc}'}
+
+    print(f"[CELERY] ML forecast task {self.request.id} completed")
+    # Celery's JSON serializer cannot encode the NumPy forecast arrays
+    return {'user_id': user_id, 'result': convert_to_native_types(result)}
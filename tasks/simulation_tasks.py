@@ -14,7 +14,7 @@ from monte_carlo_unified import (
 )
 from ml_deadline_forecaster import ml_analyze_deadline, ml_forecast_how_many, ml_forecast_when
 from backtesting import run_walk_forward_backtest, run_expanding_window_backtest
-from database import get_session
+from database import get_session, close_session
 from models import Forecast, Project
 
 
@@ -33,10 +33,16 @@ class DatabaseTask(Task):
         return self._session
 
     def after_return(self, *args, **kwargs):
-        """Close database session after task completes"""
+        """
+        Release the task's scoped session after it completes.
+
+        close_session() rolls back anything left uncommitted and drops the
+        session from the thread's registry, so the next task on this worker
+        thread starts from a clean session and pooled connection.
+        """
         if self._session is not None:
             try:
-                self._session.close()
+                close_session()
             except Exception as e:
                 print(f"[WARNING] Error closing session: {e}")
             finally:
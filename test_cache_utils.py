@@ -0,0 +1,27 @@
+"""Tests for the in-process TTL/LRU cache helper."""
+import time
+
+from cache_utils import TTLCache
+
+
+def test_ttl_cache_evicts_least_recently_used():
+    cache = TTLCache(maxsize=2)
+    cache.set('a', 1)
+    cache.set('b', 2)
+    assert cache.get('a') == 1  # 'a' becomes most recently used
+    cache.set('c', 3)
+
+    assert 'b' not in cache
+    assert cache.get('a') == 1
+    assert cache.get('c') == 3
+    assert len(cache) == 2
+
+
+def test_ttl_cache_expires_entries():
+    cache = TTLCache(maxsize=4, ttl=0.01)
+    cache.set('key', 'value')
+    assert cache.get('key') == 'value'
+
+    time.sleep(0.02)
+    assert cache.get('key') is None
+    assert cache.pop('key', 'missing') == 'missing'
@@ -93,6 +93,24 @@ def test_cod_prediction():
     print(f"  Weekly:  R$ {result['cod_weekly']:,.2f}")
     print(f"  Daily:   R$ {result['cod_daily']:,.2f}")
     print(f"  Monthly: R$ {result['cod_monthly']:,.2f}")
+
+    # Batch prediction must match one-by-one predictions
+    batch_projects = [test_project, dict(test_project, budget_millions=2.0, project_type='Web')]
+    batch = forecaster.predict_cod_batch(batch_projects)
+    assert len(batch) == 2, "Should return one prediction per project"
+    for project, batch_result in zip(batch_projects, batch):
+        single = forecaster.predict_cod(project)
+        assert abs(batch_result['cod_weekly'] - single['cod_weekly']) < 1e-6, "Batch should match single prediction"
+        assert abs(batch_result['cod_weekly_std'] - single['cod_weekly_std']) < 1e-6, "Batch should match ensemble spread"
+
+    # Mixed batch: risk_level defaults to complexity only where it is missing
+    no_risk = {k: v for k, v in test_project.items() if k != 'risk_level'}
+    mixed = forecaster.predict_cod_batch([test_project, no_risk])
+    assert len(mixed) == 2, "Should return one prediction per project"
+    for project, batch_result in zip([test_project, no_risk], mixed):
+        single = forecaster.predict_cod(project)
+        assert abs(batch_result['cod_weekly'] - single['cod_weekly']) < 1e-6, "Mixed batch should match single prediction"
+
     print(f"  95% CI:  R$ {result['confidence_interval_95'][0]:,.2f} - R$ {result['confidence_interval_95'][1]:,.2f}")
 
 
@@ -138,6 +156,10 @@ def test_feature_importance():
     assert len(importance_df) > 0, "Should have features"
     assert 'feature' in importance_df.columns, "Should have feature column"
     assert 'importance' in importance_df.columns, "Should have importance column"
+    assert forecaster.get_feature_importance() is importance_df, "Should reuse memoized frame"
+
+    forecaster.train_models(df)
+    assert forecaster.get_feature_importance() is not importance_df, "Retrain should invalidate cache"
 
     print("\n✓ Feature importance extracted successfully")
     print("\nTop 10 Most Important Features:")
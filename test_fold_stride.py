@@ -9,6 +9,7 @@ This script validates the new fold_stride parameter that allows:
 
 import numpy as np
 from backtesting import run_walk_forward_backtest, BacktestSummary
+from monte_carlo_unified import simulate_throughput_percentiles
 import sys
 
 
@@ -244,6 +245,22 @@ def test_comparison_with_standard():
     print("✅ TEST PASSED: fold_stride provides efficiency gains")
 
 
+def test_vectorized_percentiles_are_ordered():
+    """Test the vectorized per-fold simulation used by backtesting"""
+    print_section("TEST 6: Vectorized Monte Carlo Percentiles")
+
+    rng = np.random.Generator(np.random.PCG64(7))
+    stats = simulate_throughput_percentiles([5, 7, 3, 8, 6, 4, 9, 5, 6], 100, 5000, rng=rng)
+    print(f"Percentiles: {stats}")
+
+    values = [stats[key] for key in ('p10', 'p25', 'p50', 'p75', 'p85', 'p90', 'p95')]
+    assert values == sorted(values), "Percentiles must be non-decreasing"
+    # Mean throughput is ~6 items/week, so 100 items take roughly 17 weeks
+    assert 14 <= stats['p50'] <= 20, f"Unexpected median duration {stats['p50']}"
+
+    print("✅ TEST PASSED: Vectorized simulation produces sane percentiles")
+
+
 def main():
     """Run all tests"""
     print("\n" + "=" * 80)
@@ -259,6 +276,7 @@ def main():
         test_biweekly_stride()
         test_edge_cases()
         test_comparison_with_standard()
+        test_vectorized_percentiles_are_ordered()
 
         # Final summary
         print_section("ALL TESTS PASSED ✅")
@@ -31,6 +31,27 @@ def test_accuracy_metrics():
     print("\n✅ Accuracy metrics test passed!")
 
 
+def test_grouped_accuracy_metrics_match_per_group():
+    """Grouped metrics should match calculate_accuracy_metrics per group"""
+    from accuracy_metrics import calculate_accuracy_metrics, calculate_grouped_accuracy_metrics
+
+    forecasts = [10.0, 12.0, 8.0, 15.0, 11.0, 7.0, 5.0]
+    actuals = [9.5, 13.0, 8.5, 14.0, 10.0, 9.0, -1.0]
+    group_idx = [0, 0, 1, 1, 1, 2, 3]
+
+    grouped = calculate_grouped_accuracy_metrics(forecasts, actuals, group_idx, 4)
+
+    for group, (start, end) in enumerate([(0, 2), (2, 5)]):
+        expected = calculate_accuracy_metrics(forecasts[start:end], actuals[start:end])
+        assert abs(grouped[group]['mape'] - expected.mape) < 1e-9
+        assert abs(grouped[group]['rmse'] - expected.rmse) < 1e-9
+        assert abs(grouped[group]['accuracy_rate'] - expected.accuracy_rate) < 1e-9
+        assert grouped[group]['bias_direction'] == expected.bias_direction
+
+    assert grouped[2] is None  # single record
+    assert grouped[3] is None  # non-positive actual
+
+
 def test_data_quality_issues():
     """Test data quality issue detection"""
     from accuracy_metrics import detect_data_quality_issues
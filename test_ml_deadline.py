@@ -7,6 +7,7 @@ import sys
 sys.path.insert(0, '.')
 
 from ml_deadline_forecaster import (
+    deadline_simulation_count,
     ml_analyze_deadline,
     ml_forecast_how_many,
     ml_forecast_when
@@ -271,6 +272,16 @@ def test_ml_vs_monte_carlo_comparison():
     print()
 
 
+def test_deadline_simulation_count_scales_with_variation():
+    """Stable throughput needs fewer ML simulations than noisy throughput"""
+    stable = deadline_simulation_count([5, 5, 6, 5, 4, 5, 6, 5], 10000)
+    noisy = deadline_simulation_count([1, 9, 3, 12, 0, 5], 10000)
+
+    assert 200 <= stable < noisy <= 1000
+    assert deadline_simulation_count([5, 5, 5], 10000) == 200
+    assert deadline_simulation_count([1, 9, 3, 12, 0, 5], 150) == 150
+
+
 if __name__ == "__main__":
     print()
     print("╔" + "═"*78 + "╗")
@@ -3,7 +3,14 @@ import numpy as np
 
 os.environ.setdefault("MPLCONFIGDIR", "/tmp/mpl-cache")
 
-from app import convert_to_native_types
+from app import (
+    app,
+    coerce_to_float,
+    convert_to_native_types,
+    parse_number_list,
+    parse_team_focus,
+    simulation_input_error,
+)
 
 
 def test_convert_to_native_types_sanitizes_non_finite_values():
@@ -20,3 +27,75 @@ def test_convert_to_native_types_sanitizes_non_finite_values():
     assert converted["np_float"] is None
     assert converted["py_float"] is None
     assert converted["list"] == [None, 2.5, None]
+
+
+def test_convert_to_native_types_handles_array_dtypes():
+    payload = {
+        "matrix": np.array([[1.5, np.nan], [np.inf, 2.0]]),
+        "ints": np.arange(3, dtype=np.int64),
+        "flags": np.array([True, False]),
+        "objects": np.array([np.float64(np.nan), "x"], dtype=object),
+    }
+
+    converted = convert_to_native_types(payload)
+
+    assert converted["matrix"] == [[1.5, None], [None, 2.0]]
+    assert converted["ints"] == [0, 1, 2] and type(converted["ints"][0]) is int
+    assert converted["flags"] == [True, False] and type(converted["flags"][0]) is bool
+    assert converted["objects"] == [None, "x"]
+
+
+def test_convert_to_native_types_keeps_native_leaves():
+    payload = {"s": "x", "i": 3, "b": True, "n": None, "f": 1.5, "np_f": np.float64(2.5)}
+
+    converted = convert_to_native_types(payload)
+
+    assert converted == {"s": "x", "i": 3, "b": True, "n": None, "f": 1.5, "np_f": 2.5}
+    assert type(converted["np_f"]) is float
+
+
+def test_coerce_to_float_skips_invalid_candidates():
+    assert coerce_to_float(None, float("nan"), "abc", "2.5") == 2.5
+    assert coerce_to_float(float("inf"), 4) == 4.0
+    assert coerce_to_float(None, default=7) == 7.0
+
+
+def test_parse_number_list_falls_back_on_unreadable_text():
+    assert parse_number_list(" 5, 6.5 ,1e3") == [5.0, 6.5, 1000.0]
+    assert parse_number_list("5, ,6") is None
+    assert parse_number_list(" , ") is None
+    assert parse_number_list("5;6") is None
+    assert parse_number_list("abc") is None
+    assert parse_number_list("5,6,abc") is None
+    assert parse_number_list("5, 6, x") is None
+
+
+def test_parse_team_focus_clamps_and_defaults():
+    assert parse_team_focus(None) == 1.0
+    assert parse_team_focus("abc") == 1.0
+    assert parse_team_focus("0.75") == 0.75
+    assert parse_team_focus(1.5) == 1.0
+    assert parse_team_focus(-0.2) == 0.0
+
+
+def test_simulation_input_error_rejects_bad_counts():
+    assert simulation_input_error([5, 6], 1000, 10) is None
+    assert simulation_input_error([5, 6], 1000, 0) is None
+    for n_simulations in (0, -5, 2.5, 1000.0, True, None):
+        assert simulation_input_error([5, 6], n_simulations) == 'nSimulations must be a positive integer'
+    assert simulation_input_error([5, 6], 1000, -1) == 'Backlog must not be negative'
+
+
+def test_forecast_when_rejects_empty_backlog():
+    login_disabled = app.config.get("LOGIN_DISABLED")
+    app.config["LOGIN_DISABLED"] = True
+    try:
+        with app.test_client() as client:
+            response = client.post(
+                "/api/forecast-when",
+                json={"tpSamples": [5, 6, 7], "backlog": 0, "startDate": "01/01/2025"},
+            )
+    finally:
+        app.config["LOGIN_DISABLED"] = login_disabled
+    assert response.status_code == 400
+    assert response.get_json()["error"] == "Backlog must be greater than zero"
@@ -4,17 +4,23 @@ Generates charts and plots for forecasting results
 """
 
 import io
+import os
 import base64
+import threading
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
 import matplotlib
 matplotlib.use('Agg')  # Use non-interactive backend
 import matplotlib.pyplot as plt
+from matplotlib.figure import Figure
 from matplotlib.patches import FancyBboxPatch
 import seaborn as sns
 import pandas as pd
-from typing import Dict, List, Optional, Sequence
+from typing import Any, Dict, List, Optional, Sequence
 from datetime import datetime, timedelta
 
+from config import Config
+
 # Set style
 sns.set_style('whitegrid')
 plt.rcParams['figure.figsize'] = (12, 6)
@@ -40,6 +46,18 @@ class ForecastVisualizer:
             '️': '',  # variation selector
         }
 
+    @staticmethod
+    def _subplots(nrows: int = 1, ncols: int = 1, **fig_kw):
+        """
+        ``plt.subplots`` without pyplot's global figure registry.
+
+        Figures built this way belong only to the calling thread, so charts can
+        be rendered concurrently (see :func:`render_charts`), and need no
+        ``plt.close`` once encoded.
+        """
+        fig = Figure(**fig_kw)
+        return fig, fig.subplots(nrows, ncols)
+
     def _sanitize_text(self, text: str) -> str:
         """Replace unsupported glyphs (emoji/symbols) with ASCII-friendly markers."""
         if not isinstance(text, str):
@@ -65,7 +83,7 @@ class ForecastVisualizer:
         Returns:
             Base64 encoded image string
         """
-        fig, ax = plt.subplots(figsize=(14, 7))
+        fig, ax = self._subplots(figsize=(14, 7))
 
         # Prepare dates
         n_historical = len(historical_data)
@@ -118,9 +136,9 @@ class ForecastVisualizer:
         ax.grid(True, alpha=0.3)
 
         if use_dates:
-            plt.xticks(rotation=45, ha='right')
+            plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         return self._fig_to_base64(fig)
 
@@ -152,7 +170,7 @@ class ForecastVisualizer:
         if len(forecast_x) != len(mean):
             raise ValueError("Tamanho do horizonte previsto não corresponde ao conjunto de datas.")
 
-        fig, ax = plt.subplots(figsize=(14, 6))
+        fig, ax = self._subplots(figsize=(14, 6))
 
         ax.plot(hist_x, hist_y, color="#2E86AB", linewidth=2, label="Histórico", zorder=3)
         ax.plot(
@@ -203,8 +221,8 @@ class ForecastVisualizer:
         ax.set_xlabel("Data", fontsize=12, fontweight="bold")
         ax.legend(loc="best", framealpha=0.9)
         ax.grid(True, alpha=0.3)
-        plt.xticks(rotation=45, ha="right")
-        plt.tight_layout()
+        plt.setp(ax.get_xticklabels(), rotation=45, ha="right")
+        fig.tight_layout()
 
         return self._fig_to_base64(fig)
 
@@ -250,7 +268,7 @@ class ForecastVisualizer:
             paired = sorted(zip(indices, actuals, predictions), key=lambda x: x[0])
             sorted_indices, sorted_actuals, sorted_predictions = zip(*paired)
 
-            fig, ax = plt.subplots(figsize=(12, 6))
+            fig, ax = self._subplots(figsize=(12, 6))
 
             ax.plot(x_axis, historical_data, color='#2E86AB', linewidth=1.8,
                     alpha=0.6, label='Histórico completo')
@@ -274,9 +292,9 @@ class ForecastVisualizer:
             ax.grid(True, alpha=0.3)
 
             if use_dates:
-                plt.xticks(rotation=45, ha='right')
+                plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
 
-            plt.tight_layout()
+            fig.tight_layout()
             charts[model_name] = self._fig_to_base64(fig)
 
         return charts
@@ -295,7 +313,7 @@ class ForecastVisualizer:
         Returns:
             Base64 encoded image string
         """
-        fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(16, 6))
+        fig, (ax1, ax2) = self._subplots(1, 2, figsize=(16, 6))
 
         # Left plot: Completion time distribution
         completion_times = mc_results['completion_times']
@@ -342,7 +360,7 @@ class ForecastVisualizer:
         ax2.legend()
         ax2.grid(True, alpha=0.3)
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         return self._fig_to_base64(fig)
 
@@ -362,7 +380,7 @@ class ForecastVisualizer:
         Returns:
             Base64 encoded image string
         """
-        fig, ax = plt.subplots(figsize=(14, 7))
+        fig, ax = self._subplots(figsize=(14, 7))
 
         # Prepare x-axis
         n_hist = len(historical_data)
@@ -404,9 +422,9 @@ class ForecastVisualizer:
         ax.grid(True, alpha=0.3)
 
         if use_dates:
-            plt.xticks(rotation=45, ha='right')
+            plt.setp(ax.get_xticklabels(), rotation=45, ha='right')
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         return self._fig_to_base64(fig)
 
@@ -422,7 +440,7 @@ class ForecastVisualizer:
         Returns:
             Base64 encoded image string
         """
-        fig, ((ax1, ax2), (ax3, ax4)) = plt.subplots(2, 2, figsize=(16, 12))
+        fig, ((ax1, ax2), (ax3, ax4)) = self._subplots(2, 2, figsize=(16, 12))
 
         # 1. Time series plot
         if start_date:
@@ -489,7 +507,7 @@ class ForecastVisualizer:
             ax4.legend()
             ax4.grid(True, alpha=0.3, axis='y')
 
-        plt.tight_layout()
+        fig.tight_layout()
 
         return self._fig_to_base64(fig)
 
@@ -500,7 +518,6 @@ class ForecastVisualizer:
         fig.savefig(buffer, format='png', dpi=72, bbox_inches=None, pad_inches=0.1)
         buffer.seek(0)
         image_base64 = base64.b64encode(buffer.read()).decode('utf-8')
-        plt.close(fig)
         buffer.close()
         return f"data:image/png;base64,{image_base64}"
 
@@ -514,7 +531,7 @@ class ForecastVisualizer:
         Returns:
             Base64 encoded image string
         """
-        fig = plt.figure(figsize=(14, 9))
+        fig = Figure(figsize=(14, 9))
         gs = fig.add_gridspec(
             3,
             4,
@@ -844,3 +861,41 @@ try:
     import pandas as pd
 except ImportError:
     pd = None
+
+
+# The visualizer keeps no per-call state (each plot method builds and encodes
+# its own figure), so one instance is shared by every request and worker task
+FORECAST_VISUALIZER = ForecastVisualizer()
+
+_chart_pool: Optional[ThreadPoolExecutor] = None
+_chart_pool_lock = threading.Lock()
+
+
+def _get_chart_pool() -> Optional[ThreadPoolExecutor]:
+    """Create the shared chart threads on first use; ``None`` when disabled."""
+    global _chart_pool
+    threads = Config.CHART_RENDER_THREADS
+    if threads < 2 or (os.cpu_count() or 1) < 2:
+        return None
+    with _chart_pool_lock:
+        if _chart_pool is None:
+            _chart_pool = ThreadPoolExecutor(max_workers=threads, thread_name_prefix='chart')
+        return _chart_pool
+
+
+def render_charts(**jobs) -> Dict[str, Any]:
+    """
+    Render independent charts, concurrently when the chart pool is enabled.
+
+    Each keyword maps a result name to ``(plot_method, *args)``. Agg drawing and
+    PNG encoding release the GIL for part of their work, so the charts of one
+    response overlap on multi-core hosts; otherwise they run in order inline.
+
+    Returns:
+        Dict mapping each name to its plot method's return value
+    """
+    pool = _get_chart_pool()
+    if pool is None:
+        return {name: plot(*args) for name, (plot, *args) in jobs.items()}
+    futures = {name: pool.submit(plot, *args) for name, (plot, *args) in jobs.items()}
+    return {name: future.result() for name, future in futures.items()}